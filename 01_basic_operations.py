@@ -10,7 +10,9 @@ This script demonstrates the fundamental operations with Qdrant:
 5. Retrieving points
 """
 
-from qdrant_client import QdrantClient
+from qdrant_connection import create_client, describe_connection
+from payload_indexes import create_payload_indexes
+from write_pipeline import write_pipeline_from_env
 from qdrant_client.http import models
 import numpy as np
 
@@ -23,13 +25,9 @@ print("Step 1: Connecting to Qdrant server...")
 # Connect with API key authentication
 # Use the admin key for full access
 api_key = "my-secure-admin-key-123"  # Admin key with full access
-client = QdrantClient(
-    host="localhost", 
-    port=6333, 
-    api_key=api_key,
-    https=False  # Explicitly use HTTP instead of HTTPS
-)
-print("Connected successfully with admin API key authentication!\n")
+# Set QDRANT_PREFER_GRPC=1 to use the gRPC interface on port 6334 instead of REST
+client = create_client(api_key=api_key)
+print(f"Connected successfully to {describe_connection(api_key)} with admin API key authentication!\n")
 
 # Step 2: Create a collection
 print("Step 2: Creating a collection...")
@@ -56,6 +54,14 @@ client.create_collection(
 )
 print(f"Collection '{collection_name}' created successfully!\n")
 
+# Index the "category" field used by the filtered search in step 5
+create_payload_indexes(client, collection_name, {"category": models.PayloadSchemaType.KEYWORD})
+
+# Writes go through a pipeline. Set QDRANT_WRITE_MODE=async to send them
+# without waiting (QDRANT_WRITE_ORDERING picks weak, medium or strong ordering)
+# and only wait at explicit flush() barriers.
+writes = write_pipeline_from_env(client, collection_name)
+
 # Step 3: Add vectors to the collection
 print("Step 3: Adding vectors to the collection...")
 
@@ -98,10 +104,10 @@ points = [
 ]
 
 # Insert points into the collection
-client.upsert(
-    collection_name=collection_name,
-    points=points
-)
+writes.upsert(points)
+
+# Barrier: the searches below must see every point
+writes.flush()
 
 print(f"Added {len(vectors)} vectors to the collection.\n")
 
@@ -8,229 +8,408 @@ This script demonstrates how to use Qdrant for semantic search with text embeddi
 3. Performing semantic search to find relevant documents
 """
 
-from qdrant_client import QdrantClient
+from qdrant_connection import create_client, describe_connection
 from qdrant_client.http import models
-from sentence_transformers import SentenceTransformer
+from query_cache import QueryEmbeddingCache
+from embeddings import encode_corpus, load_model
+from dimension_reduction import apply_projection, embedding_key
+from hybrid_search import BM25Vectorizer, hybrid_batch_search, hybrid_search, hybrid_vectors, sparse_vectors_config
+from quantization import quantization_config, quantization_mode, search_params, vector_params
+from incremental_sync import HASH_FIELD, content_hash, ensure_collection, sync_collection, with_content_hash
+from ingest_pipeline import ingest, read_records
+from payload_indexes import create_payload_indexes
+from reranking import reranker_from_env
+from payload_projection import SUMMARY_FIELD, payload_selector, result_summary, summarize, summary_enabled
+import os
 import time
 
-print("Qdrant Semantic Search Tutorial")
-print("===============================\n")
-
-# Step 1: Connect to Qdrant
-print("Step 1: Connecting to Qdrant server...")
-client = QdrantClient(host="localhost", port=6333)
-print("Connected successfully!\n")
-
-# Step 2: Load the embedding model
-print("Step 2: Loading embedding model...")
-model = SentenceTransformer('all-MiniLM-L6-v2')  # A small but effective model
-vector_size = model.get_sentence_embedding_dimension()
-print(f"Loaded model with vector size: {vector_size}\n")
-
-# Step 3: Create a collection for documents
-print("Step 3: Creating a collection for documents...")
-collection_name = "documents"
-
-# Check if collection exists and recreate it
-collections = client.get_collections()
-collection_names = [collection.name for collection in collections.collections]
-
-if collection_name in collection_names:
-    print(f"Collection '{collection_name}' already exists. Recreating it...")
-    client.delete_collection(collection_name=collection_name)
-
-# Create the collection with specified parameters
-client.create_collection(
-    collection_name=collection_name,
-    vectors_config=models.VectorParams(
-        size=vector_size,
-        distance=models.Distance.COSINE
+
+def main():
+    # Everything runs inside main(): encode_corpus may start "spawn" worker
+    # processes, which re-import this module and must not re-run the tutorial
+    print("Qdrant Semantic Search Tutorial")
+    print("===============================\n")
+
+    # Step 1: Connect to Qdrant
+    print("Step 1: Connecting to Qdrant server...")
+    # Set QDRANT_PREFER_GRPC=1 to use the gRPC interface on port 6334 instead of REST
+    client = create_client()
+    print(f"Connected successfully to {describe_connection()}!\n")
+
+    # "recreate" drops and rebuilds the collection on every run,
+    # "incremental" only re-indexes documents whose content changed
+    sync_mode = os.environ.get("QDRANT_SYNC_MODE", "recreate")
+
+    # Step 2: Load the embedding model
+    print("Step 2: Loading embedding model...")
+    # Set QDRANT_EMBEDDER=onnx for the ONNX Runtime CPU backend,
+    # or QDRANT_EMBEDDER=hashing for a deterministic offline embedder
+    model = load_model('all-MiniLM-L6-v2')  # A small but effective model
+
+    # Set QDRANT_PROJECTION=truncate or pca (and QDRANT_PROJECTION_DIM) to store
+    # shorter vectors; documents and queries then go through the same projection
+    model = apply_projection(model, "documents")
+    vector_size = model.get_sentence_embedding_dimension()
+
+    # Identifies the model, backend and projection the vectors come from; it is
+    # part of the query cache keys and of the content hashes, so switching any
+    # of them re-embeds the documents on the next incremental sync
+    vectors_key = embedding_key("all-MiniLM-L6-v2", model)
+
+    # Cache query embeddings so repeated queries skip the model.
+    # Set QDRANT_QUERY_CACHE to a file path to keep the cache across runs.
+    query_cache = QueryEmbeddingCache(
+        model,
+        model_name=vectors_key,
+        cache_path=os.environ.get("QDRANT_QUERY_CACHE")
+    )
+    # Sparse BM25 term weights are stored next to the dense embeddings, so exact
+    # keywords like "Qdrant" or "NLP" also rank well (hybrid search)
+    vectorizer = BM25Vectorizer()
+
+    # Set QDRANT_RERANK=1 to re-order the top results of step 6 with a cross-encoder
+    # (QDRANT_RERANK_SCORER=token-overlap uses a dependency-free scorer instead)
+    reranker = reranker_from_env()
+    print(f"Loaded model with vector size: {vector_size}\n")
+
+    # Step 3: Create a collection for documents
+    print("Step 3: Creating a collection for documents...")
+    collection_name = "documents"
+
+    if sync_mode == "incremental":
+        # Keep the existing collection and its points; step 5 only uploads changes
+        if ensure_collection(
+            client,
+            collection_name,
+            vector_size,
+            quantization_config=quantization_config(),
+            on_disk=quantization_mode() != "none",
+            sparse_vectors_config=sparse_vectors_config()
+        ):
+            print(f"Collection '{collection_name}' created successfully!\n")
+        else:
+            print(f"Collection '{collection_name}' already exists. Syncing it incrementally.\n")
+    else:
+        # Check if collection exists and recreate it
+        collections = client.get_collections()
+        collection_names = [collection.name for collection in collections.collections]
+
+        if collection_name in collection_names:
+            print(f"Collection '{collection_name}' already exists. Recreating it...")
+            client.delete_collection(collection_name=collection_name)
+
+        # Create the collection with specified parameters
+        # (set QDRANT_QUANTIZATION=scalar or binary to store compact quantized vectors),
+        # plus a named sparse vector whose IDF weighting is computed by the server
+        client.create_collection(
+            collection_name=collection_name,
+            vectors_config=vector_params(vector_size),
+            sparse_vectors_config=sparse_vectors_config(),
+            quantization_config=quantization_config()
+        )
+        print(f"Collection '{collection_name}' created successfully!\n")
+
+    # Index the payload fields used by the filtered searches in steps 7 and 8
+    create_payload_indexes(client, collection_name, {
+        "category": models.PayloadSchemaType.KEYWORD,
+        "tags": models.PayloadSchemaType.KEYWORD
+    })
+    print("Payload indexes ready on category and tags.\n")
+
+    # Oversampling and rescoring used by every search on quantized vectors
+    # (set QDRANT_OVERSAMPLING and QDRANT_RESCORE to tune them; None when quantization is off)
+    query_params = search_params()
+
+    # Step 4: Prepare sample documents
+    print("Step 4: Preparing sample documents...")
+    documents = [
+        {
+            "id": 1,
+            "title": "What is a Vector Database?",
+            "content": "A vector database is a type of database that stores data as high-dimensional vectors and provides efficient similarity search capabilities.",
+            "category": "Database Technology",
+            "tags": ["vectors", "database", "similarity search"]
+        },
+        {
+            "id": 2,
+            "title": "Introduction to Qdrant",
+            "content": "Qdrant is a vector similarity search engine and vector database. It provides a production-ready service with a convenient API to store, search, and manage points - vectors with an optional payload.",
+            "category": "Database Technology",
+            "tags": ["Qdrant", "vector database", "similarity search"]
+        },
+        {
+            "id": 3,
+            "title": "Machine Learning Basics",
+            "content": "Machine learning is a branch of artificial intelligence that focuses on building systems that learn from data, identify patterns, and make decisions with minimal human intervention.",
+            "category": "Artificial Intelligence",
+            "tags": ["machine learning", "AI", "data science"]
+        },
+        {
+            "id": 4,
+            "title": "Natural Language Processing",
+            "content": "Natural Language Processing (NLP) is a field of AI that gives machines the ability to read, understand, and derive meaning from human languages.",
+            "category": "Artificial Intelligence",
+            "tags": ["NLP", "AI", "language"]
+        },
+        {
+            "id": 5,
+            "title": "Vector Embeddings Explained",
+            "content": "Vector embeddings are numerical representations of objects like words, sentences, or images. They capture semantic meaning in a way that similar items have similar vector representations.",
+            "category": "Machine Learning",
+            "tags": ["embeddings", "vectors", "representation learning"]
+        },
+        {
+            "id": 6,
+            "title": "Semantic Search Systems",
+            "content": "Semantic search systems understand the intent and contextual meaning of search queries rather than just matching keywords, providing more relevant results to users.",
+            "category": "Search Technology",
+            "tags": ["semantic search", "NLP", "information retrieval"]
+        },
+        {
+            "id": 7,
+            "title": "Python Programming Language",
+            "content": "Python is a high-level, interpreted programming language known for its readability and versatility. It's widely used in data science, machine learning, web development, and more.",
+            "category": "Programming",
+            "tags": ["Python", "programming", "coding"]
+        },
+        {
+            "id": 8,
+            "title": "Data Structures and Algorithms",
+            "content": "Data structures are ways of organizing and storing data, while algorithms are step-by-step procedures for solving problems or performing computations.",
+            "category": "Computer Science",
+            "tags": ["algorithms", "data structures", "computer science"]
+        }
+    ]
+
+    # Set QDRANT_DOCUMENTS to a JSONL, CSV or Parquet file with the same fields
+    # to stream a larger corpus instead of the samples above
+    documents_path = os.environ.get("QDRANT_DOCUMENTS")
+    if documents_path:
+        documents = read_records(documents_path)
+        print(f"Streaming documents from {documents_path}.\n")
+    else:
+        print(f"Prepared {len(documents)} sample documents.\n")
+
+
+    def document_text(doc):
+        """Text that is embedded for a document."""
+        return f"{doc['title']}. {doc['content']}"
+
+
+    def document_sparse_vector(doc):
+        """BM25 sparse vector stored alongside a document's dense vector."""
+        return vectorizer.encode_document(document_text(doc))
+
+
+    def document_payload(doc):
+        """Payload stored alongside a document's vector."""
+        payload = {
+            "title": doc["title"],
+            "content": doc["content"],
+            "category": doc["category"],
+            "tags": doc["tags"]
+        }
+        if summary_enabled():
+            # A short preview, so result lists don't need the full content
+            payload[SUMMARY_FIELD] = summarize(doc["content"])
+        return payload
+
+
+    # Fields the result lists below print; the full content is only fetched
+    # when summaries are disabled (QDRANT_SUMMARY=0)
+    result_payload = payload_selector(
+        include=["title", "category", "tags", SUMMARY_FIELD if summary_enabled() else "content"]
     )
-)
-print(f"Collection '{collection_name}' created successfully!\n")
-
-# Step 4: Prepare sample documents
-print("Step 4: Preparing sample documents...")
-documents = [
-    {
-        "id": 1,
-        "title": "What is a Vector Database?",
-        "content": "A vector database is a type of database that stores data as high-dimensional vectors and provides efficient similarity search capabilities.",
-        "category": "Database Technology",
-        "tags": ["vectors", "database", "similarity search"]
-    },
-    {
-        "id": 2,
-        "title": "Introduction to Qdrant",
-        "content": "Qdrant is a vector similarity search engine and vector database. It provides a production-ready service with a convenient API to store, search, and manage points - vectors with an optional payload.",
-        "category": "Database Technology",
-        "tags": ["Qdrant", "vector database", "similarity search"]
-    },
-    {
-        "id": 3,
-        "title": "Machine Learning Basics",
-        "content": "Machine learning is a branch of artificial intelligence that focuses on building systems that learn from data, identify patterns, and make decisions with minimal human intervention.",
-        "category": "Artificial Intelligence",
-        "tags": ["machine learning", "AI", "data science"]
-    },
-    {
-        "id": 4,
-        "title": "Natural Language Processing",
-        "content": "Natural Language Processing (NLP) is a field of AI that gives machines the ability to read, understand, and derive meaning from human languages.",
-        "category": "Artificial Intelligence",
-        "tags": ["NLP", "AI", "language"]
-    },
-    {
-        "id": 5,
-        "title": "Vector Embeddings Explained",
-        "content": "Vector embeddings are numerical representations of objects like words, sentences, or images. They capture semantic meaning in a way that similar items have similar vector representations.",
-        "category": "Machine Learning",
-        "tags": ["embeddings", "vectors", "representation learning"]
-    },
-    {
-        "id": 6,
-        "title": "Semantic Search Systems",
-        "content": "Semantic search systems understand the intent and contextual meaning of search queries rather than just matching keywords, providing more relevant results to users.",
-        "category": "Search Technology",
-        "tags": ["semantic search", "NLP", "information retrieval"]
-    },
-    {
-        "id": 7,
-        "title": "Python Programming Language",
-        "content": "Python is a high-level, interpreted programming language known for its readability and versatility. It's widely used in data science, machine learning, web development, and more.",
-        "category": "Programming",
-        "tags": ["Python", "programming", "coding"]
-    },
-    {
-        "id": 8,
-        "title": "Data Structures and Algorithms",
-        "content": "Data structures are ways of organizing and storing data, while algorithms are step-by-step procedures for solving problems or performing computations.",
-        "category": "Computer Science",
-        "tags": ["algorithms", "data structures", "computer science"]
-    }
-]
-
-print(f"Prepared {len(documents)} sample documents.\n")
-
-# Step 5: Convert documents to vectors and upload to Qdrant
-print("Step 5: Converting documents to vectors and uploading to Qdrant...")
-points = []
-
-for doc in documents:
-    # Generate embedding from document content
-    content_text = f"{doc['title']}. {doc['content']}"
-    vector = model.encode(content_text)
-    
-    # Create payload with document metadata
-    payload = {
-        "title": doc["title"],
-        "content": doc["content"],
-        "category": doc["category"],
-        "tags": doc["tags"]
-    }
-    
-    # Create point
-    point = models.PointStruct(
-        id=doc["id"],
-        vector=vector.tolist(),
-        payload=payload
+    # The re-ranker scores the full document text, so its candidates need the content
+    candidate_payload = payload_selector(
+        include=["title", "category", "tags", SUMMARY_FIELD, "content"]
+    ) if reranker else result_payload
+
+
+    # Step 5: Convert documents to vectors and upload to Qdrant
+    print("Step 5: Converting documents to vectors and uploading to Qdrant...")
+
+    if sync_mode == "incremental":
+        # Only new or changed documents are re-encoded; removed ones are deleted
+        sync_stats = sync_collection(
+            client,
+            collection_name,
+            model,
+            documents,
+            text_fn=document_text,
+            payload_fn=document_payload,
+            sparse_fn=document_sparse_vector,
+            embedding_key=vectors_key
+        )
+        print(f"Synced documents: {sync_stats['upserted']} upserted, "
+              f"{sync_stats['unchanged']} unchanged, {sync_stats['deleted']} deleted.\n")
+    elif documents_path:
+        # Read, embed and upload overlap in separate stages with bounded queues.
+        # The collection was just recreated, so there is nothing to resume from:
+        # resumable loads into an existing collection use `python ingest_pipeline.py`
+        ingest_stats = ingest(
+            client,
+            collection_name,
+            documents,
+            model,
+            text_fn=document_text,
+            payload_fn=lambda doc: with_content_hash(document_payload(doc), vectors_key),
+            sparse_fn=document_sparse_vector
+        )
+        print(f"Uploaded {ingest_stats['points']} document vectors to Qdrant "
+              f"({ingest_stats['points_per_second']:.0f} points/sec).\n")
+    else:
+        # Generate embeddings for all documents in large batches instead of one call per document
+        vectors = encode_corpus(model, [document_text(doc) for doc in documents], batch_size=64)
+
+        points = []
+
+        for doc, vector in zip(documents, vectors):
+            # Create payload with document metadata and its content hash,
+            # so a later incremental run can skip unchanged documents
+            payload = document_payload(doc)
+            payload[HASH_FIELD] = content_hash(payload, vectors_key)
+
+            # Create point with its dense and sparse vectors
+            point = models.PointStruct(
+                id=doc["id"],
+                vector=hybrid_vectors(vector, document_sparse_vector(doc)),
+                payload=payload
+            )
+
+            points.append(point)
+
+        # Upload all points to Qdrant
+        client.upsert(
+            collection_name=collection_name,
+            points=points
+        )
+
+        print(f"Uploaded {len(points)} document vectors to Qdrant.\n")
+
+    # Step 6: Perform semantic search
+    print("Step 6: Performing semantic search...")
+
+    # Define search queries
+    search_queries = [
+        "What is Qdrant?",
+        "How do vector databases work?",
+        "Tell me about artificial intelligence",
+        "Python programming examples"
+    ]
+
+    # With re-ranking enabled, fetch more candidates than we show
+    top_k = 3  # Return top 3 matches
+    fetch_limit = reranker.candidates if reranker else top_k
+
+    # Embed all queries in one model call and send all searches in one request;
+    # each search runs a dense and a sparse retriever, fused with reciprocal rank fusion
+    all_results = hybrid_batch_search(
+        client,
+        collection_name,
+        query_cache,
+        vectorizer,
+        [{"text": query, "limit": fetch_limit} for query in search_queries],
+        with_payload=candidate_payload,
+        search_params=query_params
     )
-    
-    points.append(point)
-
-# Upload all points to Qdrant
-client.upsert(
-    collection_name=collection_name,
-    points=points
-)
-
-print(f"Uploaded {len(points)} document vectors to Qdrant.\n")
-
-# Step 6: Perform semantic search
-print("Step 6: Performing semantic search...")
-
-# Define search queries
-search_queries = [
-    "What is Qdrant?",
-    "How do vector databases work?",
-    "Tell me about artificial intelligence",
-    "Python programming examples"
-]
-
-# Perform search for each query
-for query in search_queries:
-    print(f"\nQuery: '{query}'")
-    
-    # Convert query to vector
-    query_vector = model.encode(query)
-    
-    # Search in Qdrant
-    search_results = client.search(
-        collection_name=collection_name,
-        query_vector=query_vector,
-        limit=3  # Return top 3 matches
+
+    score_kind = "Score"
+    if reranker:
+        # One batched cross-encoder call re-scores every candidate of every query
+        skipped_before = reranker.stats()["skipped"]
+        all_results = reranker.rerank_many(
+            search_queries,
+            all_results,
+            text_fn=lambda result: f"{result.payload['title']}. {result.payload['content']}",
+            top_k=top_k
+        )
+        # A call skipped by the latency budget keeps the retrieval scores, on another scale
+        skipped = reranker.stats()["skipped"] > skipped_before
+        score_kind = "Retrieval score" if skipped else "Re-ranker score"
+
+    for query, search_results in zip(search_queries, all_results):
+        print(f"\nQuery: '{query}'")
+
+        # Display results
+        print("Results:")
+        for i, result in enumerate(search_results, 1):
+            print(f"  {i}. {result.payload['title']} ({score_kind}: {result.score:.4f})")
+            print(f"     Category: {result.payload['category']}")
+            print(f"     Tags: {', '.join(result.payload['tags'])}")
+            print(f"     Summary: {result_summary(result.payload)}")
+
+    # Step 7: Search with category filtering
+    print("\nStep 7: Search with category filtering...")
+    query = "vector technology"
+    query_vector = query_cache.encode(query)
+
+    # Search only in the "Database Technology" category
+    filtered_results = hybrid_search(
+        client,
+        collection_name,
+        query_vector,
+        vectorizer.encode_query(query),
+        search_params=query_params,
+        with_payload=result_payload,
+        query_filter=models.Filter(
+            must=[
+                models.FieldCondition(
+                    key="category",
+                    match=models.MatchValue(value="Database Technology")
+                )
+            ]
+        ),
+        limit=2
     )
-    
-    # Display results
+
+    print(f"\nQuery: '{query}' (filtered to 'Database Technology' category)")
     print("Results:")
-    for i, result in enumerate(search_results, 1):
+    for i, result in enumerate(filtered_results, 1):
         print(f"  {i}. {result.payload['title']} (Score: {result.score:.4f})")
         print(f"     Category: {result.payload['category']}")
+        print(f"     Summary: {result_summary(result.payload)}")
+
+    # Step 8: Search with tag filtering
+    print("\nStep 8: Search with tag filtering...")
+    query = "artificial intelligence"
+    query_vector = query_cache.encode(query)
+
+    # Search for documents with the "NLP" tag
+    tag_filtered_results = hybrid_search(
+        client,
+        collection_name,
+        query_vector,
+        vectorizer.encode_query(query),
+        search_params=query_params,
+        with_payload=result_payload,
+        query_filter=models.Filter(
+            must=[
+                models.FieldCondition(
+                    key="tags",
+                    match=models.MatchValue(value="NLP")
+                )
+            ]
+        ),
+        limit=2
+    )
+
+    print(f"\nQuery: '{query}' (filtered to documents with 'NLP' tag)")
+    print("Results:")
+    for i, result in enumerate(tag_filtered_results, 1):
+        print(f"  {i}. {result.payload['title']} (Score: {result.score:.4f})")
         print(f"     Tags: {', '.join(result.payload['tags'])}")
-        print(f"     Summary: {result.payload['content'][:100]}...")
-
-# Step 7: Search with category filtering
-print("\nStep 7: Search with category filtering...")
-query = "vector technology"
-query_vector = model.encode(query)
-
-# Search only in the "Database Technology" category
-filtered_results = client.search(
-    collection_name=collection_name,
-    query_vector=query_vector,
-    query_filter=models.Filter(
-        must=[
-            models.FieldCondition(
-                key="category",
-                match=models.MatchValue(value="Database Technology")
-            )
-        ]
-    ),
-    limit=2
-)
-
-print(f"\nQuery: '{query}' (filtered to 'Database Technology' category)")
-print("Results:")
-for i, result in enumerate(filtered_results, 1):
-    print(f"  {i}. {result.payload['title']} (Score: {result.score:.4f})")
-    print(f"     Category: {result.payload['category']}")
-    print(f"     Summary: {result.payload['content'][:100]}...")
-
-# Step 8: Search with tag filtering
-print("\nStep 8: Search with tag filtering...")
-query = "artificial intelligence"
-query_vector = model.encode(query)
-
-# Search for documents with the "NLP" tag
-tag_filtered_results = client.search(
-    collection_name=collection_name,
-    query_vector=query_vector,
-    query_filter=models.Filter(
-        must=[
-            models.FieldCondition(
-                key="tags",
-                match=models.MatchValue(value="NLP")
-            )
-        ]
-    ),
-    limit=2
-)
-
-print(f"\nQuery: '{query}' (filtered to documents with 'NLP' tag)")
-print("Results:")
-for i, result in enumerate(tag_filtered_results, 1):
-    print(f"  {i}. {result.payload['title']} (Score: {result.score:.4f})")
-    print(f"     Tags: {', '.join(result.payload['tags'])}")
-    print(f"     Summary: {result.payload['content'][:100]}...")
-
-print("\nSemantic search tutorial completed successfully!")
+        print(f"     Summary: {result_summary(result.payload)}")
+
+    query_cache.flush()
+    cache_stats = query_cache.stats()
+    print(f"\nQuery cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
+    if reranker:
+        rerank_stats = reranker.stats()
+        print(f"Re-ranker: {rerank_stats['misses']} pairs scored, {rerank_stats['hits']} cached, "
+              f"{rerank_stats['skipped']} calls skipped by the latency budget")
+    print("\nSemantic search tutorial completed successfully!")
+
+
+if __name__ == "__main__":
+    main()
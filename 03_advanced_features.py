@@ -11,362 +11,486 @@ This script demonstrates more advanced operations with Qdrant:
 6. Deleting points
 """
 
-from qdrant_client import QdrantClient
+from qdrant_connection import create_client, describe_connection
 from qdrant_client.http import models
-from sentence_transformers import SentenceTransformer
+from embeddings import load_model
+from dimension_reduction import embedding_key
+from query_cache import QueryEmbeddingCache
+from parallel_upload import upload_points
+from quantization import quantization_config, search_params
+from search_pagination import search_page
+from scroll_points import scroll_pages
+from incremental_sync import HASH_FIELD, content_hash, ensure_collection, sync_collection
+from payload_indexes import create_payload_indexes
+from bulk_delete import delete_by_filter
+from write_pipeline import write_pipeline_from_env
+from named_vectors import encode_named, named_vectors_config, vector_weights, weighted_search
+import os
 import time
 
-print("Qdrant Advanced Features Tutorial")
-print("=================================\n")
-
-# Step 1: Connect to Qdrant
-print("Step 1: Connecting to Qdrant server...")
-client = QdrantClient(host="localhost", port=6333)
-print("Connected successfully!\n")
-
-# Step 2: Load embedding model
-print("Step 2: Loading embedding model...")
-model = SentenceTransformer('all-MiniLM-L6-v2')
-vector_size = model.get_sentence_embedding_dimension()
-print(f"Loaded model with vector size: {vector_size}\n")
-
-# Step 3: Create a new collection for this tutorial
-print("Step 3: Creating a collection...")
-collection_name = "articles"
-
-# Check if collection exists and recreate it
-collections = client.get_collections()
-collection_names = [collection.name for collection in collections.collections]
-
-if collection_name in collection_names:
-    print(f"Collection '{collection_name}' already exists. Recreating it...")
-    client.delete_collection(collection_name=collection_name)
-
-# Create the collection
-client.create_collection(
-    collection_name=collection_name,
-    vectors_config=models.VectorParams(
-        size=vector_size,
-        distance=models.Distance.COSINE,
-    )
-)
-print(f"Collection '{collection_name}' created successfully!\n")
-
-# Step 4: Prepare sample articles data
-print("Step 4: Preparing sample data...")
-articles = [
-    {
-        "id": 101,
-        "title": "Introduction to Machine Learning",
-        "content": "Machine learning is a branch of artificial intelligence that focuses on building systems that learn from data.",
-        "author": "Jane Smith",
-        "date": "2023-01-15",
-        "tags": ["AI", "ML", "technology"],
-        "read_time": 5,
-        "popularity": 0.85
-    },
-    {
-        "id": 102,
-        "title": "Deep Learning Fundamentals",
-        "content": "Deep learning is a subset of machine learning that uses neural networks with many layers.",
-        "author": "John Doe",
-        "date": "2023-02-20",
-        "tags": ["AI", "deep learning", "neural networks"],
-        "read_time": 8,
-        "popularity": 0.92
-    },
-    {
-        "id": 103,
-        "title": "Python for Data Science",
-        "content": "Python has become the most popular programming language for data science due to its simplicity and powerful libraries.",
-        "author": "Jane Smith",
-        "date": "2023-03-10",
-        "tags": ["Python", "data science", "programming"],
-        "read_time": 6,
-        "popularity": 0.78
-    },
-    {
-        "id": 104,
-        "title": "Natural Language Processing Techniques",
-        "content": "NLP combines linguistics, computer science, and AI to help computers understand human language.",
-        "author": "Mike Johnson",
-        "date": "2023-04-05",
-        "tags": ["NLP", "AI", "linguistics"],
-        "read_time": 10,
-        "popularity": 0.81
-    },
-    {
-        "id": 105,
-        "title": "Introduction to Vector Databases",
-        "content": "Vector databases are specialized systems designed to store and query high-dimensional vectors efficiently.",
-        "author": "Sarah Williams",
-        "date": "2023-05-12",
-        "tags": ["databases", "vectors", "similarity search"],
-        "read_time": 7,
-        "popularity": 0.75
-    },
-    {
-        "id": 106,
-        "title": "Qdrant: A Modern Vector Database",
-        "content": "Qdrant is a vector similarity search engine that provides a production-ready service with a convenient API.",
-        "author": "Alex Brown",
-        "date": "2023-06-18",
-        "tags": ["Qdrant", "vectors", "similarity search"],
-        "read_time": 9,
-        "popularity": 0.88
-    },
-    {
-        "id": 107,
-        "title": "Building Recommendation Systems",
-        "content": "Recommendation systems use collaborative filtering and content-based methods to suggest items to users.",
-        "author": "John Doe",
-        "date": "2023-07-22",
-        "tags": ["recommendations", "ML", "collaborative filtering"],
-        "read_time": 12,
-        "popularity": 0.91
-    },
-    {
-        "id": 108,
-        "title": "Data Visualization Best Practices",
-        "content": "Effective data visualization makes complex data more accessible, understandable, and usable.",
-        "author": "Lisa Chen",
-        "date": "2023-08-30",
-        "tags": ["visualization", "data", "design"],
-        "read_time": 6,
-        "popularity": 0.79
-    }
-]
-
-print(f"Prepared {len(articles)} sample articles.\n")
-
-# Step 5: Batch upload vectors
-print("Step 5: Preparing batch upload...")
-points = []
-
-for article in articles:
-    # Generate embedding vector for article content
-    content_text = f"{article['title']}. {article['content']}"
-    vector = model.encode(content_text)
-    
-    # Prepare payload
-    payload = {
-        "title": article["title"],
-        "content": article["content"],
-        "author": article["author"],
-        "date": article["date"],
-        "tags": article["tags"],
-        "read_time": article["read_time"],
-        "popularity": article["popularity"]
-    }
-    
-    # Create point
-    point = models.PointStruct(
-        id=article["id"],
-        vector=vector.tolist(),
-        payload=payload
+
+def main():
+    # Everything runs inside main(): encode_corpus may start "spawn" worker
+    # processes, which re-import this module and must not re-run the tutorial
+    print("Qdrant Advanced Features Tutorial")
+    print("=================================\n")
+
+    # Step 1: Connect to Qdrant
+    print("Step 1: Connecting to Qdrant server...")
+    # Set QDRANT_PREFER_GRPC=1 to use the gRPC interface on port 6334 instead of REST
+    client = create_client()
+    print(f"Connected successfully to {describe_connection()}!\n")
+
+    # "recreate" drops and rebuilds the collection on every run,
+    # "incremental" only re-indexes articles whose content changed
+    sync_mode = os.environ.get("QDRANT_SYNC_MODE", "recreate")
+
+    # Step 2: Load embedding model
+    print("Step 2: Loading embedding model...")
+    # Set QDRANT_EMBEDDER=onnx for the ONNX Runtime CPU backend,
+    # or QDRANT_EMBEDDER=hashing for a deterministic offline embedder
+    model = load_model('all-MiniLM-L6-v2')
+    vector_size = model.get_sentence_embedding_dimension()
+
+    # Identifies the model and backend the vectors come from; it is part of the
+    # query cache keys and of the content hashes, so switching either re-embeds
+    # the articles on the next incremental sync
+    vectors_key = embedding_key("all-MiniLM-L6-v2", model)
+
+    # Cache query embeddings so repeated queries skip the model.
+    # Set QDRANT_QUERY_CACHE to a file path to keep the cache across runs.
+    query_cache = QueryEmbeddingCache(
+        model,
+        model_name=vectors_key,
+        cache_path=os.environ.get("QDRANT_QUERY_CACHE")
     )
-    
-    points.append(point)
-
-# Batch upload all points at once
-print(f"Uploading {len(points)} articles in a single batch...")
-client.upsert(
-    collection_name=collection_name,
-    points=points
-)
-
-print("Batch upload complete.\n")
-
-# Step 6: Complex filtering
-print("Step 6: Complex Filtering Example...")
-query = "artificial intelligence and machine learning"
-query_vector = model.encode(query)
-
-# Search for articles:
-# - by Jane Smith OR John Doe
-# - AND with read time less than 10 minutes
-# - AND with popularity greater than 0.8
-complex_results = client.search(
-    collection_name=collection_name,
-    query_vector=query_vector,
-    query_filter=models.Filter(
-        must=[
-            models.FieldCondition(
-                key="read_time",
-                range=models.Range(lt=10)  # Less than 10 minutes
-            ),
-            models.FieldCondition(
-                key="popularity",
-                range=models.Range(gt=0.8)  # Greater than 0.8
-            )
-        ],
-        should=[
-            models.FieldCondition(
-                key="author",
-                match=models.MatchValue(value="Jane Smith")
-            ),
-            models.FieldCondition(
-                key="author",
-                match=models.MatchValue(value="John Doe")
+    print(f"Loaded model with vector size: {vector_size}\n")
+
+    # Step 3: Create a new collection for this tutorial
+    print("Step 3: Creating a collection...")
+    collection_name = "articles"
+
+    # Titles and contents are embedded separately into two named vectors,
+    # so a title match is not diluted by the article body
+    article_vectors = named_vectors_config(["title", "content"], vector_size)
+
+    if sync_mode == "incremental":
+        # Keep the existing collection and its points; step 5 only uploads changes
+        if ensure_collection(
+            client,
+            collection_name,
+            vector_size,
+            quantization_config=quantization_config(),
+            vectors_config=article_vectors
+        ):
+            print(f"Collection '{collection_name}' created successfully!\n")
+        else:
+            print(f"Collection '{collection_name}' already exists. Syncing it incrementally.\n")
+    else:
+        # Check if collection exists and recreate it
+        collections = client.get_collections()
+        collection_names = [collection.name for collection in collections.collections]
+
+        if collection_name in collection_names:
+            print(f"Collection '{collection_name}' already exists. Recreating it...")
+            client.delete_collection(collection_name=collection_name)
+
+        # Create the collection
+        # (set QDRANT_QUANTIZATION=scalar or binary to store compact quantized vectors)
+        client.create_collection(
+            collection_name=collection_name,
+            vectors_config=article_vectors,
+            quantization_config=quantization_config()
+        )
+        print(f"Collection '{collection_name}' created successfully!\n")
+
+    # Index every payload field the filters below use, so filtered searches
+    # don't fall back to checking the payload of every candidate point
+    create_payload_indexes(client, collection_name, {
+        "author": models.PayloadSchemaType.KEYWORD,
+        "tags": models.PayloadSchemaType.KEYWORD,
+        "read_time": models.PayloadSchemaType.INTEGER,
+        "popularity": models.PayloadSchemaType.FLOAT
+    })
+    print("Payload indexes ready on author, tags, read_time and popularity.\n")
+
+    # Single-point writes below go through a pipeline. Set QDRANT_WRITE_MODE=async
+    # to send them with wait=False and only wait at explicit flush() barriers
+    # (QDRANT_WRITE_ORDERING picks weak, medium or strong ordering).
+    writes = write_pipeline_from_env(client, collection_name)
+
+    # Oversampling and rescoring used by every search on quantized vectors
+    # (set QDRANT_OVERSAMPLING and QDRANT_RESCORE to tune them; None when quantization is off)
+    query_params = search_params()
+
+    # Step 4: Prepare sample articles data
+    print("Step 4: Preparing sample data...")
+    articles = [
+        {
+            "id": 101,
+            "title": "Introduction to Machine Learning",
+            "content": "Machine learning is a branch of artificial intelligence that focuses on building systems that learn from data.",
+            "author": "Jane Smith",
+            "date": "2023-01-15",
+            "tags": ["AI", "ML", "technology"],
+            "read_time": 5,
+            "popularity": 0.85
+        },
+        {
+            "id": 102,
+            "title": "Deep Learning Fundamentals",
+            "content": "Deep learning is a subset of machine learning that uses neural networks with many layers.",
+            "author": "John Doe",
+            "date": "2023-02-20",
+            "tags": ["AI", "deep learning", "neural networks"],
+            "read_time": 8,
+            "popularity": 0.92
+        },
+        {
+            "id": 103,
+            "title": "Python for Data Science",
+            "content": "Python has become the most popular programming language for data science due to its simplicity and powerful libraries.",
+            "author": "Jane Smith",
+            "date": "2023-03-10",
+            "tags": ["Python", "data science", "programming"],
+            "read_time": 6,
+            "popularity": 0.78
+        },
+        {
+            "id": 104,
+            "title": "Natural Language Processing Techniques",
+            "content": "NLP combines linguistics, computer science, and AI to help computers understand human language.",
+            "author": "Mike Johnson",
+            "date": "2023-04-05",
+            "tags": ["NLP", "AI", "linguistics"],
+            "read_time": 10,
+            "popularity": 0.81
+        },
+        {
+            "id": 105,
+            "title": "Introduction to Vector Databases",
+            "content": "Vector databases are specialized systems designed to store and query high-dimensional vectors efficiently.",
+            "author": "Sarah Williams",
+            "date": "2023-05-12",
+            "tags": ["databases", "vectors", "similarity search"],
+            "read_time": 7,
+            "popularity": 0.75
+        },
+        {
+            "id": 106,
+            "title": "Qdrant: A Modern Vector Database",
+            "content": "Qdrant is a vector similarity search engine that provides a production-ready service with a convenient API.",
+            "author": "Alex Brown",
+            "date": "2023-06-18",
+            "tags": ["Qdrant", "vectors", "similarity search"],
+            "read_time": 9,
+            "popularity": 0.88
+        },
+        {
+            "id": 107,
+            "title": "Building Recommendation Systems",
+            "content": "Recommendation systems use collaborative filtering and content-based methods to suggest items to users.",
+            "author": "John Doe",
+            "date": "2023-07-22",
+            "tags": ["recommendations", "ML", "collaborative filtering"],
+            "read_time": 12,
+            "popularity": 0.91
+        },
+        {
+            "id": 108,
+            "title": "Data Visualization Best Practices",
+            "content": "Effective data visualization makes complex data more accessible, understandable, and usable.",
+            "author": "Lisa Chen",
+            "date": "2023-08-30",
+            "tags": ["visualization", "data", "design"],
+            "read_time": 6,
+            "popularity": 0.79
+        }
+    ]
+
+    print(f"Prepared {len(articles)} sample articles.\n")
+
+
+    def article_texts(article):
+        """Texts embedded for an article, one per named vector."""
+        return {"title": article["title"], "content": article["content"]}
+
+
+    def article_payload(article):
+        """Payload stored alongside an article's vector."""
+        return {
+            "title": article["title"],
+            "content": article["content"],
+            "author": article["author"],
+            "date": article["date"],
+            "tags": article["tags"],
+            "read_time": article["read_time"],
+            "popularity": article["popularity"]
+        }
+
+
+    # Step 5: Batch upload vectors
+    print("Step 5: Preparing batch upload...")
+
+    if sync_mode == "incremental":
+        # Only new or changed articles are re-encoded; removed ones are deleted
+        sync_stats = sync_collection(
+            client,
+            collection_name,
+            model,
+            articles,
+            text_fn=article_texts,
+            payload_fn=article_payload,
+            embedding_key=vectors_key
+        )
+        print(f"Synced articles: {sync_stats['upserted']} upserted, "
+              f"{sync_stats['unchanged']} unchanged, {sync_stats['deleted']} deleted.\n")
+    else:
+        def article_points(batch_size=256):
+            """Build points one batch at a time so the uploader never holds the whole corpus."""
+            for start in range(0, len(articles), batch_size):
+                batch = articles[start:start + batch_size]
+                # Embed the titles and contents of the whole batch in one pass
+                vectors = encode_named(model, [article_texts(article) for article in batch])
+                yield from (article_point(article, vector) for article, vector in zip(batch, vectors))
+
+        def article_point(article, vector):
+            """Build the point for one article and its named vectors."""
+            # Prepare payload with its content hash, so a later
+            # incremental run can skip unchanged articles
+            payload = article_payload(article)
+            payload[HASH_FIELD] = content_hash(payload, vectors_key)
+
+            return models.PointStruct(
+                id=article["id"],
+                vector=vector,
+                payload=payload
             )
-        ],
-        min_should=1  # At least one of the "should" conditions must be met
-    ),
-    limit=5
-)
-
-print(f"Query: '{query}' with complex filtering")
-print("Results:")
-for i, result in enumerate(complex_results, 1):
-    print(f"  {i}. {result.payload['title']} by {result.payload['author']} (Score: {result.score:.4f})")
-    print(f"     Read time: {result.payload['read_time']} min, Popularity: {result.payload['popularity']}")
-
-# Step 7: Pagination example
-print("\nStep 7: Pagination Example...")
-query = "data"
-query_vector = model.encode(query)
-
-# First page (2 results)
-page_1 = client.search(
-    collection_name=collection_name,
-    query_vector=query_vector,
-    limit=2,
-    offset=0  # Start from the beginning
-)
-
-print(f"Query: '{query}' - Page 1 (2 results):")
-for i, result in enumerate(page_1, 1):
-    print(f"  {i}. {result.payload['title']} (Score: {result.score:.4f})")
-
-# Second page (2 more results)
-page_2 = client.search(
-    collection_name=collection_name,
-    query_vector=query_vector,
-    limit=2,
-    offset=2  # Skip the first 2 results
-)
-
-print(f"\nQuery: '{query}' - Page 2 (2 results):")
-for i, result in enumerate(page_2, 1):
-    print(f"  {i}. {result.payload['title']} (Score: {result.score:.4f})")
-
-# Step 8: Using the scroll API for iterating through results
-print("\nStep 8: Scroll API Example...")
-query = "vectors and databases"
-query_vector = model.encode(query)
-
-# Get the first batch with scroll_id
-scroll_batch, scroll_id = client.scroll(
-    collection_name=collection_name,
-    query_vector=query_vector,
-    limit=2,  # Get 2 results per batch
-    with_payload=True,
-    with_vectors=False  # We don't need the actual vectors
-)
-
-print(f"Query: '{query}' - Scroll batch 1:")
-for i, result in enumerate(scroll_batch, 1):
-    print(f"  {i}. {result.payload['title']}")
-
-# Get the next batch using the scroll_id
-if scroll_id:
-    next_batch, next_scroll_id = client.scroll(
-        collection_name=collection_name,
-        scroll_id=scroll_id,  # Use the scroll_id from the previous request
-        limit=2,
-        with_payload=True,
-        with_vectors=False
+
+        # Upload in fixed-size batches from parallel workers
+        print(f"Uploading {len(articles)} articles in parallel batches...")
+        upload_stats = upload_points(
+            client,
+            collection_name,
+            article_points(),
+            batch_size=256,
+            parallel=4
+        )
+
+        print(f"Batch upload complete: {upload_stats['points']} points in {upload_stats['batches']} batches "
+              f"({upload_stats['points_per_second']:.0f} points/sec).\n")
+
+    # Step 6: Complex filtering
+    print("Step 6: Complex Filtering Example...")
+    query = "artificial intelligence and machine learning"
+    query_vector = query_cache.encode(query)
+
+    # Title and content scores are combined with weights picked at query time,
+    # so relevance can be tuned (e.g. QDRANT_VECTOR_WEIGHTS="title=0.5,content=0.5")
+    # without re-embedding anything
+    weights = vector_weights({"title": 0.3, "content": 0.7})
+
+    # Search for articles:
+    # - by Jane Smith OR John Doe
+    # - AND with read time less than 10 minutes
+    # - AND with popularity greater than 0.8
+    complex_results = weighted_search(
+        client,
+        collection_name,
+        query_vector,
+        weights,
+        search_params=query_params,
+        with_payload=["title", "author", "read_time", "popularity"],  # Only the fields printed below
+        query_filter=models.Filter(
+            must=[
+                models.FieldCondition(
+                    key="read_time",
+                    range=models.Range(lt=10)  # Less than 10 minutes
+                ),
+                models.FieldCondition(
+                    key="popularity",
+                    range=models.Range(gt=0.8)  # Greater than 0.8
+                )
+            ],
+            # At least one of the "should" conditions must be met
+            should=[
+                models.FieldCondition(
+                    key="author",
+                    match=models.MatchValue(value="Jane Smith")
+                ),
+                models.FieldCondition(
+                    key="author",
+                    match=models.MatchValue(value="John Doe")
+                )
+            ]
+        ),
+        limit=5
     )
-    
-    print(f"\nQuery: '{query}' - Scroll batch 2:")
-    for i, result in enumerate(next_batch, 1):
-        print(f"  {i}. {result.payload['title']}")
-
-# Step 9: Demonstrate collection management operations
-print("\nStep 9: Collection Management...")
-
-# List all collections
-collections = client.get_collections()
-print(f"Available collections: {[collection.name for collection in collections.collections]}")
-
-# Get detailed collection info
-collection_info = client.get_collection(collection_name=collection_name)
-print(f"\nCollection '{collection_name}' details:")
-print(f"- Vector size: {collection_info.config.params.vectors.size}")
-print(f"- Distance function: {collection_info.config.params.vectors.distance}")
-print(f"- Number of vectors: {collection_info.vectors_count}")
-
-# Step 10: Demonstrate deleting points
-print("\nStep 10: Deleting Points...")
-# Delete a specific point by ID
-point_to_delete = 101
-client.delete(
-    collection_name=collection_name,
-    points_selector=models.PointIdsList(
-        points=[point_to_delete]
+
+    print(f"Query: '{query}' with complex filtering, weights {weights}")
+    print("Results:")
+    for i, result in enumerate(complex_results, 1):
+        print(f"  {i}. {result.payload['title']} by {result.payload['author']} (Score: {result.score:.4f})")
+        print(f"     Read time: {result.payload['read_time']} min, Popularity: {result.payload['popularity']}")
+
+    # Step 7: Pagination example
+    print("\nStep 7: Pagination Example...")
+    query = "data"
+    query_vector = query_cache.encode(query)
+
+    # Page through the results 2 at a time. Each page hands back an opaque
+    # cursor holding the last score and the IDs tied at it, so the cursor stays
+    # small and points inserted between pages are never shown twice. (The
+    # server still ranks the results before a page, as with a plain offset.)
+    cursor = None
+    page_number = 0
+    while True:
+        page, cursor = search_page(
+            client,
+            collection_name,
+            query_vector,
+            limit=2,
+            cursor=cursor,
+            search_params=query_params,
+            with_payload=["title"],
+            using="content"
+        )
+        if not page:
+            break
+        page_number += 1
+
+        if page_number > 1:
+            print()
+        print(f"Query: '{query}' - Page {page_number} ({len(page)} results):")
+        for i, result in enumerate(page, 1):
+            print(f"  {i}. {result.payload['title']} (Score: {result.score:.4f})")
+
+        if cursor is None:
+            break
+
+    # Step 8: Using the scroll API for iterating through results
+    print("\nStep 8: Scroll API Example...")
+    # Walk the whole collection 2 points per request. Each scroll returns the
+    # offset of the next page; the next page is fetched in the background
+    # while the current one is printed. Only the fields we print are fetched.
+    for batch_number, batch in enumerate(
+        scroll_pages(
+            client,
+            collection_name,
+            page_size=2,  # Get 2 results per batch
+            with_payload=["title", "author"],
+            with_vectors=False  # We don't need the actual vectors
+        ),
+        1
+    ):
+        if batch_number > 1:
+            print()
+        print(f"Scroll batch {batch_number}:")
+        for i, record in enumerate(batch, 1):
+            print(f"  {i}. {record.payload['title']} by {record.payload['author']}")
+
+    # Step 9: Demonstrate collection management operations
+    print("\nStep 9: Collection Management...")
+
+    # List all collections
+    collections = client.get_collections()
+    print(f"Available collections: {[collection.name for collection in collections.collections]}")
+
+    # Get detailed collection info
+    collection_info = client.get_collection(collection_name=collection_name)
+    print(f"\nCollection '{collection_name}' details:")
+    for vector_name, params in collection_info.config.params.vectors.items():
+        print(f"- Vector '{vector_name}': size {params.size}, distance {params.distance}")
+    print(f"- Number of vectors: {collection_info.vectors_count}")
+
+    # Step 10: Demonstrate deleting points
+    print("\nStep 10: Deleting Points...")
+    # Delete a specific point by ID
+    point_to_delete = 101
+    writes.delete(
+        models.PointIdsList(
+            points=[point_to_delete]
+        )
+    )
+    print(f"Deleted point with ID: {point_to_delete}")
+
+    # Verify deletion once the write has been applied
+    writes.flush()
+    result = client.retrieve(
+        collection_name=collection_name,
+        ids=[point_to_delete]
     )
-)
-print(f"Deleted point with ID: {point_to_delete}")
-
-# Verify deletion
-result = client.retrieve(
-    collection_name=collection_name,
-    ids=[point_to_delete]
-)
-if not result:
-    print(f"Point {point_to_delete} was successfully deleted.")
-
-# Step 11: Demonstrate conditional deletion
-print("\nStep 11: Conditional Deletion...")
-# Delete all articles by a specific author
-author_to_delete = "Lisa Chen"
-client.delete(
-    collection_name=collection_name,
-    points_selector=models.FilterSelector(
-        filter=models.Filter(
+    if not result:
+        print(f"Point {point_to_delete} was successfully deleted.")
+
+    # Step 11: Demonstrate conditional deletion
+    print("\nStep 11: Conditional Deletion...")
+    # Delete all articles by a specific author. The matching IDs are scrolled
+    # and deleted in rate-limited batches that don't block other writes; the
+    # optimizers then clean up the segments the deletions left behind.
+    author_to_delete = "Lisa Chen"
+    delete_stats = delete_by_filter(
+        client,
+        collection_name,
+        models.Filter(
             must=[
                 models.FieldCondition(
                     key="author",
                     match=models.MatchValue(value=author_to_delete)
                 )
             ]
-        )
+        ),
+        batch_size=100,
+        max_points_per_second=1000,
+        optimize=True
     )
-)
-print(f"Deleted all articles by author: {author_to_delete}")
-
-# Step 12: Demonstrate updating points
-print("\nStep 12: Updating Points...")
-# Update the popularity of an article
-point_to_update = 102
-client.update_vectors(
-    collection_name=collection_name,
-    points=[
-        models.PointVectors(
-            id=point_to_update,
-            vector=model.encode("Deep Learning Fundamentals - Updated with new information about transformer models.").tolist()
-        )
-    ]
-)
-print(f"Updated vector for point with ID: {point_to_update}")
-
-# Update payload for a point
-client.update_payload(
-    collection_name=collection_name,
-    payload={"popularity": 0.95, "read_time": 9},
-    points=[point_to_update]
-)
-print(f"Updated payload for point with ID: {point_to_update}")
-
-# Verify update
-updated_point = client.retrieve(
-    collection_name=collection_name,
-    ids=[point_to_update]
-)
-if updated_point:
-    print(f"Updated point details:")
-    print(f"- Title: {updated_point[0].payload['title']}")
-    print(f"- Popularity: {updated_point[0].payload['popularity']}")
-    print(f"- Read time: {updated_point[0].payload['read_time']}")
-
-print("\nAdvanced Qdrant tutorial completed successfully!")
+    print(f"Deleted {delete_stats['deleted']} of {delete_stats['total']} articles by author: {author_to_delete} "
+          f"({delete_stats['batches']} batches)")
+
+    # Step 12: Demonstrate updating points
+    print("\nStep 12: Updating Points...")
+    # Update the popularity of an article
+    point_to_update = 102
+    writes.update_vectors(
+        [
+            models.PointVectors(
+                id=point_to_update,
+                # Only the content vector changes; the title vector is kept
+                vector={
+                    "content": model.encode("Deep Learning Fundamentals - Updated with new information about transformer models.").tolist()
+                }
+            )
+        ]
+    )
+    print(f"Updated vector for point with ID: {point_to_update}")
+
+    # Update payload for a point
+    writes.set_payload(
+        {"popularity": 0.95, "read_time": 9},
+        [point_to_update]
+    )
+    print(f"Updated payload for point with ID: {point_to_update}")
+
+    # Verify both updates after one barrier
+    writes.flush()
+    updated_point = client.retrieve(
+        collection_name=collection_name,
+        ids=[point_to_update]
+    )
+    if updated_point:
+        print(f"Updated point details:")
+        print(f"- Title: {updated_point[0].payload['title']}")
+        print(f"- Popularity: {updated_point[0].payload['popularity']}")
+        print(f"- Read time: {updated_point[0].payload['read_time']}")
+
+    query_cache.flush()
+    cache_stats = query_cache.stats()
+    print(f"\nQuery cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
+    write_stats = writes.stats()
+    print(f"Writes: {write_stats['writes']} sent, {write_stats['flushes']} flush barriers, "
+          f"last operation ID {write_stats['last_operation_id']}")
+    print("\nAdvanced Qdrant tutorial completed successfully!")
+
+
+if __name__ == "__main__":
+    main()
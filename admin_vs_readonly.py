@@ -5,7 +5,7 @@ Qdrant Admin vs Read-Only API Key Example
 This script demonstrates the difference between using an admin API key and a read-only API key.
 """
 
-from qdrant_client import QdrantClient
+from client_pool import get_client
 from qdrant_client.http import models
 from qdrant_client.http.exceptions import UnexpectedResponse
 import time
@@ -22,21 +22,11 @@ print("========================================\n")
 
 # Connect with admin key
 print("Connecting with admin key...")
-admin_client = QdrantClient(
-    host="localhost",
-    port=6333,
-    api_key=ADMIN_KEY,
-    https=False  # Set to True if using HTTPS
-)
+admin_client = get_client(api_key=ADMIN_KEY)  # Set QDRANT_HTTPS=1 if using HTTPS
 
 # Connect with read-only key
 print("Connecting with read-only key...")
-readonly_client = QdrantClient(
-    host="localhost",
-    port=6333,
-    api_key=READONLY_KEY,
-    https=False  # Set to True if using HTTPS
-)
+readonly_client = get_client(api_key=READONLY_KEY)  # Set QDRANT_HTTPS=1 if using HTTPS
 
 # Clean up any existing test collection
 try:
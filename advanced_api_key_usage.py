@@ -11,7 +11,7 @@ specific needs of that client.
 """
 
 import os
-from qdrant_client import QdrantClient
+from client_pool import get_client
 from qdrant_client.http import models
 import json
 from dotenv import load_dotenv
@@ -21,11 +21,8 @@ load_dotenv()
 
 # Function to create a client with a specific API key
 def create_client(api_key, name="Unnamed"):
-    client = QdrantClient(
-        host="localhost",
-        port=6333,
-        api_key=api_key
-    )
+    # Clients are shared per key, so repeated calls reuse warm connections
+    client = get_client(api_key=api_key)
     return client, name
 
 # Example API keys with different permission levels
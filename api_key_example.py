@@ -47,10 +47,18 @@ client = QdrantClient(
     api_key=config.get("api_key")
 )
 
-# Example of using the authenticated client
-try:
-    # This will only work if the API key is valid
-    collections = client.get_collections()
-    print(f"Successfully authenticated! Found {len(collections.collections)} collections.")
-except Exception as e:
-    print(f"Authentication failed: {e}")
+# Method 4: Using the tutorial's shared connection settings
+# create_client() reads QDRANT_HOST, QDRANT_API_KEY and QDRANT_PREFER_GRPC
+# (set it to 1 to use the gRPC interface on port 6334) from the environment
+from qdrant_connection import create_client
+
+env_client = create_client()
+
+# Example of using the authenticated clients
+for method, authenticated_client in [("config file", client), ("environment", env_client)]:
+    try:
+        # This will only work if the API key is valid
+        collections = authenticated_client.get_collections()
+        print(f"Successfully authenticated ({method})! Found {len(collections.collections)} collections.")
+    except Exception as e:
+        print(f"Authentication failed ({method}): {e}")
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Qdrant Async Operations Tutorial
+
+This script demonstrates the search and ingest flows from the basic and
+semantic search tutorials on top of AsyncQdrantClient:
+1. Upserting documents without blocking the event loop
+2. Semantic and filtered search
+3. Retrieving points by ID
+4. Fanning out hundreds of concurrent searches under a concurrency limit
+
+Embedding runs in a thread pool executor, so the event loop keeps serving
+other requests while the model is busy. Query texts go through the query
+embedding cache (see query_cache.py), so repeated searches skip the model.
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from qdrant_client.http import models
+
+from dimension_reduction import embedding_key
+from embeddings import load_model
+from qdrant_connection import create_async_client, describe_connection
+from query_cache import QueryEmbeddingCache
+
+
+class AsyncQdrantOperations:
+    """Async search, retrieve and upsert helpers with a concurrency limit."""
+
+    def __init__(self, client, encoder, max_concurrency=64, embedding_workers=4, query_encoder=None):
+        """
+        Create the async helpers.
+
+        Args:
+            client: AsyncQdrantClient connected to the server
+            encoder: SentenceTransformer model used to embed documents
+            max_concurrency: Maximum number of requests in flight at once
+            embedding_workers: Number of threads used for embedding
+            query_encoder: Object with an `encode` method used to embed search
+                queries, e.g. a QueryEmbeddingCache (None to use `encoder`)
+        """
+        self.client = client
+        self.encoder = encoder
+        self.query_encoder = query_encoder or encoder
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.executor = ThreadPoolExecutor(max_workers=embedding_workers)
+
+    async def embed(self, text, encoder=None):
+        """Embed text in the executor so the event loop is not blocked."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, (encoder or self.encoder).encode, text)
+
+    async def search(self, collection_name, query, limit=3, query_filter=None):
+        """
+        Run a semantic search for a query text.
+
+        Args:
+            collection_name: Name of the collection to search
+            query: Query text
+            limit: Maximum number of results
+            query_filter: Optional models.Filter applied to the search
+
+        Returns:
+            List of scored points
+        """
+        query_vector = await self.embed(query, self.query_encoder)
+        async with self.semaphore:
+            return await self.client.search(
+                collection_name=collection_name,
+                query_vector=query_vector.tolist(),
+                query_filter=query_filter,
+                limit=limit
+            )
+
+    async def filtered_search(self, collection_name, query, key, value, limit=3):
+        """Run a semantic search restricted to points whose `key` matches `value`."""
+        query_filter = models.Filter(
+            must=[
+                models.FieldCondition(
+                    key=key,
+                    match=models.MatchValue(value=value)
+                )
+            ]
+        )
+        return await self.search(collection_name, query, limit=limit, query_filter=query_filter)
+
+    async def retrieve(self, collection_name, ids):
+        """Retrieve points by ID."""
+        async with self.semaphore:
+            return await self.client.retrieve(collection_name=collection_name, ids=ids)
+
+    async def upsert(self, collection_name, points):
+        """Upsert a list of points."""
+        async with self.semaphore:
+            return await self.client.upsert(collection_name=collection_name, points=points)
+
+    async def upsert_documents(self, collection_name, documents, text_fn, payload_fn, batch_size=64):
+        """
+        Embed and upsert documents in batches, sending batches concurrently.
+
+        Args:
+            collection_name: Name of the target collection
+            documents: List of documents, each with an "id" key
+            text_fn: Function returning the text to embed for a document
+            payload_fn: Function returning the payload for a document
+            batch_size: Number of documents per upsert request
+
+        Returns:
+            Number of documents upserted
+        """
+        async def upsert_batch(batch):
+            vectors = await self.embed([text_fn(doc) for doc in batch])
+            points = [
+                models.PointStruct(
+                    id=doc["id"],
+                    vector=vector.tolist(),
+                    payload=payload_fn(doc)
+                )
+                for doc, vector in zip(batch, vectors)
+            ]
+            await self.upsert(collection_name, points)
+
+        await asyncio.gather(*[
+            upsert_batch(documents[start:start + batch_size])
+            for start in range(0, len(documents), batch_size)
+        ])
+        return len(documents)
+
+    def close(self):
+        """Shut down the embedding executor."""
+        self.executor.shutdown(wait=False)
+
+
+async def main():
+    print("Qdrant Async Operations Tutorial")
+    print("================================\n")
+
+    # Step 1: Connect to Qdrant
+    print("Step 1: Connecting to Qdrant server...")
+    # In local mode (QDRANT_LOCATION) the async client has its own store,
+    # separate from the one the synchronous tutorials use
+    client = create_async_client()
+    print(f"Connected successfully to {describe_connection()}!\n")
+
+    # Step 2: Load the embedding model
+    print("Step 2: Loading embedding model...")
+    model = load_model('all-MiniLM-L6-v2')
+    vector_size = model.get_sentence_embedding_dimension()
+    # The concurrent searches below repeat a few queries; each is encoded once
+    query_cache = QueryEmbeddingCache(
+        model,
+        model_name=embedding_key("all-MiniLM-L6-v2", model),
+        cache_path=os.environ.get("QDRANT_QUERY_CACHE")
+    )
+    operations = AsyncQdrantOperations(client, model, max_concurrency=64, query_encoder=query_cache)
+    print(f"Loaded model with vector size: {vector_size}\n")
+
+    # Step 3: Create a collection
+    print("Step 3: Creating a collection...")
+    collection_name = "async_documents"
+    if await client.collection_exists(collection_name=collection_name):
+        print(f"Collection '{collection_name}' already exists. Recreating it...")
+        await client.delete_collection(collection_name=collection_name)
+    await client.create_collection(
+        collection_name=collection_name,
+        vectors_config=models.VectorParams(
+            size=vector_size,
+            distance=models.Distance.COSINE
+        )
+    )
+    print(f"Collection '{collection_name}' created successfully!\n")
+
+    # Step 4: Upsert documents
+    print("Step 4: Upserting documents...")
+    documents = [
+        {"id": 1, "title": "What is a Vector Database?", "category": "Database Technology"},
+        {"id": 2, "title": "Introduction to Qdrant", "category": "Database Technology"},
+        {"id": 3, "title": "Machine Learning Basics", "category": "Artificial Intelligence"},
+        {"id": 4, "title": "Natural Language Processing", "category": "Artificial Intelligence"},
+        {"id": 5, "title": "Python Programming Language", "category": "Programming"},
+    ]
+    count = await operations.upsert_documents(
+        collection_name,
+        documents,
+        text_fn=lambda doc: doc["title"],
+        payload_fn=lambda doc: {"title": doc["title"], "category": doc["category"]}
+    )
+    print(f"Upserted {count} documents.\n")
+
+    # Step 5: Search, filtered search and retrieve
+    print("Step 5: Search, filtered search and retrieve...")
+    results, filtered_results, retrieved = await asyncio.gather(
+        operations.search(collection_name, "What is Qdrant?"),
+        operations.filtered_search(collection_name, "vector technology", "category", "Artificial Intelligence"),
+        operations.retrieve(collection_name, [1, 3])
+    )
+    print("Search results:")
+    for result in results:
+        print(f"  - {result.payload['title']} (Score: {result.score:.4f})")
+    print("Filtered search results (category 'Artificial Intelligence'):")
+    for result in filtered_results:
+        print(f"  - {result.payload['title']} (Score: {result.score:.4f})")
+    print("Retrieved points with IDs 1 and 3:")
+    for point in retrieved:
+        print(f"  - ID: {point.id}, Title: {point.payload['title']}")
+    print()
+
+    # Step 6: Fan out many concurrent searches
+    print("Step 6: Fanning out concurrent searches...")
+    queries = [
+        "What is Qdrant?",
+        "How do vector databases work?",
+        "Tell me about artificial intelligence",
+        "Python programming examples"
+    ]
+    num_searches = 400
+    start = time.perf_counter()
+    all_results = await asyncio.gather(*[
+        operations.search(collection_name, queries[i % len(queries)])
+        for i in range(num_searches)
+    ])
+    elapsed = time.perf_counter() - start
+    print(f"Completed {len(all_results)} searches in {elapsed:.2f}s "
+          f"({len(all_results) / elapsed:.0f} searches/sec)")
+    query_cache.flush()
+    cache_stats = query_cache.stats()
+    print(f"Query cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
+
+    operations.close()
+    await client.close()
+    print("\nAsync operations tutorial completed successfully!")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Qdrant Tutorial Batch Search
+
+This module runs many semantic searches in a single network round-trip:
+1. All query texts are embedded with one model call
+2. All searches are sent together in one query_batch_points request
+3. Each query can carry its own filter and limit
+4. Results come back in the same order as the queries
+5. Callers can build their own request per query (e.g. hybrid_search.py's
+   fused dense + sparse requests) and keep the batching above
+"""
+
+from qdrant_client.http import models
+
+DEFAULT_LIMIT = 3
+
+
+def normalize_query_spec(query):
+    """Turn a query string or dict into a dict with text, filter and limit."""
+    if isinstance(query, str):
+        query = {"text": query}
+    return {
+        "text": query["text"],
+        "filter": query.get("filter"),
+        "limit": query.get("limit", DEFAULT_LIMIT)
+    }
+
+
+def batch_search(client, collection_name, encoder, queries, with_payload=True, score_threshold=None,
+                 search_params=None, request_fn=None):
+    """
+    Search a collection for several queries at once.
+
+    Args:
+        client: QdrantClient connected to the server
+        collection_name: Name of the collection to search
+        encoder: QueryEmbeddingCache or SentenceTransformer model used to embed the queries
+        queries: List of query strings, or dicts with "text" and optional
+            "filter" (models.Filter) and "limit" keys
+        with_payload: Payload selector applied to every search
+        score_threshold: Optional minimum score applied to every search
+        search_params: Optional models.SearchParams (e.g. quantization rescoring)
+            applied to every search
+        request_fn: Optional function (query dict, query embedding) returning
+            the models.QueryRequest for a query, used instead of a plain
+            dense search; it applies the selectors and params itself
+
+    Returns:
+        List with one list of scored points per query, in input order
+    """
+    queries = [normalize_query_spec(query) for query in queries]
+    if not queries:
+        return []
+
+    texts = [query["text"] for query in queries]
+    if hasattr(encoder, "encode_many"):
+        vectors = encoder.encode_many(texts)
+    else:
+        vectors = encoder.encode(texts)
+
+    if request_fn is None:
+        def request_fn(query, vector):
+            return models.QueryRequest(
+                query=vector.tolist(),
+                filter=query["filter"],
+                limit=query["limit"],
+                with_payload=with_payload,
+                score_threshold=score_threshold,
+                params=search_params
+            )
+
+    requests = [request_fn(query, vector) for query, vector in zip(queries, vectors)]
+    responses = client.query_batch_points(collection_name=collection_name, requests=requests)
+    return [response.points for response in responses]
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Qdrant Embedding Backend Benchmark
+
+This script compares the embedding backends on the same texts:
+1. Startup time (loading the model)
+2. Parity: cosine similarity of each backend's embeddings to the
+   sentence-transformers reference, and agreement of nearest neighbors
+3. Throughput of batched corpus encoding (texts/sec) and single-query latency
+
+The parity check fails (exit code 1) if any backend's lowest cosine
+similarity to the reference falls below --min-cosine.
+
+Usage:
+    python onnx_embedder.py export all-MiniLM-L6-v2 onnx_models/all-MiniLM-L6-v2
+    python benchmark_embedders.py --model-dir onnx_models/all-MiniLM-L6-v2
+"""
+
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+from benchmark_suite import latency_summary
+from embeddings import DEFAULT_MODEL_NAME, encode_corpus, load_model
+from ingest_pipeline import read_records
+from onnx_embedder import OnnxEmbedder
+from recall_evaluation import exact_top_k, recall_at_k
+
+# Vocabulary the synthetic sentences are drawn from
+WORDS = ("vector", "database", "search", "engine", "semantic", "similarity", "neural", "network",
+         "language", "model", "python", "data", "science", "query", "index", "learning", "machine",
+         "embedding", "document", "retrieval", "fast", "scalable", "filter", "cluster")
+
+
+def synthetic_texts(count, seed=42, min_words=5, max_words=60):
+    """Generate sentences of varying length from a fixed vocabulary."""
+    rng = np.random.default_rng(seed)
+    return [
+        " ".join(rng.choice(WORDS, size=rng.integers(min_words, max_words)))
+        for _ in range(count)
+    ]
+
+
+def load_backends(model_name, model_dir, num_threads=None):
+    """
+    Load every backend and time how long each takes.
+
+    Returns:
+        Dictionary mapping backend name to (embedder, load seconds)
+    """
+    loaders = {
+        "sentence-transformers": lambda: load_model(model_name, backend="sentence-transformers"),
+        "onnx": lambda: OnnxEmbedder(model_dir, num_threads=num_threads),
+        "onnx-int8": lambda: OnnxEmbedder(model_dir, quantized=True, num_threads=num_threads),
+    }
+    backends = {}
+    for name, loader in loaders.items():
+        start = time.perf_counter()
+        embedder = loader()
+        backends[name] = (embedder, time.perf_counter() - start)
+    return backends
+
+
+def parity(reference, candidate, k=10):
+    """
+    Compare a backend's embeddings to the reference embeddings of the same texts.
+
+    Returns:
+        Dictionary with the mean and minimum cosine similarity per text and the
+        overlap of each text's k nearest neighbors within the corpus
+    """
+    cosines = np.sum(reference * candidate, axis=1) / (
+        np.linalg.norm(reference, axis=1) * np.linalg.norm(candidate, axis=1)
+    )
+    k = min(k, len(reference))
+    reference_neighbors = exact_top_k(reference, reference, k)
+    candidate_neighbors = exact_top_k(candidate, candidate, k)
+    return {
+        "mean_cosine": float(cosines.mean()),
+        "min_cosine": float(cosines.min()),
+        "neighbor_recall": recall_at_k(candidate_neighbors.tolist(), reference_neighbors)
+    }
+
+
+def throughput(embedder, texts, queries, batch_size):
+    """Measure batched encoding throughput and single-query latency."""
+    embedder.encode(texts[:batch_size], batch_size=batch_size)  # Warm-up
+
+    start = time.perf_counter()
+    vectors = encode_corpus(embedder, texts, batch_size=batch_size, num_workers=1)
+    seconds = time.perf_counter() - start
+
+    latencies = []
+    query_start = time.perf_counter()
+    for query in queries:
+        request_start = time.perf_counter()
+        embedder.encode(query)
+        latencies.append((time.perf_counter() - request_start) * 1000)
+    query_latency = latency_summary(latencies, time.perf_counter() - query_start)
+
+    return vectors, {
+        "texts_per_second": len(texts) / seconds if seconds else 0.0,
+        "query_p50_ms": query_latency["p50_ms"],
+        "query_p99_ms": query_latency["p99_ms"]
+    }
+
+
+def compare(model_name, model_dir, texts, queries, batch_size=64, num_threads=None):
+    """
+    Compare every backend against the sentence-transformers reference.
+
+    Returns:
+        List of result dictionaries, one per backend
+    """
+    results = []
+    reference = None
+    for name, (embedder, load_seconds) in load_backends(model_name, model_dir, num_threads).items():
+        vectors, speed = throughput(embedder, texts, queries, batch_size)
+        if reference is None:
+            reference = vectors
+        results.append({"backend": name, "load_seconds": load_seconds, **speed, **parity(reference, vectors)})
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare embedding backends for parity and throughput")
+    parser.add_argument("--model", default=DEFAULT_MODEL_NAME, help="SentenceTransformer model name")
+    parser.add_argument("--model-dir", required=True, help="Directory written by `onnx_embedder.py export`")
+    parser.add_argument("--corpus", help="JSONL, CSV or Parquet file to take texts from (default: synthetic)")
+    parser.add_argument("--text-field", default="content", help="Field of --corpus records to embed")
+    parser.add_argument("--texts", type=int, default=2000, help="Number of texts to encode")
+    parser.add_argument("--queries", type=int, default=200, help="Number of single-query encodes")
+    parser.add_argument("--batch-size", type=int, default=64, help="Texts per forward pass")
+    parser.add_argument("--threads", type=int, help="ONNX Runtime intra-op threads")
+    parser.add_argument("--min-cosine", type=float, default=0.98, help="Lowest acceptable cosine to the reference")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    args = parser.parse_args()
+
+    print("Qdrant Embedding Backend Benchmark")
+    print("==================================\n")
+
+    if args.corpus:
+        texts = [str(record[args.text_field]) for record, _ in zip(read_records(args.corpus), range(args.texts))]
+    else:
+        texts = synthetic_texts(args.texts)
+    queries = synthetic_texts(args.queries, seed=7, max_words=12)
+    print(f"Texts: {len(texts)}, queries: {len(queries)}\n")
+
+    results = compare(args.model, args.model_dir, texts, queries, args.batch_size, args.threads)
+
+    print(f"{'backend':>22} {'load s':>7} {'texts/s':>9} {'q p50 ms':>9} {'q p99 ms':>9} "
+          f"{'mean cos':>9} {'min cos':>8} {'nn recall':>9}")
+    for result in results:
+        print(f"{result['backend']:>22} {result['load_seconds']:>7.2f} {result['texts_per_second']:>9.0f} "
+              f"{result['query_p50_ms']:>9.2f} {result['query_p99_ms']:>9.2f} {result['mean_cosine']:>9.4f} "
+              f"{result['min_cosine']:>8.4f} {result['neighbor_recall']:>9.4f}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    failed = [result["backend"] for result in results if result["min_cosine"] < args.min_cosine]
+    if failed:
+        print(f"\nParity check failed for: {', '.join(failed)} (min cosine below {args.min_cosine})")
+        sys.exit(1)
+    print(f"\nParity check passed (min cosine >= {args.min_cosine})")
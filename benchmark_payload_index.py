@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Qdrant Payload Index Benchmark
+
+This script measures filtered-search latency on a synthetic corpus with and
+without payload indexes, as the filter selectivity changes:
+1. A range filter on the float "popularity" field keeps a chosen fraction of points
+2. Every filter is timed on the collection without payload indexes
+3. The index schema is inferred from the same filters and the indexes are created
+4. Every filter is timed again with the indexes in place
+
+Without an index Qdrant checks the payload of each HNSW candidate; with one it
+can switch to scanning only the matching points when the filter is very selective.
+"""
+
+import argparse
+import json
+
+import numpy as np
+from qdrant_client.http import models
+
+from benchmark_suite import environment_info, synthetic_points, time_searches
+from collection_status import INDEX_START_TIMEOUT, wait_until_indexed
+from benchmark_transport import random_vectors
+from parallel_upload import upload_points
+from payload_indexes import create_payload_indexes, infer_index_schema
+from qdrant_connection import create_client
+
+DEFAULT_SELECTIVITIES = [0.001, 0.01, 0.1, 0.5, 1.0]
+
+
+def selectivity_filter(selectivity):
+    """Filter keeping about the given fraction of the synthetic corpus (popularity is uniform in [0, 1))."""
+    return models.Filter(
+        must=[
+            models.FieldCondition(
+                key="popularity",
+                range=models.Range(lt=selectivity)
+            )
+        ]
+    )
+
+
+def compare(client, num_points, vector_size, selectivities, num_searches=200, seed=42,
+            collection_name="payload_index_benchmark"):
+    """
+    Time filtered searches before and after creating payload indexes.
+
+    Returns:
+        List of result dictionaries, one per (selectivity, indexed)
+    """
+    if client.collection_exists(collection_name=collection_name):
+        client.delete_collection(collection_name=collection_name)
+    client.create_collection(
+        collection_name=collection_name,
+        vectors_config=models.VectorParams(
+            size=vector_size,
+            distance=models.Distance.COSINE
+        )
+    )
+    upload_points(
+        client,
+        collection_name,
+        synthetic_points(num_points, vector_size, seed=seed),
+        progress=None
+    )
+    wait_until_indexed(client, collection_name, start_timeout=INDEX_START_TIMEOUT)
+
+    queries = random_vectors(num_searches, vector_size, np.random.default_rng(seed + 1))
+    filters = {selectivity: selectivity_filter(selectivity) for selectivity in selectivities}
+    results = []
+
+    def run(indexed):
+        for selectivity, query_filter in filters.items():
+            summary = time_searches(client, collection_name, queries, query_filter=query_filter)
+            results.append({
+                "selectivity": selectivity,
+                "indexed": indexed,
+                "p50_ms": summary["p50_ms"],
+                "p95_ms": summary["p95_ms"],
+                "p99_ms": summary["p99_ms"],
+                "qps": summary["qps"]
+            })
+
+    run(indexed=False)
+    create_payload_indexes(client, collection_name, infer_index_schema(*filters.values()))
+    wait_until_indexed(client, collection_name)
+    run(indexed=True)
+
+    client.delete_collection(collection_name=collection_name)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare filtered search with and without payload indexes")
+    parser.add_argument("--points", type=int, default=100000, help="Number of points")
+    parser.add_argument("--vector-size", type=int, default=384, help="Vector size")
+    parser.add_argument("--searches", type=int, default=200, help="Number of searches per filter")
+    parser.add_argument("--selectivity", type=float, nargs="+", default=DEFAULT_SELECTIVITIES,
+                        help="Fractions of the corpus the filters keep")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    args = parser.parse_args()
+
+    print("Qdrant Payload Index Benchmark")
+    print("==============================\n")
+    print(f"Corpus: {args.points} points, {args.vector_size}-d vectors\n")
+
+    client = create_client()
+    results = compare(client, args.points, args.vector_size, args.selectivity,
+                      num_searches=args.searches, seed=args.seed)
+
+    print(f"{'selectivity':>11} {'indexed':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'QPS':>8}")
+    for result in results:
+        print(f"{result['selectivity']:>11.3f} {str(result['indexed']):>8} {result['p50_ms']:>8.2f} "
+              f"{result['p95_ms']:>8.2f} {result['p99_ms']:>8.2f} {result['qps']:>8.0f}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"environment": environment_info(client), "results": results}, f, indent=2)
+        print(f"\nResults written to {args.output}")
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Qdrant Payload Projection Benchmark
+
+This script measures how much the payload selector of a search changes the
+response size and latency, on synthetic documents with a long `content` text
+and a precomputed `summary`:
+1. Full payload (what the tutorials fetched before)
+2. Everything except `content`
+3. Only the fields a result list shows: title, category, tags and summary
+
+Response size is measured as the JSON encoding of the returned points.
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+from qdrant_client.http import models
+
+from benchmark_suite import NUM_CATEGORIES, environment_info, latency_summary
+from collection_status import INDEX_START_TIMEOUT, wait_until_indexed
+from benchmark_transport import random_vectors
+from parallel_upload import upload_points
+from payload_projection import SUMMARY_FIELD, payload_selector, summarize
+from qdrant_connection import create_client
+
+SELECTORS = {
+    "full": payload_selector(),
+    "exclude_content": payload_selector(exclude=["content"]),
+    "hot_fields": payload_selector(include=["title", "category", "tags", SUMMARY_FIELD]),
+}
+
+# Vocabulary the synthetic document texts are drawn from
+WORDS = ("vector", "database", "search", "index", "query", "payload", "filter", "embedding",
+         "similarity", "cluster", "shard", "segment", "graph", "neighbor", "distance", "score")
+
+
+def synthetic_documents(num_points, vector_size, content_words, seed=42):
+    """
+    Generate points with document-like payloads.
+
+    Yields:
+        PointStruct objects with title, category, tags, content and summary payload fields
+    """
+    rng = np.random.default_rng(seed)
+    vectors = random_vectors(num_points, vector_size, rng)
+    for point_id, vector in enumerate(vectors):
+        content = " ".join(rng.choice(WORDS, size=content_words))
+        yield models.PointStruct(
+            id=point_id,
+            vector=vector.tolist(),
+            payload={
+                "title": f"Document {point_id}",
+                "category": f"category_{point_id % NUM_CATEGORIES}",
+                "tags": [str(tag) for tag in rng.choice(WORDS, size=3, replace=False)],
+                "content": content,
+                SUMMARY_FIELD: summarize(content)
+            }
+        )
+
+
+def measure(client, collection_name, queries, with_payload, limit=10):
+    """Run every query with one payload selector and measure latency and response size."""
+    latencies = []
+    response_bytes = 0
+    start = time.perf_counter()
+    for query in queries:
+        request_start = time.perf_counter()
+        results = client.search(
+            collection_name=collection_name,
+            query_vector=query.tolist(),
+            with_payload=with_payload,
+            limit=limit
+        )
+        latencies.append((time.perf_counter() - request_start) * 1000)
+        response_bytes += len(json.dumps([result.model_dump(mode="json") for result in results]))
+    summary = latency_summary(latencies, time.perf_counter() - start)
+    summary["bytes_per_response"] = response_bytes / len(queries)
+    return summary
+
+
+def compare(client, num_points, vector_size, content_words, num_searches=200, limit=10, seed=42,
+            collection_name="payload_projection_benchmark"):
+    """
+    Compare the payload selectors on the same collection and queries.
+
+    Returns:
+        List of result dictionaries, one per selector
+    """
+    if client.collection_exists(collection_name=collection_name):
+        client.delete_collection(collection_name=collection_name)
+    client.create_collection(
+        collection_name=collection_name,
+        vectors_config=models.VectorParams(
+            size=vector_size,
+            distance=models.Distance.COSINE
+        )
+    )
+    upload_points(
+        client,
+        collection_name,
+        synthetic_documents(num_points, vector_size, content_words, seed=seed),
+        progress=None
+    )
+    wait_until_indexed(client, collection_name, start_timeout=INDEX_START_TIMEOUT)
+
+    queries = random_vectors(num_searches, vector_size, np.random.default_rng(seed + 1))
+    results = []
+    for name, selector in SELECTORS.items():
+        summary = measure(client, collection_name, queries, selector, limit=limit)
+        results.append({
+            "selector": name,
+            "limit": limit,
+            "bytes_per_response": summary["bytes_per_response"],
+            "p50_ms": summary["p50_ms"],
+            "p99_ms": summary["p99_ms"],
+            "qps": summary["qps"]
+        })
+
+    client.delete_collection(collection_name=collection_name)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare search response size and latency across payload selectors")
+    parser.add_argument("--points", type=int, default=10000, help="Number of points")
+    parser.add_argument("--vector-size", type=int, default=384, help="Vector size")
+    parser.add_argument("--content-words", type=int, default=300, help="Words in each document's content")
+    parser.add_argument("--searches", type=int, default=200, help="Number of searches per selector")
+    parser.add_argument("--limit", type=int, default=10, help="Results per search")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    args = parser.parse_args()
+
+    print("Qdrant Payload Projection Benchmark")
+    print("===================================\n")
+    print(f"Corpus: {args.points} points, {args.vector_size}-d vectors, {args.content_words} words of content\n")
+
+    client = create_client()
+    results = compare(client, args.points, args.vector_size, args.content_words,
+                      num_searches=args.searches, limit=args.limit, seed=args.seed)
+
+    print(f"{'selector':>16} {'KB/response':>12} {'p50 ms':>8} {'p99 ms':>8} {'QPS':>8}")
+    for result in results:
+        print(f"{result['selector']:>16} {result['bytes_per_response'] / 1024:>12.2f} "
+              f"{result['p50_ms']:>8.2f} {result['p99_ms']:>8.2f} {result['qps']:>8.0f}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"environment": environment_info(client), "results": results}, f, indent=2)
+        print(f"\nResults written to {args.output}")
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Qdrant Dimensionality Reduction Benchmark
+
+This script reports how much recall PCA and prefix truncation give up
+against the full-dimension vectors, across output dimensions:
+1. The PCA is fitted on a sample of the corpus, as dimension_reduction.py does
+2. Ground truth is the exact cosine top-k over the full vectors
+3. Each projection's exact top-k over the projected vectors is compared to it,
+   so the numbers isolate the projection loss from HNSW approximation
+4. Vector memory and brute-force scoring time are reported for each dimension
+
+By default the vectors of the `documents` collection are used; a corpus
+file embedded with the model, or a synthetic corpus, can be used instead.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from dimension_reduction import fit_pca, sample_rows, truncation
+from embeddings import DEFAULT_MODEL_NAME, encode_corpus, load_model
+from ingest_pipeline import read_records
+from recall_evaluation import (add_benchmark_arguments, exact_top_k, load_corpus, normalize, perturbed_queries,
+                               recall_at_k, write_results)
+
+DEFAULT_DIMENSIONS = [32, 64, 128, 192, 256]
+
+
+def synthetic_embeddings(num_points, vector_size, rng):
+    """
+    Generate unit vectors whose variance decays across directions, like real embeddings.
+
+    (Isotropic random vectors cannot be compressed by any projection.)
+    """
+    spectrum = 1.0 / np.sqrt(np.arange(1, vector_size + 1))
+    rotation, _ = np.linalg.qr(rng.normal(size=(vector_size, vector_size)))
+    vectors = (rng.normal(size=(num_points, vector_size)) * spectrum) @ rotation
+    return normalize(vectors).astype(np.float32)
+
+
+def timed_top_k(corpus, queries, k):
+    """Exact top-k and the seconds it took to score every query against the corpus."""
+    start = time.perf_counter()
+    neighbors = exact_top_k(corpus, queries, k)
+    return neighbors, time.perf_counter() - start
+
+
+def compare(corpus, queries, k, dimensions, sample_size=20000, seed=42):
+    """
+    Compare PCA and truncation at every dimension against the full vectors.
+
+    Returns:
+        List of result dictionaries, the full-dimension baseline first
+    """
+    exact, full_seconds = timed_top_k(corpus, queries, k)
+    results = [{
+        "mode": "full",
+        "dimension": corpus.shape[1],
+        "recall": 1.0,
+        "explained_variance": 1.0,
+        "vector_bytes": corpus.shape[0] * corpus.shape[1] * 4,
+        "scoring_seconds": full_seconds
+    }]
+
+    sample = sample_rows(corpus, sample_size, seed=seed)
+    for dimension in dimensions:
+        if dimension >= corpus.shape[1]:
+            continue
+        projections = [truncation(corpus.shape[1], dimension)]
+        if dimension <= min(sample.shape):
+            projections.append(fit_pca(sample, dimension))
+
+        for projection in projections:
+            found, seconds = timed_top_k(projection.apply(corpus), projection.apply(queries), k)
+            results.append({
+                "mode": projection.kind,
+                "dimension": dimension,
+                "recall": recall_at_k(found.tolist(), exact),
+                "explained_variance": projection.explained_variance,
+                "vector_bytes": corpus.shape[0] * dimension * 4,
+                "scoring_seconds": seconds
+            })
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recall of PCA and truncated vectors against full-dimension vectors")
+    add_benchmark_arguments(parser, queries=200)
+    parser.add_argument("--corpus", help="Embed this JSONL/CSV/Parquet file instead")
+    parser.add_argument("--text-field", default="content", help="Field of --corpus records to embed")
+    parser.add_argument("--model", default=DEFAULT_MODEL_NAME, help="Model used to embed --corpus")
+    parser.add_argument("--dims", type=int, nargs="+", default=DEFAULT_DIMENSIONS, help="Output dimensions")
+    parser.add_argument("--sample-size", type=int, default=20000, help="Embeddings the PCA is fitted on")
+    args = parser.parse_args()
+
+    print("Qdrant Dimensionality Reduction Benchmark")
+    print("=========================================\n")
+
+    rng = np.random.default_rng(args.seed)
+    if args.corpus and not args.synthetic_points:
+        texts = [str(record[args.text_field]) for record in read_records(args.corpus)]
+        corpus = normalize(encode_corpus(load_model(args.model), texts))
+        print(f"Corpus: {len(corpus)} embeddings of {args.corpus}")
+    else:
+        corpus = load_corpus(args, rng, synthetic=synthetic_embeddings)
+    queries = perturbed_queries(corpus, args.queries, rng)
+
+    results = compare(corpus, queries, args.k, args.dims, sample_size=args.sample_size, seed=args.seed)
+
+    print(f"\n{'mode':>9} {'dim':>5} {'recall':>8} {'variance':>9} {'RAM MB':>8} {'scoring s':>10}")
+    for result in results:
+        variance = "-" if result["explained_variance"] is None else f"{result['explained_variance']:.3f}"
+        print(f"{result['mode']:>9} {result['dimension']:>5} {result['recall']:>8.4f} {variance:>9} "
+              f"{result['vector_bytes'] / 1024 ** 2:>8.2f} {result['scoring_seconds']:>10.3f}")
+
+    write_results(results, args.output)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Qdrant Quantization Benchmark
+
+This script compares float32, scalar int8 and binary quantized collections
+on the same vectors:
+1. Estimated RAM needed for the searchable vectors (see quantization.estimate_vector_memory)
+2. Recall@k against exact NumPy ground truth
+3. Search latency, across oversampling factors, with and without rescoring
+
+By default the vectors of the `documents` collection from the semantic
+search tutorial are used; a synthetic corpus can be used instead.
+"""
+
+import argparse
+
+import numpy as np
+from qdrant_client.http import models
+
+from collection_status import INDEX_START_TIMEOUT, wait_until_indexed
+from parallel_upload import upload_points
+from qdrant_connection import create_client
+from quantization import QUANTIZATION_MODES, estimate_vector_memory, quantization_config, search_params, vector_params
+from recall_evaluation import (add_benchmark_arguments, evaluate, exact_top_k, load_corpus, perturbed_queries,
+                               write_results)
+
+
+def build_collection(client, collection_name, corpus, mode):
+    """(Re)create a collection with the given quantization mode, upload the corpus and wait for the index."""
+    if client.collection_exists(collection_name=collection_name):
+        client.delete_collection(collection_name=collection_name)
+    client.create_collection(
+        collection_name=collection_name,
+        vectors_config=vector_params(corpus.shape[1], mode=mode),
+        quantization_config=quantization_config(mode),
+        # Small corpora would otherwise be served by a full scan of the
+        # original vectors, so every mode would measure the same search
+        hnsw_config=models.HnswConfigDiff(full_scan_threshold=10),
+        # Build the HNSW index and quantized vectors even for tiny collections
+        optimizers_config=models.OptimizersConfigDiff(indexing_threshold=1)
+    )
+    upload_points(
+        client,
+        collection_name,
+        (models.PointStruct(id=i, vector=vector.tolist()) for i, vector in enumerate(corpus)),
+        progress=None
+    )
+    wait_until_indexed(client, collection_name, start_timeout=INDEX_START_TIMEOUT)
+
+
+def compare(client, corpus, queries, k, oversampling_values, collection_name="quantization_benchmark"):
+    """
+    Compare every quantization mode on the same corpus and queries.
+
+    Returns:
+        List of result dictionaries, one per (mode, oversampling, rescore)
+    """
+    exact = exact_top_k(corpus, queries, k)
+    results = []
+
+    for mode in QUANTIZATION_MODES:
+        build_collection(client, collection_name, corpus, mode)
+
+        if mode == "none":
+            settings = [(None, None)]
+        else:
+            settings = [(oversampling, rescore) for oversampling in oversampling_values for rescore in (False, True)]
+
+        for oversampling, rescore in settings:
+            params = None if mode == "none" else search_params(oversampling=oversampling, rescore=rescore)
+            summary = evaluate(client, collection_name, queries, exact, params)
+            results.append({
+                "mode": mode,
+                "oversampling": oversampling,
+                "rescore": rescore,
+                "k": exact.shape[1],
+                "recall": summary["recall"],
+                "p50_ms": summary["p50_ms"],
+                "p99_ms": summary["p99_ms"],
+                "qps": summary["qps"],
+                "estimated_vector_ram_bytes": estimate_vector_memory(len(corpus), corpus.shape[1], mode)
+            })
+
+    client.delete_collection(collection_name=collection_name)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare float32, scalar and binary quantization")
+    add_benchmark_arguments(parser)
+    parser.add_argument("--oversampling", type=float, nargs="+", default=[1.0, 2.0, 4.0], help="Oversampling factors")
+    args = parser.parse_args()
+
+    print("Qdrant Quantization Benchmark")
+    print("=============================\n")
+
+    client = create_client()
+    rng = np.random.default_rng(args.seed)
+    corpus = load_corpus(args, rng, client=client)
+    queries = perturbed_queries(corpus, args.queries, rng)
+
+    results = compare(client, corpus, queries, args.k, args.oversampling)
+
+    print(f"{'mode':>7} {'oversampling':>12} {'rescore':>8} {'recall':>8} {'p50 ms':>8} {'p99 ms':>8} "
+          f"{'est. RAM MB':>11}")
+    for result in results:
+        oversampling = "-" if result["oversampling"] is None else f"{result['oversampling']:.1f}"
+        rescore = "-" if result["rescore"] is None else str(result["rescore"])
+        print(f"{result['mode']:>7} {oversampling:>12} {rescore:>8} {result['recall']:>8.4f} "
+              f"{result['p50_ms']:>8.2f} {result['p99_ms']:>8.2f} "
+              f"{result['estimated_vector_ram_bytes'] / 1024 ** 2:>11.2f}")
+
+    write_results(results, args.output)
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Qdrant Ingest and Search Benchmark Suite
+
+This script measures Qdrant performance on reproducible synthetic data, from
+the 4-d toy vectors of the basic tutorial up to millions of 384-d vectors:
+1. Upsert throughput (points/sec)
+2. Time until the collection is fully indexed
+3. Search QPS and p50/p95/p99 latency, with and without a payload filter
+
+Results are written as JSON together with the client, server and collection
+settings, so runs can be compared across versions and configurations.
+"""
+
+import argparse
+import json
+import platform
+import time
+from importlib.metadata import version
+
+import numpy as np
+from qdrant_client.http import models
+
+from benchmark_transport import random_vectors
+from collection_status import INDEX_START_TIMEOUT, wait_until_indexed
+from parallel_upload import upload_points
+from qdrant_connection import connection_settings, create_client
+
+# (number of points, vector size) for each named corpus
+PRESETS = {
+    "toy": (1000, 4),
+    "small": (10000, 384),
+    "medium": (100000, 384),
+    "large": (1000000, 384),
+    "xlarge": (5000000, 384),
+}
+
+# Number of distinct values of the "category" payload field;
+# filtering on one category selects 1 / NUM_CATEGORIES of the corpus
+NUM_CATEGORIES = 10
+
+
+def synthetic_points(num_points, vector_size, seed=42, chunk_size=10000):
+    """
+    Generate a reproducible synthetic corpus without holding it in memory.
+
+    Payloads mirror the basic tutorial: a keyword "category", an integer
+    "read_time" and a float "popularity".
+
+    Yields:
+        PointStruct objects with IDs 0 .. num_points - 1
+    """
+    rng = np.random.default_rng(seed)
+    for start in range(0, num_points, chunk_size):
+        count = min(chunk_size, num_points - start)
+        vectors = random_vectors(count, vector_size, rng)
+        read_times = rng.integers(1, 30, size=count)
+        popularity = rng.random(count)
+        for i in range(count):
+            point_id = start + i
+            yield models.PointStruct(
+                id=point_id,
+                vector=vectors[i].tolist(),
+                payload={
+                    "category": f"category_{point_id % NUM_CATEGORIES}",
+                    "read_time": int(read_times[i]),
+                    "popularity": float(popularity[i])
+                }
+            )
+
+
+def latency_summary(latencies_ms, elapsed_seconds):
+    """Summarize a list of request latencies in milliseconds."""
+    return {
+        "requests": len(latencies_ms),
+        "qps": len(latencies_ms) / elapsed_seconds if elapsed_seconds else 0.0,
+        "p50_ms": float(np.percentile(latencies_ms, 50)),
+        "p95_ms": float(np.percentile(latencies_ms, 95)),
+        "p99_ms": float(np.percentile(latencies_ms, 99))
+    }
+
+
+def time_searches(client, collection_name, queries, limit=10, query_filter=None, search_params=None):
+    """Run one search per query vector and summarize the latencies."""
+    latencies = []
+    start = time.perf_counter()
+    for query in queries:
+        request_start = time.perf_counter()
+        client.search(
+            collection_name=collection_name,
+            query_vector=query.tolist(),
+            query_filter=query_filter,
+            search_params=search_params,
+            limit=limit
+        )
+        latencies.append((time.perf_counter() - request_start) * 1000)
+    return latency_summary(latencies, time.perf_counter() - start)
+
+
+def run_benchmark(client, num_points, vector_size, num_searches=1000, batch_size=256,
+                  parallel=4, seed=42, collection_name="benchmark_synthetic"):
+    """
+    Run the full ingest and search benchmark on a synthetic corpus.
+
+    Args:
+        client: QdrantClient connected to the server
+        num_points: Number of points in the corpus
+        vector_size: Dimension of the vectors
+        num_searches: Number of searches per search scenario
+        batch_size: Points per upsert request
+        parallel: Number of parallel upload workers
+        seed: Random seed for the corpus and the queries
+        collection_name: Name of the (re)created benchmark collection
+
+    Returns:
+        Dictionary with the ingest and search measurements
+    """
+    if client.collection_exists(collection_name=collection_name):
+        client.delete_collection(collection_name=collection_name)
+    client.create_collection(
+        collection_name=collection_name,
+        vectors_config=models.VectorParams(
+            size=vector_size,
+            distance=models.Distance.COSINE
+        )
+    )
+
+    upload_stats = upload_points(
+        client,
+        collection_name,
+        synthetic_points(num_points, vector_size, seed=seed),
+        batch_size=batch_size,
+        parallel=parallel,
+        progress=None
+    )
+    index_seconds = wait_until_indexed(client, collection_name, start_timeout=INDEX_START_TIMEOUT)
+
+    queries = random_vectors(num_searches, vector_size, np.random.default_rng(seed + 1))
+    category_filter = models.Filter(
+        must=[
+            models.FieldCondition(
+                key="category",
+                match=models.MatchValue(value="category_0")
+            )
+        ]
+    )
+
+    collection_config = client.get_collection(collection_name=collection_name).config
+
+    results = {
+        "points": num_points,
+        "vector_size": vector_size,
+        "upsert": {
+            "seconds": upload_stats["seconds"],
+            "points_per_second": upload_stats["points_per_second"],
+            "batch_size": batch_size,
+            "parallel": parallel
+        },
+        "index_seconds": index_seconds,
+        "collection_config": collection_config.model_dump(mode="json"),
+        "search": time_searches(client, collection_name, queries),
+        "filtered_search": time_searches(client, collection_name, queries, query_filter=category_filter)
+    }
+
+    client.delete_collection(collection_name=collection_name)
+    return results
+
+
+def environment_info(client):
+    """Collect the versions and settings a run should be compared against."""
+    settings = connection_settings()
+    try:
+        server_version = client.info().version
+    except Exception:
+        server_version = None
+    return {
+        "client_version": version("qdrant-client"),
+        "server_version": server_version,
+        "transport": "local" if settings["location"] else ("grpc" if settings["prefer_grpc"] else "rest"),
+        "python_version": platform.python_version(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z")
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark Qdrant ingest and search on synthetic data")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="toy", help="Corpus size preset")
+    parser.add_argument("--points", type=int, help="Number of points (overrides the preset)")
+    parser.add_argument("--vector-size", type=int, help="Vector size (overrides the preset)")
+    parser.add_argument("--searches", type=int, default=1000, help="Number of searches per scenario")
+    parser.add_argument("--batch-size", type=int, default=256, help="Points per upsert request")
+    parser.add_argument("--parallel", type=int, default=4, help="Number of parallel upload workers")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON file for the results")
+    args = parser.parse_args()
+
+    num_points, vector_size = PRESETS[args.preset]
+    num_points = args.points or num_points
+    vector_size = args.vector_size or vector_size
+
+    print("Qdrant Ingest and Search Benchmark")
+    print("==================================\n")
+    print(f"Corpus: {num_points} points, {vector_size}-d vectors\n")
+
+    client = create_client()
+    report = {
+        "environment": environment_info(client),
+        "results": run_benchmark(
+            client,
+            num_points=num_points,
+            vector_size=vector_size,
+            num_searches=args.searches,
+            batch_size=args.batch_size,
+            parallel=args.parallel,
+            seed=args.seed
+        )
+    }
+
+    results = report["results"]
+    print(f"Upsert: {results['upsert']['points_per_second']:.0f} points/sec")
+    if results["index_seconds"] is None:
+        print("Indexing did not finish before the timeout")
+    else:
+        print(f"Indexed after: {results['index_seconds']:.2f}s")
+    for scenario in ("search", "filtered_search"):
+        stats = results[scenario]
+        print(f"{scenario}: {stats['qps']:.0f} QPS, p50 {stats['p50_ms']:.2f} ms, "
+              f"p95 {stats['p95_ms']:.2f} ms, p99 {stats['p99_ms']:.2f} ms")
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Qdrant REST vs gRPC Transport Benchmark
+
+This script compares the REST/JSON and gRPC interfaces of a running Qdrant
+server across vector sizes, from the 4-d toy vectors of the basic tutorial
+up to the 384-d MiniLM vectors of the semantic search tutorial:
+1. Upsert throughput (points/sec)
+2. Search latency (p50 and p99 in milliseconds)
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+from qdrant_client.http import models
+
+from qdrant_connection import create_client, is_local_client
+
+DEFAULT_VECTOR_SIZES = [4, 128, 384]
+
+
+def random_vectors(count, vector_size, rng):
+    """Generate unit-length random float32 vectors."""
+    vectors = rng.standard_normal((count, vector_size)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def benchmark_transport(prefer_grpc, vector_size, num_points, num_searches, batch_size, api_key=None, seed=42):
+    """
+    Measure upsert throughput and search latency for one transport and vector size.
+
+    Returns:
+        Dictionary with the transport, vector size and measured numbers
+    """
+    rng = np.random.default_rng(seed)
+    client = create_client(api_key=api_key, prefer_grpc=prefer_grpc)
+    transport = "grpc" if prefer_grpc else "rest"
+    collection_name = f"benchmark_{transport}_{vector_size}"
+
+    if client.collection_exists(collection_name=collection_name):
+        client.delete_collection(collection_name=collection_name)
+    client.create_collection(
+        collection_name=collection_name,
+        vectors_config=models.VectorParams(
+            size=vector_size,
+            distance=models.Distance.COSINE
+        )
+    )
+
+    # Upsert throughput
+    vectors = random_vectors(num_points, vector_size, rng)
+    start = time.perf_counter()
+    for offset in range(0, num_points, batch_size):
+        batch = vectors[offset:offset + batch_size]
+        client.upsert(
+            collection_name=collection_name,
+            points=[
+                models.PointStruct(
+                    id=offset + i,
+                    vector=vector.tolist(),
+                    payload={"group": (offset + i) % 10}
+                )
+                for i, vector in enumerate(batch)
+            ]
+        )
+    upsert_seconds = time.perf_counter() - start
+
+    # Search latency
+    queries = random_vectors(num_searches, vector_size, rng)
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        client.search(
+            collection_name=collection_name,
+            query_vector=query.tolist(),
+            limit=10
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    client.delete_collection(collection_name=collection_name)
+    # A local client is shared by every create_client() call of the process;
+    # only a remote client belongs to this benchmark alone
+    if not is_local_client(client):
+        client.close()
+
+    return {
+        "transport": transport,
+        "vector_size": vector_size,
+        "points": num_points,
+        "upsert_points_per_second": num_points / upsert_seconds,
+        "search_p50_ms": float(np.percentile(latencies, 50)),
+        "search_p99_ms": float(np.percentile(latencies, 99))
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare Qdrant REST and gRPC transports")
+    parser.add_argument("--vector-sizes", type=int, nargs="+", default=DEFAULT_VECTOR_SIZES,
+                        help="Vector sizes to benchmark (space-separated)")
+    parser.add_argument("--points", type=int, default=10000, help="Number of points to upsert")
+    parser.add_argument("--searches", type=int, default=500, help="Number of searches to time")
+    parser.add_argument("--batch-size", type=int, default=256, help="Points per upsert request")
+    parser.add_argument("--api-key", help="API key (defaults to QDRANT_API_KEY)")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    args = parser.parse_args()
+
+    print("Qdrant REST vs gRPC Transport Benchmark")
+    print("=======================================\n")
+
+    results = []
+    for vector_size in args.vector_sizes:
+        for prefer_grpc in (False, True):
+            result = benchmark_transport(
+                prefer_grpc=prefer_grpc,
+                vector_size=vector_size,
+                num_points=args.points,
+                num_searches=args.searches,
+                batch_size=args.batch_size,
+                api_key=args.api_key
+            )
+            results.append(result)
+            print(f"{result['transport']:>4} {vector_size:>4}-d: "
+                  f"upsert {result['upsert_points_per_second']:>9.0f} points/sec, "
+                  f"search p50 {result['search_p50_ms']:.2f} ms, "
+                  f"p99 {result['search_p99_ms']:.2f} ms")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Qdrant Tutorial Bulk Deletion
+
+This module deletes every point matching a filter without stalling other
+writes, which one blocking delete-by-filter call over millions of points does:
+1. Matching IDs are resolved with a streaming scroll (IDs only, no payload or vectors)
+2. They are deleted in fixed-size batches sent with wait=False, optionally
+   rate-limited to a number of points per second
+3. Progress is reported while the job runs; a write barrier that reaches
+   every shard ends the job, so every delete has been applied when it returns
+4. Optionally, the optimizers are triggered afterwards and awaited, so the
+   segments left fragmented by the deletions are vacuumed and merged
+
+Usage:
+    python bulk_delete.py --collection articles --field author --value "Lisa Chen" --rate 5000 --optimize
+"""
+
+import argparse
+import time
+
+from qdrant_client.http import models
+
+from collection_status import wait_until_indexed
+from parallel_upload import batched
+from qdrant_connection import create_client, is_local_client
+from scroll_points import scroll_points
+from write_pipeline import write_barrier
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def print_delete_progress(stats):
+    """Default progress callback printing the deletion throughput."""
+    total = f" of {stats['total']}" if stats["total"] is not None else ""
+    print(f"  Deleted {stats['deleted']}{total} points ({stats['points_per_second']:.0f} points/sec)")
+
+
+def delete_by_filter(client, collection_name, delete_filter, batch_size=DEFAULT_BATCH_SIZE,
+                     max_points_per_second=None, count_first=True, optimize=False, optimize_timeout=3600,
+                     optimize_start_timeout=10.0, report_every=5.0, progress=print_delete_progress):
+    """
+    Delete all points matching a filter in rate-limited batches.
+
+    The scroll pages by point ID, so deleting the points already scrolled
+    past never makes the scroll skip or repeat any. An interrupted job can
+    simply be run again: it resolves only the points that are still left.
+
+    Args:
+        client: QdrantClient connected to the server
+        collection_name: Name of the collection
+        delete_filter: models.Filter selecting the points to delete
+        batch_size: Point IDs per scroll page and per delete request
+        max_points_per_second: Upper bound on the deletion rate (None for no limit)
+        count_first: Count the matching points first, so progress shows a total
+        optimize: Trigger the optimizers after deleting and wait until they finish
+        optimize_timeout: Seconds to wait for the optimizers
+        optimize_start_timeout: Seconds to wait for the optimizers to start
+            before an unchanged GREEN status is taken as nothing to do
+        report_every: Seconds between progress reports
+        progress: Callback receiving the current stats (None to disable)
+
+    Returns:
+        Dictionary with the matching total (None if not counted), the points
+        and batches deleted, the seconds and points per second, the last
+        operation ID, and the seconds spent optimizing (None if skipped or timed out)
+    """
+    start = time.perf_counter()
+    stats = {"total": None, "deleted": 0, "batches": 0, "seconds": 0.0, "points_per_second": 0.0,
+             "operation_id": None, "optimize_seconds": None}
+    if count_first:
+        stats["total"] = client.count(collection_name=collection_name, count_filter=delete_filter,
+                                      exact=True).count
+    last_report = start
+
+    def send(batch):
+        nonlocal last_report
+        result = client.delete(
+            collection_name=collection_name,
+            points_selector=models.PointIdsList(points=batch),
+            wait=False
+        )
+        stats["operation_id"] = result.operation_id
+        stats["deleted"] += len(batch)
+        stats["batches"] += 1
+
+        now = time.perf_counter()
+        if max_points_per_second:
+            # Sleep until the average rate since the start is back under the limit
+            ahead = stats["deleted"] / max_points_per_second - (now - start)
+            if ahead > 0:
+                time.sleep(ahead)
+                now = time.perf_counter()
+
+        stats["seconds"] = now - start
+        stats["points_per_second"] = stats["deleted"] / stats["seconds"] if stats["seconds"] else 0.0
+        if progress and now - last_report >= report_every:
+            last_report = now
+            progress(dict(stats))
+
+    point_ids = (
+        record.id
+        for record in scroll_points(client, collection_name, page_size=batch_size, with_payload=False,
+                                    with_vectors=False, scroll_filter=delete_filter)
+    )
+
+    for batch in batched(point_ids, batch_size):
+        send(batch)
+
+    # The batches went to whichever shards own their IDs; the barrier
+    # reaches every shard, so it returns once all of them are applied
+    if stats["batches"]:
+        write_barrier(client, collection_name)
+
+    # Local mode has no optimizers to trigger or wait for
+    if optimize and not is_local_client(client):
+        # An empty optimizer config update makes the server re-check its segments
+        client.update_collection(collection_name=collection_name, optimizers_config=models.OptimizersConfigDiff())
+        stats["optimize_seconds"] = wait_until_indexed(client, collection_name, timeout=optimize_timeout,
+                                                       start_timeout=optimize_start_timeout)
+
+    stats["seconds"] = time.perf_counter() - start
+    stats["points_per_second"] = stats["deleted"] / stats["seconds"] if stats["seconds"] else 0.0
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Delete all points whose payload field matches a value")
+    parser.add_argument("--collection", required=True, help="Collection to delete from")
+    parser.add_argument("--field", required=True, help="Payload field to match")
+    parser.add_argument("--value", required=True, help="Keyword value to match")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Points per delete request")
+    parser.add_argument("--rate", type=float, help="Maximum points deleted per second")
+    parser.add_argument("--optimize", action="store_true", help="Trigger and wait for optimization afterwards")
+    args = parser.parse_args()
+
+    print("Qdrant Bulk Deletion")
+    print("====================\n")
+
+    stats = delete_by_filter(
+        create_client(),
+        args.collection,
+        models.Filter(must=[models.FieldCondition(key=args.field, match=models.MatchValue(value=args.value))]),
+        batch_size=args.batch_size,
+        max_points_per_second=args.rate,
+        optimize=args.optimize
+    )
+
+    print(f"\nDeleted {stats['deleted']} points in {stats['batches']} batches "
+          f"({stats['points_per_second']:.0f} points/sec).")
+    if args.optimize:
+        if stats["optimize_seconds"] is None:
+            print("Optimization did not finish before the timeout.")
+        else:
+            print(f"Optimization finished in {stats['optimize_seconds']:.1f}s.")
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Qdrant Tutorial Client Pool
+
+This module shares Qdrant clients between callers instead of building a new
+client for every key and every request:
+1. Clients are keyed by (host, port, api_key, transport)
+2. Each client keeps a pool of keep-alive HTTP connections (and one
+   multiplexed gRPC channel), so repeated calls reuse warm connections
+3. Pool size and timeouts are configurable
+4. Lookups are thread-safe, so one pool can serve a multi-tenant service
+"""
+
+import threading
+
+import httpx
+
+from qdrant_connection import connection_settings, create_client
+
+
+class ClientPool:
+    """Thread-safe pool of Qdrant clients keyed by connection target and API key."""
+
+    def __init__(self, pool_size=10, timeout=10, keepalive_expiry=30.0):
+        """
+        Create an empty client pool.
+
+        Args:
+            pool_size: Maximum number of HTTP connections per client
+            timeout: Request timeout in seconds
+            keepalive_expiry: Seconds an idle connection is kept open
+        """
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.keepalive_expiry = keepalive_expiry
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def get(self, api_key=None, prefer_grpc=None):
+        """
+        Return the shared client for an API key, creating it on first use.
+
+        Args:
+            api_key: API key to use (None to fall back to QDRANT_API_KEY)
+            prefer_grpc: Force the transport (None to fall back to QDRANT_PREFER_GRPC)
+
+        Returns:
+            A QdrantClient shared by every caller with the same key
+        """
+        settings = connection_settings(api_key=api_key, prefer_grpc=prefer_grpc)
+        if settings["location"]:
+            # Local mode has no connections or keys; every caller shares one client
+            key = (settings["location"], None, None, "local")
+        else:
+            transport = "grpc" if settings["prefer_grpc"] else "rest"
+            port = settings["grpc_port"] if settings["prefer_grpc"] else settings["port"]
+            key = (settings["host"], port, settings["api_key"], transport)
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = create_client(
+                    api_key=settings["api_key"],
+                    prefer_grpc=settings["prefer_grpc"],
+                    timeout=self.timeout,
+                    # The client disables keep-alive for localhost by default,
+                    # so the limits are always passed explicitly
+                    limits=httpx.Limits(
+                        max_connections=self.pool_size,
+                        max_keepalive_connections=self.pool_size,
+                        keepalive_expiry=self.keepalive_expiry
+                    ),
+                    grpc_options={
+                        "grpc.keepalive_time_ms": int(self.keepalive_expiry * 1000)
+                    }
+                )
+                self._clients[key] = client
+            return client
+
+    def close(self):
+        """Close every pooled client and its connections."""
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
+
+    def __len__(self):
+        return len(self._clients)
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def get_client(api_key=None, prefer_grpc=None):
+    """
+    Return a client from the process-wide default pool.
+
+    Args:
+        api_key: API key to use (None to fall back to QDRANT_API_KEY)
+        prefer_grpc: Force the transport (None to fall back to QDRANT_PREFER_GRPC)
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = ClientPool()
+    return _default_pool.get(api_key=api_key, prefer_grpc=prefer_grpc)
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Qdrant Tutorial Collection Status
+
+This module waits for the background work of a collection's optimizers:
+1. Indexing and segment merging after large uploads
+2. Vacuuming after large deletions, once the optimizers have been triggered
+
+The status is GREEN when the optimizers are idle and YELLOW (or GREY, if they
+have not been triggered) while work is pending.
+"""
+
+import time
+
+from qdrant_client.http import models
+
+from qdrant_connection import is_local_client
+
+# Seconds benchmarks wait for the optimizers to pick up a fresh upload, so
+# they never measure the unindexed segments the upload left behind
+INDEX_START_TIMEOUT = 5.0
+
+
+def wait_until_indexed(client, collection_name, timeout=3600, poll_interval=0.5, start_timeout=0.0):
+    """
+    Wait until the collection's optimizers have finished.
+
+    Right after the optimizers are triggered the status can still read GREEN,
+    because they have not picked up the work yet. With start_timeout, the
+    status must first leave GREEN (or stay GREEN that long, meaning there
+    was nothing to do) before a GREEN status counts as finished.
+
+    Args:
+        client: QdrantClient connected to the server
+        collection_name: Name of the collection
+        timeout: Maximum seconds to wait in total
+        poll_interval: Seconds between status checks
+        start_timeout: Seconds to wait for the optimizers to start
+
+    Returns:
+        Seconds waited, or None if the timeout expired
+    """
+    # Local mode has no optimizers; searches are always exact
+    if is_local_client(client):
+        return 0.0
+
+    start = time.perf_counter()
+    started = start_timeout <= 0
+    while time.perf_counter() - start < timeout:
+        status = client.get_collection(collection_name=collection_name).status
+        if status != models.CollectionStatus.GREEN:
+            started = True
+        elif started or time.perf_counter() - start >= start_timeout:
+            return time.perf_counter() - start
+        time.sleep(poll_interval)
+    return None
@@ -0,0 +1,3 @@
+# test_api_keys.py is a standalone script that needs a running, secured
+# Qdrant server, so pytest should not collect it
+collect_ignore = ["test_api_keys.py"]
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Qdrant Tutorial Dimensionality Reduction
+
+This module shortens embeddings before they are stored and searched, trading
+a little recall for less memory and faster distance computations:
+1. "pca" projects onto the top principal components fitted on a sample of
+   corpus embeddings
+2. "truncate" keeps a prefix of each vector (the Matryoshka approach, made
+   for models trained to front-load information)
+3. The fitted projection is saved next to the collection and wraps the
+   embedding model, so ingest and queries are always projected the same way
+
+Settings, read from environment variables:
+
+    QDRANT_PROJECTION      "none" (default), "pca" or "truncate"
+    QDRANT_PROJECTION_DIM  Output dimension (default: 128)
+    QDRANT_PROJECTION_DIR  Directory holding fitted projections (default: projections)
+
+Usage:
+    # Fit a PCA for "documents" on the vectors of a full-dimension collection
+    python dimension_reduction.py fit --collection documents --source-collection documents_full --dim 128
+"""
+
+import argparse
+import hashlib
+import os
+
+import numpy as np
+
+from embeddings import embedding_backend
+
+PROJECTION_MODES = ("none", "pca", "truncate")
+DEFAULT_DIMENSION = 128
+DEFAULT_PROJECTION_DIR = "projections"
+
+
+def projection_mode():
+    """Return the projection mode selected by QDRANT_PROJECTION."""
+    mode = os.environ.get("QDRANT_PROJECTION", "none").lower()
+    if mode not in PROJECTION_MODES:
+        raise ValueError(f"QDRANT_PROJECTION must be one of {', '.join(PROJECTION_MODES)}, got '{mode}'")
+    return mode
+
+
+def projection_dimension():
+    """Return the output dimension selected by QDRANT_PROJECTION_DIM."""
+    return int(os.environ.get("QDRANT_PROJECTION_DIM", DEFAULT_DIMENSION))
+
+
+def projection_path(collection_name):
+    """Path of the projection file belonging to a collection."""
+    directory = os.environ.get("QDRANT_PROJECTION_DIR", DEFAULT_PROJECTION_DIR)
+    return os.path.join(directory, f"{collection_name}.projection.npz")
+
+
+def _normalize(vectors):
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.clip(norms, 1e-12, None)
+
+
+class Projection:
+    """A fitted linear projection from the model's dimension to a smaller one."""
+
+    def __init__(self, kind, input_dimension, dimension, mean=None, components=None, explained_variance=None):
+        self.kind = kind
+        self.input_dimension = input_dimension
+        self.dimension = dimension
+        self.mean = mean
+        self.components = components
+        self.explained_variance = explained_variance
+
+    @property
+    def tag(self):
+        """
+        Short description, e.g. "truncate64" or "pca128-3f9a0c1e", used to key caches of projected vectors.
+
+        A PCA re-fitted at the same dimension produces different vectors, so
+        its tag ends with a digest of the fitted mean and components.
+        """
+        if self.kind != "pca":
+            return f"{self.kind}{self.dimension}"
+        digest = hashlib.blake2b(digest_size=4)
+        for array in (self.mean, self.components):
+            digest.update(np.ascontiguousarray(array, dtype=np.float32).tobytes())
+        return f"{self.kind}{self.dimension}-{digest.hexdigest()}"
+
+    def apply(self, vectors):
+        """
+        Project one vector or a matrix of vectors, then renormalize to unit length.
+
+        Renormalizing keeps cosine scores comparable to the full vectors.
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if self.kind == "truncate":
+            projected = vectors[..., :self.dimension]
+        else:
+            projected = (vectors - self.mean) @ self.components
+        return _normalize(projected).astype(np.float32)
+
+    def save(self, path):
+        """Write the projection to an .npz file."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        arrays = {"kind": self.kind, "input_dimension": self.input_dimension, "dimension": self.dimension}
+        if self.kind == "pca":
+            arrays.update(mean=self.mean, components=self.components, explained_variance=self.explained_variance)
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        """Read a projection written by save."""
+        with np.load(path) as data:
+            kind = str(data["kind"])
+            return cls(
+                kind,
+                int(data["input_dimension"]),
+                int(data["dimension"]),
+                mean=data["mean"] if kind == "pca" else None,
+                components=data["components"] if kind == "pca" else None,
+                explained_variance=float(data["explained_variance"]) if kind == "pca" else None
+            )
+
+
+def fit_pca(embeddings, dimension):
+    """
+    Fit a PCA projection on a sample of corpus embeddings.
+
+    Args:
+        embeddings: Array of shape (num_samples, input_dimension)
+        dimension: Number of principal components to keep
+
+    Returns:
+        A Projection
+
+    Raises:
+        ValueError: If there are fewer samples than output dimensions
+    """
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    if dimension > min(embeddings.shape):
+        raise ValueError(f"A {dimension}-d PCA needs at least {dimension} samples "
+                         f"of dimension >= {dimension}, got {embeddings.shape}")
+
+    mean = embeddings.mean(axis=0)
+    _, singular_values, vt = np.linalg.svd(embeddings - mean, full_matrices=False)
+    variance = singular_values ** 2
+    return Projection(
+        "pca",
+        embeddings.shape[1],
+        dimension,
+        mean=mean,
+        components=vt[:dimension].T.copy(),
+        explained_variance=float(variance[:dimension].sum() / variance.sum())
+    )
+
+
+def truncation(input_dimension, dimension):
+    """Projection keeping the first `dimension` components of each vector."""
+    if dimension > input_dimension:
+        raise ValueError(f"Cannot truncate {input_dimension}-d vectors to {dimension} dimensions")
+    return Projection("truncate", input_dimension, dimension)
+
+
+class ProjectedEmbedder:
+    """
+    Wraps an embedding model so every embedding it returns is projected.
+
+    Offers the same `encode` and `get_sentence_embedding_dimension` methods
+    as the wrapped model, so ingest and query code need no changes.
+    """
+
+    def __init__(self, model, projection):
+        """
+        Args:
+            model: A loaded embedding model
+            projection: Projection whose input dimension is the model's dimension
+
+        Raises:
+            ValueError: If the projection was fitted for another embedding dimension
+        """
+        model_dimension = model.get_sentence_embedding_dimension()
+        if projection.input_dimension != model_dimension:
+            raise ValueError(f"The projection expects {projection.input_dimension}-d embeddings, "
+                             f"but the model produces {model_dimension}-d embeddings")
+        self.model = model
+        self.projection = projection
+
+    def get_sentence_embedding_dimension(self):
+        return self.projection.dimension
+
+    def encode(self, sentences, **kwargs):
+        """Embed with the wrapped model and project the result."""
+        return self.projection.apply(self.model.encode(sentences, **kwargs))
+
+
+def apply_projection(model, collection_name, mode=None, dimension=None):
+    """
+    Wrap a model with the projection configured for a collection.
+
+    Truncations are created on the fly; PCA projections must have been
+    fitted first (see the `fit` command) and are loaded from projection_path.
+
+    Args:
+        model: A loaded embedding model
+        collection_name: Collection the projected vectors are stored in
+        mode: "none", "pca" or "truncate" (None to read QDRANT_PROJECTION)
+        dimension: Output dimension (None to read QDRANT_PROJECTION_DIM)
+
+    Returns:
+        The model itself when no projection is configured, otherwise a ProjectedEmbedder
+
+    Raises:
+        FileNotFoundError: If a PCA projection has not been fitted yet
+        ValueError: If the fitted projection expects another embedding dimension
+    """
+    mode = mode or projection_mode()
+    if mode == "none":
+        return model
+
+    if mode == "truncate":
+        projection = truncation(model.get_sentence_embedding_dimension(), dimension or projection_dimension())
+    else:
+        path = projection_path(collection_name)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No fitted PCA projection at '{path}'. "
+                                    f"Run: python dimension_reduction.py fit --collection {collection_name}")
+        projection = Projection.load(path)
+    return ProjectedEmbedder(model, projection)
+
+
+def embedding_key(model_name, model, backend=None):
+    """
+    Name identifying the vectors a (possibly projected) model produces, for caches.
+
+    Backends and projections produce different vectors for the same model
+    name, so both are part of the key, e.g. "onnx:all-MiniLM-L6-v2:pca128-3f9a0c1e".
+
+    Args:
+        model_name: Name the model was loaded with
+        model: The loaded (possibly projected) model
+        backend: Backend the model was loaded with (None to read QDRANT_EMBEDDER)
+    """
+    key = f"{embedding_backend(backend)}:{model_name}"
+    if isinstance(model, ProjectedEmbedder):
+        return f"{key}:{model.projection.tag}"
+    return key
+
+
+def sample_rows(vectors, sample_size, seed=42):
+    """Pick up to sample_size rows of a matrix at random."""
+    if len(vectors) <= sample_size:
+        return vectors
+    rows = np.random.default_rng(seed).choice(len(vectors), size=sample_size, replace=False)
+    return vectors[rows]
+
+
+if __name__ == "__main__":
+    from embeddings import DEFAULT_MODEL_NAME, encode_corpus, load_model
+    from ingest_pipeline import read_records
+    from qdrant_connection import create_client
+    from recall_evaluation import load_collection_vectors
+
+    parser = argparse.ArgumentParser(description="Fit a PCA projection for a collection")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    fit_parser = subparsers.add_parser("fit", help="Fit and save a PCA projection")
+    fit_parser.add_argument("--collection", required=True, help="Collection the projection belongs to")
+    fit_parser.add_argument("--dim", type=int, default=DEFAULT_DIMENSION, help="Output dimension")
+    fit_parser.add_argument("--sample-size", type=int, default=20000, help="Embeddings the PCA is fitted on")
+    fit_parser.add_argument("--source-collection", help="Full-dimension collection whose vectors the PCA "
+                                                        "is fitted on (defaults to --collection)")
+    fit_parser.add_argument("--corpus", help="Fit on embeddings of this JSONL/CSV/Parquet file instead of "
+                                             "the vectors of a collection")
+    fit_parser.add_argument("--text-field", default="content", help="Field of --corpus records to embed")
+    fit_parser.add_argument("--model", default=DEFAULT_MODEL_NAME, help="Model used to embed --corpus and whose native "
+                                                                    "dimension the source vectors must have")
+    args = parser.parse_args()
+
+    model = load_model(args.model)
+    if args.corpus:
+        texts = [str(record[args.text_field]) for record, _ in zip(read_records(args.corpus), range(args.sample_size))]
+        sample = encode_corpus(model, texts)
+    else:
+        source = args.source_collection or args.collection
+        sample = sample_rows(load_collection_vectors(create_client(), source), args.sample_size)
+        # A collection already holding projected vectors would fit a projection of a projection
+        native_dimension = model.get_sentence_embedding_dimension()
+        if sample.shape[1] != native_dimension:
+            parser.error(f"'{source}' holds {sample.shape[1]}-dimensional vectors, not the "
+                         f"{native_dimension} dimensions of {args.model}; pass a full-dimension "
+                         f"--source-collection or --corpus")
+
+    projection = fit_pca(sample, args.dim)
+    path = projection_path(args.collection)
+    projection.save(path)
+    print(f"Fitted a {projection.input_dimension} -> {projection.dimension} PCA on {len(sample)} embeddings "
+          f"({projection.explained_variance:.1%} of the variance kept)")
+    print(f"Saved to {path}")
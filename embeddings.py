@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Qdrant Tutorial Embedding Helpers
+
+This module contains helpers for turning text into vectors efficiently:
+1. Encoding a whole corpus in large, fixed-size batches
+2. Spreading the work across all CPU cores with a process pool
+3. Loading the embedding model from a pluggable backend: sentence-transformers
+   (default), ONNX Runtime (QDRANT_EMBEDDER=onnx) or a deterministic hashing
+   embedder for offline tests (QDRANT_EMBEDDER=hashing)
+"""
+
+import hashlib
+import os
+import re
+
+import numpy as np
+
+# Number of texts sent through the model in one forward pass
+DEFAULT_BATCH_SIZE = 64
+
+# Name of the model used throughout the tutorial
+DEFAULT_MODEL_NAME = "all-MiniLM-L6-v2"
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+class HashingEmbedder:
+    """
+    Deterministic, dependency-free stand-in for a SentenceTransformer model.
+
+    Every lowercased word (and word bigram) is hashed to a signed position in
+    the vector, and the result is normalized to unit length. Texts sharing
+    words get similar vectors, which is enough to exercise the tutorial flows
+    without downloading a model.
+    """
+
+    def __init__(self, vector_size=384):
+        self.vector_size = vector_size
+
+    def get_sentence_embedding_dimension(self):
+        return self.vector_size
+
+    def _embed(self, text):
+        vector = np.zeros(self.vector_size, dtype=np.float32)
+        tokens = TOKEN_PATTERN.findall(text.lower())
+        features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        for feature in features:
+            digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+            value = int.from_bytes(digest, "little")
+            sign = 1.0 if value & 1 else -1.0
+            vector[(value >> 1) % self.vector_size] += sign
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def encode(self, sentences, batch_size=DEFAULT_BATCH_SIZE, convert_to_numpy=True, show_progress_bar=False):
+        """Embed one text (returns a vector) or a list of texts (returns a matrix)."""
+        if isinstance(sentences, str):
+            return self._embed(sentences)
+        if not sentences:
+            return np.empty((0, self.vector_size), dtype=np.float32)
+        return np.stack([self._embed(text) for text in sentences])
+
+
+def _load_sentence_transformer(model_name):
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(model_name)
+
+
+def _load_onnx(model_name):
+    from onnx_embedder import load_onnx_embedder
+
+    return load_onnx_embedder(model_name)
+
+
+def _load_hashing(model_name):
+    return HashingEmbedder()
+
+
+# Embedding backends selectable with QDRANT_EMBEDDER. Each loader takes a
+# model name and returns an object with SentenceTransformer's `encode` and
+# `get_sentence_embedding_dimension` methods, which is all the ingest and
+# query paths rely on.
+EMBEDDING_BACKENDS = {
+    "sentence-transformers": _load_sentence_transformer,
+    "onnx": _load_onnx,
+    "hashing": _load_hashing,
+}
+
+DEFAULT_BACKEND = "sentence-transformers"
+
+
+def register_backend(name, loader):
+    """
+    Make an embedding backend selectable with QDRANT_EMBEDDER=<name>.
+
+    Args:
+        name: Backend name
+        loader: Function taking a model name and returning the embedder
+    """
+    EMBEDDING_BACKENDS[name.lower()] = loader
+
+
+def embedding_backend(backend=None):
+    """
+    Return the name of the embedding backend to use.
+
+    Args:
+        backend: Backend name (None to read QDRANT_EMBEDDER)
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    backend = (backend or os.environ.get("QDRANT_EMBEDDER") or DEFAULT_BACKEND).lower()
+    if backend not in EMBEDDING_BACKENDS:
+        raise ValueError(f"QDRANT_EMBEDDER must be one of {', '.join(EMBEDDING_BACKENDS)}, got '{backend}'")
+    return backend
+
+
+def load_model(model_name=DEFAULT_MODEL_NAME, backend=None):
+    """
+    Load the embedding model used by the tutorial scripts.
+
+    The backend is chosen with QDRANT_EMBEDDER: "sentence-transformers"
+    (default, PyTorch), "onnx" (ONNX Runtime on CPU, see onnx_embedder.py)
+    or "hashing" (a deterministic embedder, so the scripts run without
+    model downloads or network access).
+
+    Args:
+        model_name: Name of the SentenceTransformer model
+        backend: Backend name (None to read QDRANT_EMBEDDER)
+
+    Returns:
+        An object with SentenceTransformer's `encode` and
+        `get_sentence_embedding_dimension` methods
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    return EMBEDDING_BACKENDS[embedding_backend(backend)](model_name)
+
+
+def _has_gpu():
+    """Return True if PyTorch can see a CUDA device."""
+    try:
+        import torch
+    except ImportError:
+        return False
+    return torch.cuda.is_available()
+
+
+def encode_corpus(model, texts, batch_size=DEFAULT_BATCH_SIZE, num_workers=None):
+    """
+    Encode a whole corpus of texts in large batches.
+
+    On CPU-only hosts the texts are spread across a process pool with one
+    worker per core, so throughput grows with the number of cores. The pool
+    uses the "spawn" start method, so scripts that encode large corpora must
+    guard their entry point with `if __name__ == "__main__":`.
+
+    Args:
+        model: A loaded SentenceTransformer model
+        texts: Iterable of strings to encode
+        batch_size: Number of texts per forward pass
+        num_workers: Number of worker processes (None for one per CPU core
+            on CPU-only hosts, 1 to disable the process pool)
+
+    Returns:
+        A NumPy array with one embedding per input text
+    """
+    texts = list(texts)
+
+    if num_workers is None:
+        num_workers = 1 if _has_gpu() else (os.cpu_count() or 1)
+
+    # Starting the pool costs a model load per worker, so it only pays off
+    # once every worker gets at least one full batch
+    if (num_workers > 1 and len(texts) >= num_workers * batch_size
+            and hasattr(model, "start_multi_process_pool")):
+        pool = model.start_multi_process_pool(target_devices=["cpu"] * num_workers)
+        try:
+            return model.encode_multi_process(texts, pool, batch_size=batch_size)
+        finally:
+            model.stop_multi_process_pool(pool)
+
+    return model.encode(
+        texts,
+        batch_size=batch_size,
+        convert_to_numpy=True,
+        show_progress_bar=False
+    )
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Qdrant Tutorial Hybrid Search
+
+This module combines dense (semantic) and sparse (lexical) retrieval in one
+request, so exact tokens like product names and acronyms rank well without
+a second search engine:
+1. A local BM25 vectorizer turns each document into a sparse vector of
+   term-frequency weights; the server applies IDF (Modifier.IDF), so no
+   corpus statistics have to be kept on the client
+2. Documents store the dense vector as the default (unnamed) vector and the
+   sparse vector under SPARSE_VECTOR_NAME, so plain dense searches keep working
+3. A query runs a dense and a sparse prefetch in one query_points call and
+   the server merges them with reciprocal rank fusion (RRF)
+"""
+
+import hashlib
+import re
+
+from qdrant_client.http import models
+
+from batch_search import batch_search
+
+SPARSE_VECTOR_NAME = "bm25"
+
+# Name of the default dense vector in collections that also have named vectors
+DENSE_VECTOR_NAME = ""
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Common English words that carry no lexical signal
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have how in is it its of on or that the this "
+    "to was were what when where which who why will with".split()
+)
+
+
+class BM25Vectorizer:
+    """
+    Stateless BM25 term weighting for sparse vectors.
+
+    Tokens are hashed to 32-bit indices, so there is no vocabulary to fit or
+    store and any process produces the same indices for the same text.
+    """
+
+    def __init__(self, k1=1.2, b=0.75, avg_doc_length=256):
+        """
+        Args:
+            k1: Term frequency saturation
+            b: Document length normalization strength
+            avg_doc_length: Assumed average document length in tokens
+        """
+        self.k1 = k1
+        self.b = b
+        self.avg_doc_length = avg_doc_length
+
+    @staticmethod
+    def tokenize(text):
+        """Lowercase word tokens without stopwords."""
+        return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+    @staticmethod
+    def token_index(token):
+        """Stable 32-bit index of a token."""
+        return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=4).digest(), "little")
+
+    def _term_counts(self, text):
+        counts = {}
+        for token in self.tokenize(text):
+            index = self.token_index(token)
+            counts[index] = counts.get(index, 0) + 1
+        return counts
+
+    def encode_document(self, text):
+        """Sparse vector of BM25 term-frequency weights for a document."""
+        counts = self._term_counts(text)
+        length_norm = self.k1 * (1 - self.b + self.b * sum(counts.values()) / self.avg_doc_length)
+        indices = sorted(counts)
+        return models.SparseVector(
+            indices=indices,
+            values=[counts[index] * (self.k1 + 1) / (counts[index] + length_norm) for index in indices]
+        )
+
+    def encode_query(self, text):
+        """Sparse vector with weight 1 per distinct query term (IDF is applied by the server)."""
+        indices = sorted(self._term_counts(text))
+        return models.SparseVector(indices=indices, values=[1.0] * len(indices))
+
+
+def as_list(vector):
+    """Plain list of floats for a NumPy array or any sequence."""
+    return vector.tolist() if hasattr(vector, "tolist") else list(vector)
+
+
+def sparse_vectors_config():
+    """Sparse vector config for create_collection, with server-side IDF."""
+    return {SPARSE_VECTOR_NAME: models.SparseVectorParams(modifier=models.Modifier.IDF)}
+
+
+def hybrid_vectors(dense_vector, sparse_vector):
+    """Vector argument of a PointStruct holding both the dense and the sparse vector."""
+    return {DENSE_VECTOR_NAME: as_list(dense_vector), SPARSE_VECTOR_NAME: sparse_vector}
+
+
+def _prefetches(dense_vector, sparse_vector, limit, query_filter, search_params):
+    return [
+        models.Prefetch(query=as_list(dense_vector), filter=query_filter, params=search_params, limit=limit),
+        models.Prefetch(query=sparse_vector, using=SPARSE_VECTOR_NAME, filter=query_filter, limit=limit),
+    ]
+
+
+def hybrid_search(client, collection_name, dense_vector, sparse_vector, limit=10, prefetch_limit=None,
+                  query_filter=None, search_params=None, with_payload=True):
+    """
+    Search with dense and sparse vectors in one request, fused with RRF.
+
+    Args:
+        client: QdrantClient connected to the server
+        collection_name: Name of the collection to search
+        dense_vector: Query embedding
+        sparse_vector: Query sparse vector (BM25Vectorizer.encode_query)
+        limit: Number of fused results
+        prefetch_limit: Candidates taken from each retriever (None for 5 * limit)
+        query_filter: Optional models.Filter applied to both retrievers
+        search_params: Optional models.SearchParams for the dense retriever
+        with_payload: Payload selector
+
+    Returns:
+        List of scored points, best first (scores are RRF scores)
+    """
+    response = client.query_points(
+        collection_name=collection_name,
+        prefetch=_prefetches(dense_vector, sparse_vector, prefetch_limit or limit * 5, query_filter, search_params),
+        query=models.FusionQuery(fusion=models.Fusion.RRF),
+        limit=limit,
+        with_payload=with_payload
+    )
+    return response.points
+
+
+def hybrid_batch_search(client, collection_name, encoder, vectorizer, queries, with_payload=True,
+                        search_params=None):
+    """
+    Run several hybrid searches in one round-trip.
+
+    Args:
+        client: QdrantClient connected to the server
+        collection_name: Name of the collection to search
+        encoder: QueryEmbeddingCache or SentenceTransformer model used to embed the queries
+        vectorizer: BM25Vectorizer used for the sparse query vectors
+        queries: List of query strings, or dicts with "text" and optional
+            "filter" (models.Filter) and "limit" keys
+        with_payload: Payload selector applied to every search
+        search_params: Optional models.SearchParams for the dense retriever
+
+    Returns:
+        List with one list of scored points per query, in input order
+    """
+    def hybrid_request(query, dense_vector):
+        return models.QueryRequest(
+            prefetch=_prefetches(dense_vector, vectorizer.encode_query(query["text"]), query["limit"] * 5,
+                                 query["filter"], search_params),
+            query=models.FusionQuery(fusion=models.Fusion.RRF),
+            limit=query["limit"],
+            with_payload=with_payload
+        )
+
+    # batch_search embeds every query in one model call and sends one round-trip
+    return batch_search(client, collection_name, encoder, queries, request_fn=hybrid_request)
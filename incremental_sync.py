@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Qdrant Tutorial Incremental Sync
+
+This module keeps a collection in sync with a source corpus without
+dropping and recreating it:
+1. A content hash of the payload and of the embedding setup (model, backend
+   and projection) is stored in every point's payload
+2. Existing hashes are fetched with one paginated scroll (payload only, no vectors)
+3. Only new or changed records are re-encoded and upserted
+4. Records that disappeared from the source are deleted in batches
+"""
+
+import hashlib
+import json
+import uuid
+
+from qdrant_client.http import models
+
+from embeddings import encode_corpus
+from hybrid_search import SPARSE_VECTOR_NAME, hybrid_vectors
+from named_vectors import encode_named
+from scroll_points import scroll_points
+
+# Payload field holding the content hash of each point
+HASH_FIELD = "content_hash"
+
+
+def content_hash(payload, embedding_key=None):
+    """
+    Compute a stable hash of a point payload and the embedding that produced its vector.
+
+    Args:
+        payload: Payload dictionary (without the hash field)
+        embedding_key: Name of the model, backend and projection the vector
+            was produced with (see dimension_reduction.embedding_key), so that
+            switching any of them marks every point as changed
+
+    Returns:
+        Hex-encoded SHA-256 digest of the canonical JSON encoding
+    """
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    if embedding_key:
+        canonical = f"{embedding_key}\x00{canonical}"
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def with_content_hash(payload, embedding_key=None):
+    """Return a copy of a payload with its content hash added."""
+    return {**payload, HASH_FIELD: content_hash(payload, embedding_key)}
+
+
+def point_id(record, id_field="id"):
+    """
+    Read a record's point ID in the form Qdrant returns it.
+
+    Numeric strings (e.g. from CSV or JSON) become integers, and UUID strings
+    are canonicalized (lower case, hyphenated), so they compare equal to the
+    IDs read back from the collection.
+    """
+    value = record[id_field]
+    if isinstance(value, str):
+        if value.isdigit():
+            return int(value)
+        try:
+            return str(uuid.UUID(value))
+        except ValueError:
+            pass
+    return value
+
+
+def ensure_collection(client, collection_name, vector_size, distance=models.Distance.COSINE,
+                      quantization_config=None, on_disk=None, sparse_vectors_config=None, vectors_config=None):
+    """
+    Create a collection only if it does not exist yet.
+
+    Args:
+        client: QdrantClient connected to the server
+        collection_name: Name of the collection
+        vector_size: Dimension of the vectors
+        distance: Distance function
+        quantization_config: Optional quantization config for new collections
+        on_disk: Whether new collections keep the original vectors on disk
+        sparse_vectors_config: Optional named sparse vectors for new collections
+        vectors_config: Optional vectors config used instead of one unnamed
+            vector (e.g. named vectors, see named_vectors.py)
+
+    Returns:
+        True if the collection was created, False if it already existed
+    """
+    collections = client.get_collections()
+    if collection_name in [collection.name for collection in collections.collections]:
+        return False
+
+    client.create_collection(
+        collection_name=collection_name,
+        vectors_config=vectors_config or models.VectorParams(
+            size=vector_size,
+            distance=distance,
+            on_disk=on_disk
+        ),
+        quantization_config=quantization_config,
+        sparse_vectors_config=sparse_vectors_config
+    )
+    return True
+
+
+def fetch_existing_hashes(client, collection_name, page_size=1000):
+    """
+    Fetch the content hash of every point in a collection.
+
+    Only the hash field is requested and vectors are skipped, so each page
+    is small even for large collections.
+
+    Returns:
+        Dictionary mapping point ID to its stored content hash (None if missing)
+    """
+    hashes = {}
+    for record in scroll_points(client, collection_name, page_size=page_size,
+                                with_payload=[HASH_FIELD], with_vectors=False):
+        hashes[record.id] = (record.payload or {}).get(HASH_FIELD)
+    return hashes
+
+
+def sync_collection(client, collection_name, model, records, text_fn, payload_fn,
+                    batch_size=256, delete_batch_size=1000, sparse_fn=None, embedding_key=None, id_fn=point_id,
+                    num_workers=None):
+    """
+    Bring a collection in line with the given records.
+
+    Args:
+        client: QdrantClient connected to the server
+        collection_name: Name of the collection to sync
+        model: A loaded SentenceTransformer model
+        records: Iterable of source records, each with an "id" key
+        text_fn: Function returning the text to embed for a record, or a
+            dictionary of vector name -> text for collections with named vectors
+        payload_fn: Function returning the payload for a record
+        batch_size: Number of changed records encoded and upserted at once
+        delete_batch_size: Number of point IDs per delete request
+        sparse_fn: Optional function returning a record's sparse vector,
+            stored next to the dense vector (see hybrid_search.py)
+        embedding_key: Name of the model, backend and projection (see
+            content_hash); pass the same one every run
+        id_fn: Function returning the point ID for a record
+        num_workers: Encoding worker processes (see encode_corpus); pass 1
+            from scripts without an `if __name__ == "__main__":` guard
+
+    Returns:
+        Dictionary with the number of unchanged, upserted and deleted points
+    """
+    existing = fetch_existing_hashes(client, collection_name)
+    seen_ids = set()
+    stats = {"unchanged": 0, "upserted": 0, "deleted": 0}
+    pending = []
+
+    def point_vector(vector, record):
+        if isinstance(vector, dict):
+            return {**vector, SPARSE_VECTOR_NAME: sparse_fn(record)} if sparse_fn else vector
+        return hybrid_vectors(vector, sparse_fn(record)) if sparse_fn else vector.tolist()
+
+    def flush_pending():
+        texts = [text_fn(record) for record, _ in pending]
+        if isinstance(texts[0], dict):
+            vectors = encode_named(model, texts, num_workers=num_workers)
+        else:
+            vectors = encode_corpus(model, texts, num_workers=num_workers)
+        client.upsert(
+            collection_name=collection_name,
+            points=[
+                models.PointStruct(
+                    id=id_fn(record),
+                    vector=point_vector(vector, record),
+                    payload=payload
+                )
+                for (record, payload), vector in zip(pending, vectors)
+            ]
+        )
+        stats["upserted"] += len(pending)
+        pending.clear()
+
+    for record in records:
+        record_id = id_fn(record)
+        seen_ids.add(record_id)
+        payload = payload_fn(record)
+        digest = content_hash(payload, embedding_key)
+
+        if existing.get(record_id) == digest:
+            stats["unchanged"] += 1
+            continue
+
+        pending.append((record, {**payload, HASH_FIELD: digest}))
+        if len(pending) >= batch_size:
+            flush_pending()
+
+    if pending:
+        flush_pending()
+
+    stale_ids = [existing_id for existing_id in existing if existing_id not in seen_ids]
+    for start in range(0, len(stale_ids), delete_batch_size):
+        batch = stale_ids[start:start + delete_batch_size]
+        client.delete(
+            collection_name=collection_name,
+            points_selector=models.PointIdsList(points=batch)
+        )
+        stats["deleted"] += len(batch)
+
+    return stats
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Qdrant Tutorial Streaming Ingestion
+
+This module loads corpora of any size from JSONL, CSV or Parquet files with
+bounded memory:
+1. Records are read lazily by a generator for each file format
+2. A reader, an embedder and upload workers run as overlapping stages,
+   connected by bounded queues that provide backpressure
+3. Each batch of records is embedded with one model call and uploaded
+   with retries on transient failures
+4. A checkpoint file records how many rows are safely stored, so an
+   interrupted load resumes where it stopped instead of starting over
+
+Usage:
+    python ingest_pipeline.py corpus.jsonl --collection documents --text-fields title content
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import queue
+import threading
+import time
+
+from qdrant_client.http import models
+
+from dimension_reduction import apply_projection, embedding_key
+from embeddings import encode_corpus, load_model
+from hybrid_search import SPARSE_VECTOR_NAME, BM25Vectorizer, hybrid_vectors
+from incremental_sync import ensure_collection, point_id, with_content_hash
+from parallel_upload import batched, print_progress, upsert_with_retry
+from quantization import quantization_config, quantization_mode
+from qdrant_connection import create_client, describe_connection, is_local_client
+
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_QUEUE_SIZE = 4
+
+
+def read_jsonl(path):
+    """Yield one record per non-empty line of a JSON Lines file."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def read_csv(path):
+    """Yield one record per row of a CSV file with a header row."""
+    with open(path, newline="", encoding="utf-8") as f:
+        yield from csv.DictReader(f)
+
+
+def read_parquet(path, batch_size=10000):
+    """Yield one record per row of a Parquet file, reading one row batch at a time."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Reading Parquet files requires pyarrow: pip install pyarrow") from e
+
+    parquet_file = pq.ParquetFile(path)
+    for batch in parquet_file.iter_batches(batch_size=batch_size):
+        yield from batch.to_pylist()
+
+
+READERS = {
+    ".jsonl": read_jsonl,
+    ".ndjson": read_jsonl,
+    ".csv": read_csv,
+    ".parquet": read_parquet,
+}
+
+
+def read_records(path):
+    """
+    Stream the records of a JSONL, CSV or Parquet file, chosen by file extension.
+
+    Raises:
+        ValueError: If the file extension is not supported
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in READERS:
+        raise ValueError(f"Unsupported corpus format '{extension}', expected one of {', '.join(READERS)}")
+    return READERS[extension](path)
+
+
+def load_checkpoint(checkpoint_path):
+    """Return the number of rows already stored according to a checkpoint file (0 if none)."""
+    if not checkpoint_path or not os.path.exists(checkpoint_path):
+        return 0
+    with open(checkpoint_path) as f:
+        return json.load(f)["rows_done"]
+
+
+def clear_checkpoint(checkpoint_path):
+    """Remove a checkpoint file, e.g. because the collection it describes was recreated."""
+    if checkpoint_path and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+
+def save_checkpoint(checkpoint_path, rows_done):
+    """Atomically record the number of rows stored so far."""
+    temporary_path = f"{checkpoint_path}.tmp"
+    with open(temporary_path, "w") as f:
+        json.dump({"rows_done": rows_done, "updated": time.strftime("%Y-%m-%dT%H:%M:%S%z")}, f)
+    os.replace(temporary_path, checkpoint_path)
+
+
+def ingest(client, collection_name, records, model, text_fn, payload_fn, id_fn=point_id,
+           batch_size=DEFAULT_BATCH_SIZE, queue_size=DEFAULT_QUEUE_SIZE, upload_workers=2,
+           checkpoint_path=None, max_retries=3, wait=True, report_every=5.0, progress=print_progress,
+           sparse_fn=None):
+    """
+    Stream records through read, embed and upload stages into a collection.
+
+    The checkpoint only advances over batches that are stored and whose
+    predecessors are stored too, so after a crash every row before it is
+    in the collection. It is removed once the whole input has been loaded.
+
+    Args:
+        client: QdrantClient connected to the server
+        collection_name: Name of the target collection (must exist)
+        records: Iterable of records (e.g. from read_records), in a stable order
+        model: A loaded SentenceTransformer model
+        text_fn: Function returning the text to embed for a record
+        payload_fn: Function returning the payload for a record
+        id_fn: Function returning the point ID for a record
+        batch_size: Records embedded and upserted together
+        queue_size: Maximum number of batches waiting between two stages
+        upload_workers: Number of threads sending batches
+        checkpoint_path: Optional file recording progress for resuming; it
+            must describe this collection, so remove it when the collection
+            is recreated (see clear_checkpoint)
+        max_retries: Retries per batch on transient failures
+        wait: Whether each upsert waits for the server to apply it (required
+            with a checkpoint, which may only count acknowledged rows)
+        report_every: Seconds between progress reports
+        progress: Callback receiving the current stats (None to disable)
+        sparse_fn: Optional function returning a record's sparse vector,
+            stored next to the dense vector (see hybrid_search.py)
+
+    Returns:
+        Dictionary with the rows stored in total, the rows skipped by resuming,
+        and the points, batches, retries, seconds and points per second of this run
+
+    Raises:
+        ValueError: If a checkpoint is requested with wait=False
+    """
+    if checkpoint_path and not wait:
+        raise ValueError("A checkpoint may only count applied rows, so it requires wait=True")
+
+    # In-process local storage is not thread-safe, so it gets a single writer
+    if is_local_client(client):
+        upload_workers = 1
+
+    resumed_from = load_checkpoint(checkpoint_path)
+    records = itertools.islice(records, resumed_from, None)
+
+    record_batches = queue.Queue(maxsize=queue_size)
+    point_batches = queue.Queue(maxsize=queue_size)
+    lock = threading.Lock()
+    failure = []
+    start = time.perf_counter()
+    stats = {"rows": resumed_from, "resumed_from": resumed_from, "points": 0, "batches": 0,
+             "retries": 0, "seconds": 0.0, "points_per_second": 0.0}
+    # Sizes of stored batches that cannot be checkpointed yet because an earlier one is still in flight
+    stored = {}
+    next_sequence = [0]
+    last_report = [start]
+
+    def embed():
+        while True:
+            item = record_batches.get()
+            if item is None:
+                break
+            # After a failure, keep draining so the reader never blocks
+            if failure:
+                continue
+            sequence, batch = item
+            try:
+                vectors = encode_corpus(model, [text_fn(record) for record in batch], batch_size=len(batch))
+                points = [
+                    models.PointStruct(
+                        id=id_fn(record),
+                        vector=hybrid_vectors(vector, sparse_fn(record)) if sparse_fn else vector.tolist(),
+                        payload=payload_fn(record)
+                    )
+                    for record, vector in zip(batch, vectors)
+                ]
+                point_batches.put((sequence, points))
+            except Exception as e:
+                failure.append(e)
+        for _ in range(upload_workers):
+            point_batches.put(None)
+
+    def count_retry():
+        with lock:
+            stats["retries"] += 1
+
+    def mark_stored(sequence, count):
+        with lock:
+            now = time.perf_counter()
+            stats["points"] += count
+            stats["batches"] += 1
+            stats["seconds"] = now - start
+            stats["points_per_second"] = stats["points"] / stats["seconds"] if stats["seconds"] else 0.0
+
+            stored[sequence] = count
+            advanced = False
+            while next_sequence[0] in stored:
+                stats["rows"] += stored.pop(next_sequence[0])
+                next_sequence[0] += 1
+                advanced = True
+            if advanced and checkpoint_path:
+                save_checkpoint(checkpoint_path, stats["rows"])
+
+            if progress and now - last_report[0] >= report_every:
+                last_report[0] = now
+                progress(dict(stats))
+
+    def upload():
+        while True:
+            item = point_batches.get()
+            if item is None:
+                return
+            if failure:
+                continue
+            sequence, points = item
+            try:
+                upsert_with_retry(client, collection_name, points, wait=wait, max_retries=max_retries,
+                                  on_retry=count_retry)
+                mark_stored(sequence, len(points))
+            except Exception as e:
+                failure.append(e)
+
+    threads = [threading.Thread(target=embed, daemon=True)]
+    threads += [threading.Thread(target=upload, daemon=True) for _ in range(upload_workers)]
+    for thread in threads:
+        thread.start()
+
+    # The calling thread is the reader stage
+    try:
+        for sequence, batch in enumerate(batched(records, batch_size)):
+            if failure:
+                break
+            # Blocks while the queue is full, so reading never runs ahead of embedding
+            record_batches.put((sequence, batch))
+    finally:
+        record_batches.put(None)
+        for thread in threads:
+            thread.join()
+
+    if failure:
+        raise failure[0]
+
+    clear_checkpoint(checkpoint_path)
+
+    stats["seconds"] = time.perf_counter() - start
+    stats["points_per_second"] = stats["points"] / stats["seconds"] if stats["seconds"] else 0.0
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stream a JSONL, CSV or Parquet corpus into a Qdrant collection")
+    parser.add_argument("path", help="Corpus file (.jsonl, .ndjson, .csv or .parquet)")
+    parser.add_argument("--collection", required=True, help="Target collection (created if missing)")
+    parser.add_argument("--text-fields", nargs="+", default=["title", "content"], help="Fields joined into the embedded text")
+    parser.add_argument("--id-field", default="id", help="Field holding the point ID")
+    parser.add_argument("--model", default="all-MiniLM-L6-v2", help="Sentence-transformers model name")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Records per batch")
+    parser.add_argument("--upload-workers", type=int, default=2, help="Number of upload threads")
+    parser.add_argument("--checkpoint", help="Checkpoint file (default: <path>.checkpoint)")
+    args = parser.parse_args()
+
+    print("Qdrant Streaming Ingestion")
+    print("==========================\n")
+
+    client = create_client()
+    # The same projection (QDRANT_PROJECTION) the collection's search side applies
+    model = apply_projection(load_model(args.model), args.collection)
+    checkpoint_path = args.checkpoint or f"{args.path}.checkpoint"
+    if ensure_collection(
+        client,
+        args.collection,
+        model.get_sentence_embedding_dimension(),
+        quantization_config=quantization_config(),
+        on_disk=quantization_mode() != "none"
+    ):
+        # A checkpoint left from a previous collection of this name counts rows this one lacks
+        clear_checkpoint(checkpoint_path)
+        print(f"Created collection '{args.collection}' on {describe_connection()}")
+
+    def record_text(record):
+        return ". ".join(str(record[field]) for field in args.text_fields if record.get(field))
+
+    # Collections created by 02_semantic_search.py store a BM25 sparse vector next to the dense one
+    sparse_fn = None
+    if SPARSE_VECTOR_NAME in (client.get_collection(args.collection).config.params.sparse_vectors or {}):
+        vectorizer = BM25Vectorizer()
+        sparse_fn = lambda record: vectorizer.encode_document(record_text(record))
+
+    resumed_from = load_checkpoint(checkpoint_path)
+    if resumed_from:
+        print(f"Resuming after {resumed_from} rows recorded in {checkpoint_path}")
+
+    stats = ingest(
+        client,
+        args.collection,
+        read_records(args.path),
+        model,
+        text_fn=record_text,
+        # The payload is the record without its ID field. Its content hash lets a later
+        # sync_collection run with this same payload and embedding key skip unchanged
+        # records; 02_semantic_search.py builds its own payload, so it re-embeds them
+        payload_fn=lambda record: with_content_hash({k: v for k, v in record.items() if k != args.id_field},
+                                                    embedding_key(args.model, model)),
+        id_fn=lambda record: point_id(record, args.id_field),
+        sparse_fn=sparse_fn,
+        batch_size=args.batch_size,
+        upload_workers=args.upload_workers,
+        checkpoint_path=checkpoint_path
+    )
+
+    print(f"\nStored {stats['points']} points in {stats['batches']} batches "
+          f"({stats['points_per_second']:.0f} points/sec, {stats['retries']} retries); "
+          f"{stats['rows']} rows in total.")
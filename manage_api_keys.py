@@ -3,10 +3,15 @@
 Qdrant API Key Management Script
 
 This script allows you to create, list, and delete API keys for a running Qdrant instance
-using the REST API.
+using the REST API. The bulk-create and bulk-delete commands apply many keys at once,
+concurrently, over one pooled HTTP session.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 import json
 import argparse
 import uuid
@@ -14,7 +19,59 @@ import uuid
 # Default Qdrant endpoint
 QDRANT_HOST = "http://localhost:6333"
 
-def create_api_key(name, actions=None, collections=None, host=QDRANT_HOST):
+# Default number of concurrent requests for bulk commands
+DEFAULT_WORKERS = 16
+
+class KeyManagementRetry(Retry):
+    """
+    Retry policy that never repeats a POST which may already have been applied.
+    
+    A 502 or 504 from a gateway, or a connection lost after the request was
+    sent, says nothing about whether the key was created, so retrying the
+    POST could create a duplicate key. 429 and 503 mean the request was
+    rejected and are retried for every method.
+    """
+    
+    # Statuses after which a request may or may not have been applied
+    AMBIGUOUS_STATUSES = frozenset([502, 504])
+    
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method.upper() == "POST" and status_code in self.AMBIGUOUS_STATUSES:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+    
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if method and method.upper() == "POST" and isinstance(error, (ReadTimeoutError, ProtocolError)):
+            raise error
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+def create_session(pool_size=DEFAULT_WORKERS, retries=3):
+    """
+    Create an HTTP session with a connection pool and automatic retries.
+    
+    Args:
+        pool_size: Maximum number of pooled connections
+        retries: Number of retries on connection errors and transient status codes
+    
+    Returns:
+        A configured requests.Session
+    """
+    retry = KeyManagementRetry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=frozenset(["GET", "POST", "DELETE"]),
+        # Once retries run out, hand back the last response instead of raising,
+        # so it is reported like any other failed request
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def create_api_key(name, actions=None, collections=None, host=QDRANT_HOST, session=None):
     """
     Create a new API key with specified permissions.
     
@@ -23,6 +80,7 @@ def create_api_key(name, actions=None, collections=None, host=QDRANT_HOST):
         actions: List of allowed actions (e.g., ["read", "write"])
         collections: List of allowed collections (None for all collections)
         host: Qdrant host URL
+        session: Optional requests.Session to reuse pooled connections
     
     Returns:
         The created API key information
@@ -43,7 +101,7 @@ def create_api_key(name, actions=None, collections=None, host=QDRANT_HOST):
         body["collections"] = collections
     
     # Make the request
-    response = requests.post(url, json=body)
+    response = (session or requests).post(url, json=body)
     
     if response.status_code == 200:
         return response.json()
@@ -52,12 +110,13 @@ def create_api_key(name, actions=None, collections=None, host=QDRANT_HOST):
         print(response.text)
         return None
 
-def list_api_keys(host=QDRANT_HOST):
+def list_api_keys(host=QDRANT_HOST, session=None):
     """
     List all API keys.
     
     Args:
         host: Qdrant host URL
+        session: Optional requests.Session to reuse pooled connections
     
     Returns:
         List of API keys
@@ -65,7 +124,7 @@ def list_api_keys(host=QDRANT_HOST):
     url = f"{host}/api/v1/api-keys"
     
     # Make the request
-    response = requests.get(url)
+    response = (session or requests).get(url)
     
     if response.status_code == 200:
         return response.json()
@@ -74,13 +133,14 @@ def list_api_keys(host=QDRANT_HOST):
         print(response.text)
         return None
 
-def delete_api_key(key_id, host=QDRANT_HOST):
+def delete_api_key(key_id, host=QDRANT_HOST, session=None):
     """
     Delete an API key.
     
     Args:
         key_id: ID of the API key to delete
         host: Qdrant host URL
+        session: Optional requests.Session to reuse pooled connections
     
     Returns:
         True if successful, False otherwise
@@ -88,7 +148,7 @@ def delete_api_key(key_id, host=QDRANT_HOST):
     url = f"{host}/api/v1/api-keys/{key_id}"
     
     # Make the request
-    response = requests.delete(url)
+    response = (session or requests).delete(url)
     
     if response.status_code == 200:
         return True
@@ -97,6 +157,126 @@ def delete_api_key(key_id, host=QDRANT_HOST):
         print(response.text)
         return False
 
+def load_key_specs(path):
+    """
+    Load API key specs from a YAML or JSON file.
+    
+    Accepts either a list of specs ({"name", "actions", "collections"}) or the
+    `api_keys` block of a Qdrant config file (see qdrant_config.yaml), where each
+    key has "read"/"write" flags and optional "collections".
+    
+    Args:
+        path: Path to a .yaml, .yml or .json file
+    
+    Returns:
+        List of specs with "name", "actions" and "collections" keys
+    """
+    with open(path, "r") as f:
+        if path.endswith((".yaml", ".yml")):
+            import yaml
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+    
+    # Unwrap a full config file down to its api_keys block
+    if isinstance(data, dict):
+        data = data.get("service", data).get("api_keys", data)
+    
+    if isinstance(data, dict):
+        specs = []
+        for name, options in data.items():
+            actions = [action for action in ("read", "write") if options.get(action)]
+            specs.append({
+                "name": name,
+                "actions": actions or None,
+                "collections": options.get("collections")
+            })
+        return specs
+    
+    return [
+        {
+            "name": spec["name"],
+            "actions": spec.get("actions"),
+            "collections": spec.get("collections")
+        }
+        for spec in data
+    ]
+
+def load_key_ids(path):
+    """
+    Load API key IDs from a file.
+    
+    Accepts a JSON list of IDs (or of objects with an "id" field),
+    or a plain text file with one ID per line.
+    """
+    with open(path, "r") as f:
+        text = f.read()
+    
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return [line.strip() for line in text.splitlines() if line.strip()]
+    
+    return [item["id"] if isinstance(item, dict) else item for item in data]
+
+def bulk_create_api_keys(specs, host=QDRANT_HOST, workers=DEFAULT_WORKERS, session=None):
+    """
+    Create many API keys concurrently over one pooled session.
+    
+    Args:
+        specs: List of specs with "name", "actions" and "collections" keys
+        host: Qdrant host URL
+        workers: Number of concurrent requests
+        session: Optional requests.Session (a pooled one is created if omitted)
+    
+    Returns:
+        List with the created key information, or a {"name", "error"} record
+        for each key that failed, in input order
+    """
+    session = session or create_session(pool_size=workers)
+    
+    def create(spec):
+        # One failed request must not abort the run and lose the keys already created
+        try:
+            result = create_api_key(
+                name=spec["name"],
+                actions=spec.get("actions"),
+                collections=spec.get("collections"),
+                host=host,
+                session=session
+            )
+        except requests.RequestException as e:
+            return {"name": spec["name"], "error": str(e)}
+        return result or {"name": spec["name"], "error": "rejected by the server"}
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(create, specs))
+
+def bulk_delete_api_keys(key_ids, host=QDRANT_HOST, workers=DEFAULT_WORKERS, session=None):
+    """
+    Delete many API keys concurrently over one pooled session.
+    
+    Args:
+        key_ids: List of API key IDs
+        host: Qdrant host URL
+        workers: Number of concurrent requests
+        session: Optional requests.Session (a pooled one is created if omitted)
+    
+    Returns:
+        List of booleans telling whether each deletion succeeded, in input order
+    """
+    session = session or create_session(pool_size=workers)
+    
+    def delete(key_id):
+        try:
+            return delete_api_key(key_id=key_id, host=host, session=session)
+        except requests.RequestException as e:
+            print(f"Error deleting API key {key_id}: {e}")
+            return False
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(delete, key_ids))
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Manage Qdrant API keys")
     parser.add_argument("--host", default=QDRANT_HOST, help="Qdrant host URL")
@@ -117,6 +297,17 @@ if __name__ == "__main__":
     delete_parser = subparsers.add_parser("delete", help="Delete an API key")
     delete_parser.add_argument("key_id", help="ID of the API key to delete")
     
+    # Bulk create API keys command
+    bulk_create_parser = subparsers.add_parser("bulk-create", help="Create API keys from a YAML/JSON file")
+    bulk_create_parser.add_argument("file", help="YAML/JSON file with key specs (e.g. qdrant_config.yaml)")
+    bulk_create_parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Number of concurrent requests")
+    bulk_create_parser.add_argument("--output", help="Write the created keys as JSON to this file")
+    
+    # Bulk delete API keys command
+    bulk_delete_parser = subparsers.add_parser("bulk-delete", help="Delete API keys listed in a file")
+    bulk_delete_parser.add_argument("file", help="JSON list of key IDs (or created keys), or one ID per line")
+    bulk_delete_parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Number of concurrent requests")
+    
     args = parser.parse_args()
     
     if args.command == "create":
@@ -166,5 +357,31 @@ if __name__ == "__main__":
         if success:
             print(f"API key {args.key_id} deleted successfully")
     
+    elif args.command == "bulk-create":
+        # Create all keys from the file concurrently
+        specs = load_key_specs(args.file)
+        results = bulk_create_api_keys(specs, host=args.host, workers=args.workers)
+        created = [result for result in results if "error" not in result]
+        
+        print(f"Created {len(created)} of {len(specs)} API keys")
+        for result in results:
+            if "error" in result:
+                print(f"Failed: {result['name']} ({result['error']})")
+        
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(created, f, indent=2)
+            print(f"Created keys written to {args.output}")
+    
+    elif args.command == "bulk-delete":
+        # Delete all keys from the file concurrently
+        key_ids = load_key_ids(args.file)
+        results = bulk_delete_api_keys(key_ids, host=args.host, workers=args.workers)
+        
+        print(f"Deleted {sum(results)} of {len(key_ids)} API keys")
+        for key_id, success in zip(key_ids, results):
+            if not success:
+                print(f"Failed: {key_id}")
+    
     else:
         parser.print_help()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Qdrant Tutorial Named Vectors
+
+This module stores several embeddings per point, one for each text field,
+instead of embedding one merged string:
+1. Each field (e.g. "title" and "content") gets its own named vector, so a
+   short title match is not diluted by a long body
+2. All fields of a batch of records are embedded with one model call
+3. A weighted search sends one query per named vector in a single
+   query_batch_points round-trip and combines the per-vector scores with
+   weights chosen at query time, so relevance is tuned without re-indexing
+
+Qdrant's server-side fusion (RRF and DBSF) has no per-retriever weights,
+so the weighted sum is computed on the client over the candidates the
+server returns for each vector.
+
+Settings, read from environment variables by vector_weights:
+
+    QDRANT_VECTOR_WEIGHTS  Weights per named vector, e.g. "title=0.3,content=0.7"
+"""
+
+import os
+
+from qdrant_client.http import models
+
+from embeddings import encode_corpus
+from hybrid_search import as_list
+from quantization import vector_params
+
+
+def named_vectors_config(names, vector_size, mode=None, distance=models.Distance.COSINE):
+    """Vectors config for create_collection with one named vector per field."""
+    return {name: vector_params(vector_size, mode=mode, distance=distance) for name in names}
+
+
+def vector_weights(default):
+    """
+    Return the per-vector weights selected by QDRANT_VECTOR_WEIGHTS.
+
+    Args:
+        default: Weights used when the variable is not set
+
+    Raises:
+        ValueError: If the variable is not a list of name=weight pairs
+    """
+    spec = os.environ.get("QDRANT_VECTOR_WEIGHTS", "").strip()
+    if not spec:
+        return dict(default)
+
+    weights = {}
+    for item in spec.split(","):
+        name, separator, weight = item.partition("=")
+        if not separator:
+            raise ValueError(f"QDRANT_VECTOR_WEIGHTS must look like 'title=0.3,content=0.7', got '{spec}'")
+        weights[name.strip()] = float(weight)
+    return weights
+
+
+def encode_named(model, texts, batch_size=None, num_workers=None):
+    """
+    Embed every named text of every record in one batched pass.
+
+    Args:
+        model: A loaded SentenceTransformer model
+        texts: List with one dictionary of vector name -> text per record;
+            all dictionaries have the same keys
+        batch_size: Texts per forward pass (None for the encode_corpus default)
+        num_workers: Encoding worker processes (see encode_corpus)
+
+    Returns:
+        List with one dictionary of vector name -> embedding (list of floats) per record
+    """
+    if not texts:
+        return []
+
+    names = list(texts[0])
+    flat = [record_texts[name] for record_texts in texts for name in names]
+    kwargs = {"batch_size": batch_size} if batch_size else {}
+    vectors = encode_corpus(model, flat, num_workers=num_workers, **kwargs)
+
+    return [
+        {name: vectors[row * len(names) + column].tolist() for column, name in enumerate(names)}
+        for row in range(len(texts))
+    ]
+
+
+def weighted_search(client, collection_name, query_vector, weights, limit=10, candidates=None,
+                    query_filter=None, search_params=None, with_payload=True):
+    """
+    Search several named vectors and rank by the weighted sum of their scores.
+
+    A point found by only some of the vectors is scored with the lowest
+    score each other vector returned, an upper bound of its real score there.
+
+    Args:
+        client: QdrantClient connected to the server
+        collection_name: Name of the collection to search
+        query_vector: Query embedding, compared against every named vector
+        weights: Dictionary of vector name -> weight (vectors weighted 0 are not searched)
+        limit: Number of results
+        candidates: Points fetched per named vector (None for 4 * limit)
+        query_filter: Optional models.Filter applied to every vector
+        search_params: Optional models.SearchParams
+        with_payload: Payload selector
+
+    Returns:
+        List of scored points, best first, whose scores are the weighted sums
+
+    Raises:
+        ValueError: If no vector has a positive weight
+    """
+    weights = {name: weight for name, weight in weights.items() if weight}
+    if not weights:
+        raise ValueError("weighted_search needs at least one vector with a non-zero weight")
+
+    query_vector = as_list(query_vector)
+    requests = [
+        models.QueryRequest(
+            query=query_vector,
+            using=name,
+            filter=query_filter,
+            params=search_params,
+            limit=candidates or limit * 4,
+            with_payload=with_payload
+        )
+        for name in weights
+    ]
+    responses = client.query_batch_points(collection_name=collection_name, requests=requests)
+
+    points = {}
+    scores = {}
+    floors = {}
+    for name, response in zip(weights, responses):
+        floors[name] = min((point.score for point in response.points), default=0.0)
+        for point in response.points:
+            points.setdefault(point.id, point)
+            scores.setdefault(point.id, {})[name] = point.score
+
+    combined = {
+        point_id: sum(weight * point_scores.get(name, floors[name]) for name, weight in weights.items())
+        for point_id, point_scores in scores.items()
+    }
+    ranked = sorted(combined, key=combined.get, reverse=True)[:limit]
+    return [points[point_id].model_copy(update={"score": combined[point_id]}) for point_id in ranked]
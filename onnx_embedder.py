@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Qdrant Tutorial ONNX Runtime Embedder
+
+This module runs the sentence embedding model with ONNX Runtime on CPU
+instead of PyTorch, which loads faster and encodes faster on CPU-only hosts:
+1. The model is exported once to a local directory (model.onnx, tokenizer.json
+   and the pooling settings)
+2. Optionally, int8 dynamic quantization shrinks the weights about 4x and
+   speeds up CPU inference further
+3. Embeddings use the same mean pooling and normalization as the
+   sentence-transformers model, so both backends can share a collection
+
+Settings, read from environment variables when QDRANT_EMBEDDER=onnx:
+
+    QDRANT_ONNX_MODEL_DIR  Directory of the exported model (default: onnx_models/<model name>)
+    QDRANT_ONNX_QUANTIZE   Set to 1 to use the int8 quantized model (created on first use)
+    QDRANT_ONNX_THREADS    Intra-op threads (default: ONNX Runtime's choice)
+
+Usage:
+    # Export once, on a machine with sentence-transformers and PyTorch
+    python onnx_embedder.py export all-MiniLM-L6-v2 onnx_models/all-MiniLM-L6-v2
+
+    # Inference hosts only need onnxruntime and tokenizers
+    pip install onnxruntime tokenizers
+    QDRANT_EMBEDDER=onnx python 02_semantic_search.py
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+
+from embeddings import DEFAULT_BATCH_SIZE
+
+MODEL_FILE = "model.onnx"
+QUANTIZED_MODEL_FILE = "model_quantized.onnx"
+TOKENIZER_FILE = "tokenizer.json"
+CONFIG_FILE = "embedder_config.json"
+
+DEFAULT_MODEL_ROOT = "onnx_models"
+
+
+def export_model(model_name, output_dir, opset_version=14):
+    """
+    Export a sentence-transformers model to an ONNX model directory.
+
+    Needs sentence-transformers and PyTorch; the exported directory does not.
+
+    Args:
+        model_name: Name of the SentenceTransformer model
+        output_dir: Directory to write model.onnx, tokenizer.json and the pooling settings to
+        opset_version: ONNX opset used for the export
+
+    Returns:
+        Path of the exported ONNX model
+    """
+    import torch
+    from sentence_transformers import SentenceTransformer
+    from sentence_transformers.models import Normalize, Pooling
+
+    model = SentenceTransformer(model_name, device="cpu")
+    transformer = model[0].auto_model.eval()
+    tokenizer = model.tokenizer
+
+    pooling = next((module for module in model if isinstance(module, Pooling)), None)
+    if pooling is not None and pooling.get_pooling_mode_str() != "mean":
+        raise ValueError(f"Only mean pooling is supported, '{model_name}' uses {pooling.get_pooling_mode_str()}")
+
+    os.makedirs(output_dir, exist_ok=True)
+    tokenizer.save_pretrained(output_dir)
+
+    sample = tokenizer(["An example sentence to trace the model"], return_tensors="pt")
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+    model_path = os.path.join(output_dir, MODEL_FILE)
+    with torch.no_grad():
+        torch.onnx.export(
+            transformer,
+            tuple(sample[name] for name in input_names),
+            model_path,
+            input_names=input_names,
+            output_names=["last_hidden_state"],
+            dynamic_axes={name: {0: "batch", 1: "sequence"} for name in input_names + ["last_hidden_state"]},
+            opset_version=opset_version
+        )
+
+    with open(os.path.join(output_dir, CONFIG_FILE), "w") as f:
+        json.dump({
+            "model_name": model_name,
+            "dimension": model.get_sentence_embedding_dimension(),
+            "max_length": model.max_seq_length,
+            "normalize": any(isinstance(module, Normalize) for module in model),
+            "pad_token": tokenizer.pad_token,
+            "pad_token_id": tokenizer.pad_token_id
+        }, f, indent=2)
+
+    return model_path
+
+
+def quantize_model(model_dir):
+    """
+    Create an int8 dynamically quantized copy of an exported model.
+
+    Weights are stored as int8 and activations are quantized on the fly,
+    so no calibration data is needed.
+
+    Returns:
+        Path of the quantized ONNX model
+    """
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    quantized_path = os.path.join(model_dir, QUANTIZED_MODEL_FILE)
+    quantize_dynamic(
+        os.path.join(model_dir, MODEL_FILE),
+        quantized_path,
+        weight_type=QuantType.QInt8
+    )
+    return quantized_path
+
+
+class OnnxEmbedder:
+    """
+    Sentence embedder running an exported model with ONNX Runtime.
+
+    Offers the same `encode` and `get_sentence_embedding_dimension` methods
+    as a SentenceTransformer model, so it can be used anywhere one is.
+    """
+
+    def __init__(self, model_dir, quantized=False, num_threads=None):
+        """
+        Load an exported model directory.
+
+        Args:
+            model_dir: Directory written by export_model
+            quantized: Whether to use the int8 model (quantized on first use if missing)
+            num_threads: Intra-op threads (None for ONNX Runtime's default)
+        """
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        with open(os.path.join(model_dir, CONFIG_FILE)) as f:
+            self.config = json.load(f)
+
+        model_path = os.path.join(model_dir, QUANTIZED_MODEL_FILE if quantized else MODEL_FILE)
+        if quantized and not os.path.exists(model_path):
+            quantize_model(model_dir)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        self.session = ort.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+        self.input_names = {model_input.name for model_input in self.session.get_inputs()}
+
+        self.tokenizer = Tokenizer.from_file(os.path.join(model_dir, TOKENIZER_FILE))
+        self.tokenizer.enable_truncation(max_length=self.config["max_length"])
+        self.tokenizer.enable_padding(pad_id=self.config["pad_token_id"], pad_token=self.config["pad_token"])
+
+        self.quantized = quantized
+
+    def get_sentence_embedding_dimension(self):
+        return self.config["dimension"]
+
+    def _embed_batch(self, texts):
+        encodings = self.tokenizer.encode_batch(texts)
+        attention_mask = np.array([encoding.attention_mask for encoding in encodings], dtype=np.int64)
+        inputs = {
+            "input_ids": np.array([encoding.ids for encoding in encodings], dtype=np.int64),
+            "attention_mask": attention_mask,
+            "token_type_ids": np.array([encoding.type_ids for encoding in encodings], dtype=np.int64),
+        }
+        hidden = self.session.run(None, {name: value for name, value in inputs.items() if name in self.input_names})[0]
+
+        # Mean pooling over the real (non-padding) tokens
+        mask = attention_mask[..., None].astype(np.float32)
+        vectors = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        if self.config["normalize"]:
+            vectors /= np.clip(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12, None)
+        return vectors.astype(np.float32)
+
+    def encode(self, sentences, batch_size=DEFAULT_BATCH_SIZE, convert_to_numpy=True, show_progress_bar=False):
+        """Embed one text (returns a vector) or a list of texts (returns a matrix)."""
+        if isinstance(sentences, str):
+            return self._embed_batch([sentences])[0]
+        sentences = list(sentences)
+        if not sentences:
+            return np.empty((0, self.get_sentence_embedding_dimension()), dtype=np.float32)
+
+        # Sorting by length keeps padding within each batch small
+        order = np.argsort([-len(text) for text in sentences], kind="stable")
+        vectors = np.empty((len(sentences), self.get_sentence_embedding_dimension()), dtype=np.float32)
+        for start in range(0, len(sentences), batch_size):
+            rows = order[start:start + batch_size]
+            vectors[rows] = self._embed_batch([sentences[row] for row in rows])
+        return vectors
+
+
+def load_onnx_embedder(model_name):
+    """
+    Load the ONNX backend for a model, configured by environment variables.
+
+    Raises:
+        FileNotFoundError: If the model directory has not been exported yet
+    """
+    model_dir = os.environ.get("QDRANT_ONNX_MODEL_DIR") or os.path.join(DEFAULT_MODEL_ROOT, model_name)
+    if not os.path.exists(os.path.join(model_dir, CONFIG_FILE)):
+        raise FileNotFoundError(
+            f"No exported ONNX model in '{model_dir}'. "
+            f"Run: python onnx_embedder.py export {model_name} {model_dir}"
+        )
+    quantized = os.environ.get("QDRANT_ONNX_QUANTIZE", "").strip().lower() in {"1", "true", "yes", "on"}
+    num_threads = int(os.environ["QDRANT_ONNX_THREADS"]) if os.environ.get("QDRANT_ONNX_THREADS") else None
+    return OnnxEmbedder(model_dir, quantized=quantized, num_threads=num_threads)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export and quantize ONNX embedding models")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser("export", help="Export a sentence-transformers model to ONNX")
+    export_parser.add_argument("model_name", help="SentenceTransformer model name")
+    export_parser.add_argument("output_dir", help="Directory for the exported model")
+    export_parser.add_argument("--quantize", action="store_true", help="Also create the int8 quantized model")
+
+    quantize_parser = subparsers.add_parser("quantize", help="Create the int8 model of an exported directory")
+    quantize_parser.add_argument("model_dir", help="Directory written by export")
+
+    args = parser.parse_args()
+
+    if args.command == "export":
+        print(f"Exported {args.model_name} to {export_model(args.model_name, args.output_dir)}")
+        if args.quantize:
+            print(f"Quantized model written to {quantize_model(args.output_dir)}")
+    else:
+        print(f"Quantized model written to {quantize_model(args.model_dir)}")
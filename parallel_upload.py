@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Qdrant Tutorial Parallel Uploader
+
+This module uploads points of any size without holding them all in memory:
+1. Any iterable of points is split into fixed-size batches
+2. Batches are sent by a pool of parallel worker threads
+3. A bounded queue between the reader and the workers provides backpressure
+4. Transient failures are retried with exponential backoff
+5. Throughput (points/sec) is reported while the upload runs
+"""
+
+import itertools
+import queue
+import threading
+import time
+
+import grpc
+from qdrant_client.http.exceptions import ResponseHandlingException, UnexpectedResponse
+
+from qdrant_connection import is_local_client
+
+# HTTP status codes worth retrying: rate limiting and temporary server errors
+TRANSIENT_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# The same for clients using the gRPC interface (QDRANT_PREFER_GRPC=1)
+TRANSIENT_GRPC_CODES = {
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+    grpc.StatusCode.RESOURCE_EXHAUSTED
+}
+
+
+def is_transient_error(error):
+    """Return True if a failed request is worth retrying."""
+    if isinstance(error, UnexpectedResponse):
+        return error.status_code in TRANSIENT_STATUS_CODES
+    if isinstance(error, grpc.RpcError):
+        # Failed calls are raised as RpcErrors that also carry the call's status code
+        return hasattr(error, "code") and error.code() in TRANSIENT_GRPC_CODES
+    # Raised by the client for connection errors and timeouts
+    return isinstance(error, (ResponseHandlingException, ConnectionError, TimeoutError))
+
+
+def batched(iterable, batch_size):
+    """Yield lists of up to `batch_size` items from any iterable."""
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def print_progress(stats):
+    """Default progress callback printing the current upload throughput."""
+    print(f"  Uploaded {stats['points']} points "
+          f"({stats['points_per_second']:.0f} points/sec)")
+
+
+def upsert_with_retry(client, collection_name, points, wait=True, max_retries=3, retry_delay=0.5,
+                      on_retry=None):
+    """
+    Upsert one batch of points, retrying transient failures with exponential backoff.
+
+    Args:
+        client: QdrantClient connected to the server
+        collection_name: Name of the target collection
+        points: List of PointStruct objects
+        wait: Whether the upsert waits for the server to apply it
+        max_retries: Retries on transient failures
+        retry_delay: Initial delay between retries in seconds, doubled each retry
+        on_retry: Optional callback invoked before each retry
+    """
+    delay = retry_delay
+    for attempt in range(max_retries + 1):
+        try:
+            client.upsert(collection_name=collection_name, points=points, wait=wait)
+            return
+        except Exception as e:
+            if attempt == max_retries or not is_transient_error(e):
+                raise
+            if on_retry:
+                on_retry()
+            time.sleep(delay)
+            delay *= 2
+
+
+def upload_points(client, collection_name, points, batch_size=256, parallel=4,
+                  max_retries=3, retry_delay=0.5, queue_size=None, wait=True,
+                  report_every=5.0, progress=print_progress):
+    """
+    Upload points in parallel batches with backpressure and retries.
+
+    Args:
+        client: QdrantClient connected to the server
+        collection_name: Name of the target collection
+        points: Iterable of PointStruct objects (may be a generator)
+        batch_size: Number of points per upsert request
+        parallel: Number of worker threads sending batches
+        max_retries: Retries per batch on transient failures
+        retry_delay: Initial delay between retries in seconds, doubled each retry
+        queue_size: Maximum number of batches waiting for a worker
+            (None for twice the number of workers)
+        wait: Whether each upsert waits for the server to apply it
+        report_every: Seconds between progress reports
+        progress: Callback receiving the current stats (None to disable)
+
+    Returns:
+        Dictionary with the number of points, batches, retries, elapsed
+        seconds and points per second
+    """
+    # In-process local storage is not thread-safe, so it gets a single writer
+    if is_local_client(client):
+        parallel = 1
+
+    batches = queue.Queue(maxsize=queue_size or parallel * 2)
+    lock = threading.Lock()
+    failure = []
+    start = time.perf_counter()
+    stats = {"points": 0, "batches": 0, "retries": 0, "seconds": 0.0, "points_per_second": 0.0}
+    last_report = [start]
+
+    def update_stats(batch):
+        with lock:
+            now = time.perf_counter()
+            stats["points"] += len(batch)
+            stats["batches"] += 1
+            stats["seconds"] = now - start
+            stats["points_per_second"] = stats["points"] / stats["seconds"] if stats["seconds"] else 0.0
+            if progress and now - last_report[0] >= report_every:
+                last_report[0] = now
+                progress(dict(stats))
+
+    def count_retry():
+        with lock:
+            stats["retries"] += 1
+
+    def send(batch):
+        upsert_with_retry(client, collection_name, batch, wait=wait, max_retries=max_retries,
+                          retry_delay=retry_delay, on_retry=count_retry)
+
+    def worker():
+        while True:
+            batch = batches.get()
+            if batch is None:
+                return
+            # After a permanent failure, keep draining so the reader never blocks
+            if failure:
+                continue
+            try:
+                send(batch)
+                update_stats(batch)
+            except Exception as e:
+                failure.append(e)
+
+    workers = [threading.Thread(target=worker, daemon=True) for _ in range(parallel)]
+    for thread in workers:
+        thread.start()
+
+    try:
+        for batch in batched(points, batch_size):
+            if failure:
+                break
+            # Blocks while the queue is full, so the reader never runs ahead of the workers
+            batches.put(batch)
+    finally:
+        for _ in workers:
+            batches.put(None)
+        for thread in workers:
+            thread.join()
+
+    if failure:
+        raise failure[0]
+
+    stats["seconds"] = time.perf_counter() - start
+    stats["points_per_second"] = stats["points"] / stats["seconds"] if stats["seconds"] else 0.0
+    return stats
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Qdrant Tutorial Payload Indexes
+
+This module creates payload indexes for the fields used in search filters.
+Without an index, a filtered search checks the payload of every candidate
+point; with one, Qdrant can plan the search around the matching points.
+1. Index schemas can be declared per collection
+2. Or inferred from the filters a collection is searched with
+"""
+
+from qdrant_client.http import models
+
+from qdrant_connection import is_local_client
+
+
+def _schema_for_value(value):
+    """Pick the payload index type for a matched value."""
+    if isinstance(value, bool):
+        return models.PayloadSchemaType.BOOL
+    if isinstance(value, int):
+        return models.PayloadSchemaType.INTEGER
+    if isinstance(value, float):
+        return models.PayloadSchemaType.FLOAT
+    return models.PayloadSchemaType.KEYWORD
+
+
+def _schema_for_condition(condition):
+    """Pick the payload index type for a field condition."""
+    if condition.range is not None:
+        # Integer-valued bounds say nothing about the stored values (Range(gt=1)
+        # is a valid filter on a float field), and an integer index would leave
+        # float values unindexed. A float index serves ranges over both; a field
+        # also matched with integers gets an integer index (see infer_index_schema).
+        return models.PayloadSchemaType.FLOAT
+
+    match = condition.match
+    if isinstance(match, models.MatchValue):
+        return _schema_for_value(match.value)
+    if isinstance(match, (models.MatchAny, models.MatchExcept)):
+        values = match.any if isinstance(match, models.MatchAny) else match.except_
+        return _schema_for_value(values[0]) if values else models.PayloadSchemaType.KEYWORD
+    if isinstance(match, models.MatchText):
+        return models.PayloadSchemaType.TEXT
+    return None
+
+
+def infer_index_schema(*filters):
+    """
+    Infer the payload index schema from filter definitions.
+
+    Walks must, should and must_not clauses (including nested filters) and
+    maps each field condition to an index type: keyword for string matches,
+    integer for integer matches, float for ranges, text for full-text
+    matches. A field used both in ranges and in integer matches gets an
+    integer index, which serves both (a float index cannot serve the
+    matches). Declare the schema explicitly to override the inference.
+
+    Args:
+        *filters: models.Filter objects the collection is searched with
+
+    Returns:
+        Dictionary mapping field name to models.PayloadSchemaType
+    """
+    schema = {}
+
+    def visit(conditions):
+        for condition in conditions or []:
+            if isinstance(condition, models.Filter):
+                visit_filter(condition)
+            elif isinstance(condition, models.FieldCondition):
+                field_schema = _schema_for_condition(condition)
+                if field_schema is None:
+                    continue
+                # Integer matches need an integer index, which also serves the
+                # field's ranges; a float index would only serve the ranges
+                if schema.get(condition.key) == models.PayloadSchemaType.INTEGER and \
+                        field_schema == models.PayloadSchemaType.FLOAT:
+                    continue
+                schema[condition.key] = field_schema
+
+    def visit_filter(query_filter):
+        for clause in (query_filter.must, query_filter.should, query_filter.must_not):
+            visit(clause if isinstance(clause, list) else [clause] if clause else [])
+
+    for query_filter in filters:
+        if query_filter is not None:
+            visit_filter(query_filter)
+
+    return schema
+
+
+def create_payload_indexes(client, collection_name, schema, wait=True):
+    """
+    Create a payload index for every field in a schema.
+
+    Creating an index that already exists is a no-op on the server, so this
+    is safe to call on every run. Local mode has no payload indexes, so
+    nothing is created there.
+
+    Args:
+        client: QdrantClient connected to the server
+        collection_name: Name of the collection
+        schema: Dictionary mapping field name to models.PayloadSchemaType
+        wait: Whether to wait until each index is built
+    """
+    if is_local_client(client):
+        return
+
+    for field_name, field_schema in schema.items():
+        client.create_payload_index(
+            collection_name=collection_name,
+            field_name=field_name,
+            field_schema=field_schema,
+            wait=wait
+        )
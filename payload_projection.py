@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Qdrant Tutorial Payload Projection
+
+This module keeps search responses small:
+1. Payload selectors return only the fields a caller actually uses
+2. A short summary can be precomputed at ingest time, so result lists
+   don't need to fetch the full document text just to show a preview
+
+Set QDRANT_SUMMARY=0 to ingest without the summary field.
+"""
+
+import os
+
+from qdrant_client.http import models
+
+SUMMARY_FIELD = "summary"
+SUMMARY_LENGTH = 100
+
+
+def summary_enabled():
+    """Return True unless QDRANT_SUMMARY disables precomputed summaries."""
+    return os.environ.get("QDRANT_SUMMARY", "true").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def summarize(text, max_length=SUMMARY_LENGTH):
+    """
+    Shorten a text to at most max_length characters, cutting at a word boundary.
+
+    Returns:
+        The text itself if short enough, otherwise its prefix followed by "..."
+    """
+    text = " ".join(text.split())
+    if len(text) <= max_length:
+        return text
+    cut = text[:max_length].rsplit(" ", 1)[0] or text[:max_length]
+    return cut.rstrip(" ,.;:") + "..."
+
+
+def payload_selector(include=None, exclude=None):
+    """
+    Build the with_payload argument for search, scroll and retrieve calls.
+
+    Args:
+        include: Payload field names to return (all others are dropped)
+        exclude: Payload field names to drop (all others are returned)
+
+    Returns:
+        True for the full payload, or a models.PayloadSelector
+
+    Raises:
+        ValueError: If both include and exclude are given
+    """
+    if include and exclude:
+        raise ValueError("Pass either include or exclude payload fields, not both")
+    if include:
+        return models.PayloadSelectorInclude(include=list(include))
+    if exclude:
+        return models.PayloadSelectorExclude(exclude=list(exclude))
+    return True
+
+
+def result_summary(payload, text_field="content"):
+    """Return the precomputed summary of a payload, or summarize its text on the fly."""
+    if payload.get(SUMMARY_FIELD):
+        return payload[SUMMARY_FIELD]
+    return summarize(payload.get(text_field, ""))
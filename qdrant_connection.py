@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Qdrant Tutorial Connection Settings
+
+This module builds Qdrant clients for every script in the tutorial from one
+set of settings, read from environment variables:
+
+    QDRANT_HOST         Server host (default: localhost)
+    QDRANT_PORT         REST port (default: 6333)
+    QDRANT_GRPC_PORT    gRPC port (default: 6334)
+    QDRANT_PREFER_GRPC  Set to 1/true/yes to use gRPC instead of REST/JSON
+    QDRANT_API_KEY      API key used when a script does not pass its own
+    QDRANT_HTTPS        Set to 1/true/yes to connect over HTTPS
+    QDRANT_LOCATION     Run in-process without a server: ":memory:" or a
+                        directory path for on-disk local storage
+
+gRPC sends vectors as packed binary floats instead of JSON text, which
+makes upserts and searches of large vectors much cheaper to encode.
+
+In local mode (QDRANT_LOCATION) no server or network is needed, so the
+tutorial flows can run in CI and on offline laptops. API keys and transport
+settings are ignored in that mode.
+"""
+
+import os
+import threading
+
+from qdrant_client import AsyncQdrantClient, QdrantClient
+
+TRUE_VALUES = {"1", "true", "yes", "on"}
+
+# Local storage can only be opened by one client per process, and every
+# ":memory:" client is a separate database, so local clients are shared
+_local_clients = {}
+_local_async_clients = {}
+_local_clients_lock = threading.Lock()
+
+
+def _env_flag(name, default=False):
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in TRUE_VALUES
+
+
+def connection_settings(api_key=None, prefer_grpc=None):
+    """
+    Resolve the connection settings from the environment.
+
+    Args:
+        api_key: API key to use (None to fall back to QDRANT_API_KEY)
+        prefer_grpc: Force the transport (None to fall back to QDRANT_PREFER_GRPC)
+
+    Returns:
+        Dictionary of connection settings; "location" is set (and the
+        server settings are unused) in local mode
+    """
+    if prefer_grpc is None:
+        prefer_grpc = _env_flag("QDRANT_PREFER_GRPC")
+
+    return {
+        "location": os.environ.get("QDRANT_LOCATION") or None,
+        "host": os.environ.get("QDRANT_HOST", "localhost"),
+        "port": int(os.environ.get("QDRANT_PORT", 6333)),
+        "grpc_port": int(os.environ.get("QDRANT_GRPC_PORT", 6334)),
+        "prefer_grpc": prefer_grpc,
+        "api_key": api_key if api_key is not None else os.environ.get("QDRANT_API_KEY"),
+        "https": _env_flag("QDRANT_HTTPS")
+    }
+
+
+def _local_arguments(location):
+    """Keyword arguments selecting in-memory or on-disk local storage."""
+    if location == ":memory:":
+        return {"location": location}
+    return {"path": location}
+
+
+def _remote_arguments(settings):
+    """Keyword arguments for a client talking to a server."""
+    return {
+        "host": settings["host"],
+        "port": settings["port"],
+        "grpc_port": settings["grpc_port"],
+        "prefer_grpc": settings["prefer_grpc"],
+        "api_key": settings["api_key"],
+        "https": settings["https"]
+    }
+
+
+def is_local_mode():
+    """Return True if the scripts run against in-process local storage."""
+    return connection_settings()["location"] is not None
+
+
+def is_local_client(client):
+    """
+    Return True if a client runs in-process instead of talking to a server.
+
+    Local clients are not thread-safe, so helpers that write from several
+    threads fall back to a single writer for them.
+    """
+    from qdrant_client.local.qdrant_local import QdrantLocal
+
+    return isinstance(getattr(client, "_client", None), QdrantLocal)
+
+
+def create_client(api_key=None, prefer_grpc=None, **kwargs):
+    """
+    Create a QdrantClient from the shared connection settings.
+
+    In local mode the same client is returned for every call, since one
+    process can only open a local storage once.
+
+    Args:
+        api_key: API key to use (None to fall back to QDRANT_API_KEY)
+        prefer_grpc: Force the transport (None to fall back to QDRANT_PREFER_GRPC)
+        **kwargs: Extra keyword arguments passed to QdrantClient (e.g. timeout)
+
+    Returns:
+        A connected QdrantClient
+    """
+    settings = connection_settings(api_key=api_key, prefer_grpc=prefer_grpc)
+
+    if settings["location"]:
+        with _local_clients_lock:
+            client = _local_clients.get(settings["location"])
+            if client is None:
+                client = QdrantClient(**_local_arguments(settings["location"]))
+                _local_clients[settings["location"]] = client
+            return client
+
+    return QdrantClient(**_remote_arguments(settings), **kwargs)
+
+
+def create_async_client(api_key=None, prefer_grpc=None, **kwargs):
+    """
+    Create an AsyncQdrantClient from the shared connection settings.
+
+    In local mode the same async client is returned for every call, like
+    create_client. It is a separate in-process store, though: an async
+    client does not see the points of a synchronous ":memory:" client, and
+    a storage directory can only be opened by one of the two at a time.
+    """
+    settings = connection_settings(api_key=api_key, prefer_grpc=prefer_grpc)
+    if settings["location"]:
+        with _local_clients_lock:
+            client = _local_async_clients.get(settings["location"])
+            if client is None:
+                client = AsyncQdrantClient(**_local_arguments(settings["location"]))
+                _local_async_clients[settings["location"]] = client
+            return client
+    return AsyncQdrantClient(**_remote_arguments(settings), **kwargs)
+
+
+def describe_connection(api_key=None, prefer_grpc=None):
+    """Return a short human-readable description of the connection target."""
+    settings = connection_settings(api_key=api_key, prefer_grpc=prefer_grpc)
+    if settings["location"]:
+        return f"local storage {settings['location']}"
+    if settings["prefer_grpc"]:
+        return f"{settings['host']}:{settings['grpc_port']} (gRPC)"
+    return f"{settings['host']}:{settings['port']} (REST)"
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Qdrant Tutorial Quantization Settings
+
+This module holds the vector quantization settings shared by the tutorial
+collections, read from environment variables:
+
+    QDRANT_QUANTIZATION  "none" (default), "scalar" (int8) or "binary"
+    QDRANT_OVERSAMPLING  Candidates fetched per requested result before rescoring (default: 2.0)
+    QDRANT_RESCORE       Set to 0/false/no to skip rescoring with the original vectors
+
+Scalar int8 quantization stores each dimension in one byte instead of four
+(about 4x less RAM); binary quantization stores one bit per dimension. Searches
+run on the compact vectors, oversample, and rescore the candidates with the
+original float32 vectors to recover accuracy.
+"""
+
+import os
+
+from qdrant_client.http import models
+
+QUANTIZATION_MODES = ("none", "scalar", "binary")
+
+# Bytes needed to store one vector dimension in each mode
+BYTES_PER_DIMENSION = {
+    "none": 4,
+    "scalar": 1,
+    "binary": 1 / 8,
+}
+
+
+def quantization_mode():
+    """Return the quantization mode selected by QDRANT_QUANTIZATION."""
+    mode = os.environ.get("QDRANT_QUANTIZATION", "none").lower()
+    if mode not in QUANTIZATION_MODES:
+        raise ValueError(f"QDRANT_QUANTIZATION must be one of {', '.join(QUANTIZATION_MODES)}, got '{mode}'")
+    return mode
+
+
+def quantization_config(mode=None):
+    """
+    Build the quantization config for create_collection.
+
+    Args:
+        mode: "none", "scalar" or "binary" (None to read QDRANT_QUANTIZATION)
+
+    Returns:
+        A quantization config, or None for plain float32 vectors
+    """
+    mode = mode or quantization_mode()
+
+    if mode == "scalar":
+        return models.ScalarQuantization(
+            scalar=models.ScalarQuantizationConfig(
+                type=models.ScalarType.INT8,
+                quantile=0.99,  # Ignore outliers when choosing the int8 range
+                always_ram=True
+            )
+        )
+    if mode == "binary":
+        return models.BinaryQuantization(
+            binary=models.BinaryQuantizationConfig(always_ram=True)
+        )
+    return None
+
+
+def vector_params(vector_size, mode=None, distance=models.Distance.COSINE):
+    """
+    Build the vector params for create_collection.
+
+    With quantization enabled the original float32 vectors are kept on disk,
+    since only the quantized copies must stay in RAM.
+    """
+    mode = mode or quantization_mode()
+    return models.VectorParams(
+        size=vector_size,
+        distance=distance,
+        on_disk=mode != "none"
+    )
+
+
+def search_params(oversampling=None, rescore=None, hnsw_ef=None):
+    """
+    Build search params for quantized collections.
+
+    Args:
+        oversampling: Candidates per requested result (None to read QDRANT_OVERSAMPLING)
+        rescore: Rescore candidates with original vectors (None to read QDRANT_RESCORE)
+        hnsw_ef: Optional search-time HNSW beam size
+
+    Returns:
+        models.SearchParams, or None when quantization is off and no hnsw_ef is set
+    """
+    if quantization_mode() == "none" and oversampling is None and rescore is None:
+        return models.SearchParams(hnsw_ef=hnsw_ef) if hnsw_ef else None
+
+    if oversampling is None:
+        oversampling = float(os.environ.get("QDRANT_OVERSAMPLING", 2.0))
+    if rescore is None:
+        rescore = os.environ.get("QDRANT_RESCORE", "true").strip().lower() not in {"0", "false", "no", "off"}
+
+    return models.SearchParams(
+        hnsw_ef=hnsw_ef,
+        quantization=models.QuantizationSearchParams(
+            ignore=False,
+            rescore=rescore,
+            oversampling=oversampling
+        )
+    )
+
+
+def estimate_vector_memory(num_points, vector_size, mode):
+    """
+    Estimate the RAM needed for the searchable vectors in bytes.
+
+    With quantization only the compact vectors must stay in RAM; the
+    original float32 vectors used for rescoring can live on disk.
+    """
+    return int(num_points * vector_size * BYTES_PER_DIMENSION[mode])
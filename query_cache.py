@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Qdrant Tutorial Query Embedding Cache
+
+This module puts a cache in front of the embedding model so repeated search
+queries are only encoded once:
+1. A bounded in-memory LRU keyed by model name and normalized query text
+2. Optional persistence to a memory-mapped file for warm restarts
+3. Hit/miss counters for monitoring
+"""
+
+import json
+import os
+import threading
+import unicodedata
+from collections import OrderedDict
+
+import numpy as np
+
+
+def normalize_query(query):
+    """
+    Normalize query text so trivially different spellings share a cache entry.
+
+    Applies Unicode NFKC normalization, collapses whitespace and folds case.
+    Case folding matches uncased models such as all-MiniLM-L6-v2.
+    """
+    query = unicodedata.normalize("NFKC", query)
+    return " ".join(query.split()).casefold()
+
+
+class QueryEmbeddingCache:
+    """
+    LRU cache for query embeddings with optional on-disk persistence.
+
+    When `cache_path` is given, embeddings are also written to a memory-mapped
+    float32 matrix next to that path, with a JSON index mapping cache keys to
+    rows. Entries found on disk are served without re-encoding. Each vector
+    size gets its own file (`<cache_path>.<size>d`), so caches of differently
+    sized models can share a path without overwriting each other.
+    """
+
+    def __init__(self, model, model_name, max_size=1024, cache_path=None, disk_capacity=100000):
+        """
+        Create a query embedding cache.
+
+        Args:
+            model: A loaded SentenceTransformer model
+            model_name: Name identifying the vectors the model produces, used as
+                part of the cache key (see dimension_reduction.embedding_key)
+            max_size: Maximum number of embeddings kept in memory
+            cache_path: Path prefix of the memory-mapped file (None for memory only)
+            disk_capacity: Maximum number of embeddings stored on disk
+        """
+        self.model = model
+        self.model_name = model_name
+        self.max_size = max_size
+        self.cache_path = cache_path
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = None
+        self._disk_index = {}
+
+        if cache_path:
+            self._open_disk_cache(disk_capacity)
+
+    def _open_disk_cache(self, disk_capacity):
+        """Open (or create) the memory-mapped file and its key index."""
+        vector_size = self.model.get_sentence_embedding_dimension()
+        self.disk_path = f"{self.cache_path}.{vector_size}d"
+        index_path = f"{self.disk_path}.index.json"
+
+        if os.path.exists(self.disk_path) and os.path.exists(index_path):
+            with open(index_path, "r") as f:
+                index = json.load(f)
+            if index["vector_size"] == vector_size:
+                self._disk = np.memmap(
+                    self.disk_path,
+                    dtype=np.float32,
+                    mode="r+",
+                    shape=(index["capacity"], vector_size)
+                )
+                self._disk_index = index["keys"]
+                return
+
+        self._disk = np.memmap(
+            self.disk_path,
+            dtype=np.float32,
+            mode="w+",
+            shape=(disk_capacity, vector_size)
+        )
+        self._disk_index = {}
+
+    def _key(self, query):
+        return f"{self.model_name}\x00{normalize_query(query)}"
+
+    def encode(self, query):
+        """
+        Return the embedding for a query, encoding it only on a cache miss.
+
+        Args:
+            query: Query text
+
+        Returns:
+            The query embedding as a NumPy array
+        """
+        key = self._key(query)
+
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return vector
+
+            row = self._disk_index.get(key)
+            if row is not None:
+                vector = np.array(self._disk[row])
+                self._remember(key, vector)
+                self.hits += 1
+                return vector
+
+            self.misses += 1
+
+        vector = np.asarray(self.model.encode(query), dtype=np.float32)
+
+        with self._lock:
+            self._store(key, vector)
+
+        return vector
+
+    def encode_many(self, queries):
+        """
+        Return embeddings for several queries, encoding all misses in one model call.
+
+        Args:
+            queries: List of query texts
+
+        Returns:
+            A NumPy array with one embedding per query, in input order
+        """
+        keys = [self._key(query) for query in queries]
+        vectors = [None] * len(queries)
+        missing = []
+
+        with self._lock:
+            for i, key in enumerate(keys):
+                vector = self._entries.get(key)
+                if vector is None and key in self._disk_index:
+                    vector = np.array(self._disk[self._disk_index[key]])
+                    self._remember(key, vector)
+                if vector is not None:
+                    self._entries.move_to_end(key)
+                    vectors[i] = vector
+                    self.hits += 1
+                else:
+                    missing.append(i)
+            self.misses += len(missing)
+
+        if missing:
+            # Repeated queries within one call are encoded only once
+            unique = {}
+            for i in missing:
+                unique.setdefault(keys[i], queries[i])
+            encoded = np.asarray(self.model.encode(list(unique.values())), dtype=np.float32)
+            encoded = dict(zip(unique, encoded))
+            with self._lock:
+                for key, vector in encoded.items():
+                    self._store(key, vector)
+            for i in missing:
+                vectors[i] = encoded[keys[i]]
+
+        return np.stack(vectors) if vectors else np.empty((0, 0), dtype=np.float32)
+
+    def _store(self, key, vector):
+        """Remember a freshly encoded embedding in memory and, if enabled, on disk."""
+        self._remember(key, vector)
+        if self._disk is not None and key not in self._disk_index:
+            row = len(self._disk_index)
+            if row < self._disk.shape[0]:
+                self._disk[row] = vector
+                self._disk_index[key] = row
+
+    def _remember(self, key, vector):
+        """Insert an entry into the in-memory LRU, evicting the oldest one if full."""
+        self._entries[key] = vector
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def flush(self):
+        """Write the memory-mapped embeddings and their index to disk."""
+        if self._disk is None:
+            return
+
+        with self._lock:
+            self._disk.flush()
+            index = {
+                "vector_size": self._disk.shape[1],
+                "capacity": self._disk.shape[0],
+                "keys": self._disk_index
+            }
+            with open(f"{self.disk_path}.index.json", "w") as f:
+                json.dump(index, f)
+
+    def stats(self):
+        """Return hit/miss counters and the current cache sizes."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "memory_entries": len(self._entries),
+            "disk_entries": len(self._disk_index)
+        }
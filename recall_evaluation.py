@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Qdrant HNSW Recall Evaluation
+
+This script checks how many true nearest neighbors the approximate HNSW
+index returns, and what that costs:
+1. Exact top-k ground truth is computed with vectorized NumPy brute force
+2. Build-time parameters (m, ef_construct) and the search-time hnsw_ef are swept
+3. Recall@k is reported against search latency and estimated index memory
+
+By default the vectors of the `documents` collection from the semantic
+search tutorial are evaluated; a synthetic corpus can be used instead.
+The query generation, evaluation loop and command-line scaffolding are
+shared with the quantization and projection benchmarks.
+"""
+
+import argparse
+import itertools
+import json
+import time
+
+import numpy as np
+from qdrant_client.http import models
+
+from benchmark_suite import latency_summary
+from collection_status import INDEX_START_TIMEOUT, wait_until_indexed
+from benchmark_transport import random_vectors
+from hybrid_search import DENSE_VECTOR_NAME
+from parallel_upload import upload_points
+from qdrant_connection import create_client
+from scroll_points import scroll_points
+
+
+def normalize(vectors):
+    """Scale vectors to unit length, so dot product equals cosine similarity."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def exact_top_k(corpus, queries, k, chunk_size=1024):
+    """
+    Compute the exact cosine top-k for every query by brute force.
+
+    Args:
+        corpus: Array of shape (num_points, vector_size)
+        queries: Array of shape (num_queries, vector_size)
+        k: Number of neighbors per query
+        chunk_size: Number of queries scored at once, to bound memory use
+
+    Returns:
+        Array of shape (num_queries, k) with corpus row indices, best first
+    """
+    corpus = normalize(corpus)
+    queries = normalize(queries)
+    k = min(k, len(corpus))
+    neighbors = np.empty((len(queries), k), dtype=np.int64)
+
+    for start in range(0, len(queries), chunk_size):
+        scores = queries[start:start + chunk_size] @ corpus.T
+        # argpartition finds the top-k in linear time, then only those are sorted
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        order = np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1)
+        neighbors[start:start + chunk_size] = np.take_along_axis(top, order, axis=1)
+
+    return neighbors
+
+
+def recall_at_k(approximate, exact):
+    """Average fraction of the exact neighbors found by the approximate search."""
+    hits = [len(set(found) & set(truth)) / len(truth) for found, truth in zip(approximate, exact)]
+    return float(np.mean(hits))
+
+
+def estimate_index_memory(num_points, vector_size, m):
+    """
+    Estimate the memory of a float32 HNSW index in bytes.
+
+    Vectors take 4 bytes per dimension; the base layer of the graph stores up
+    to 2 * m links of 4 bytes per point (upper layers add comparatively little).
+    """
+    return num_points * (vector_size * 4 + 2 * m * 4)
+
+
+def load_collection_vectors(client, collection_name, page_size=256):
+    """Read every (default, dense) vector of a collection with a scroll."""
+    vectors = []
+    for record in scroll_points(client, collection_name, page_size=page_size, with_payload=False, with_vectors=True):
+        # Collections with named sparse vectors return a dict keyed by vector name
+        vector = record.vector
+        vectors.append(vector[DENSE_VECTOR_NAME] if isinstance(vector, dict) else vector)
+    return np.asarray(vectors, dtype=np.float32)
+
+
+def perturbed_queries(corpus, num_queries, rng, noise=0.05):
+    """
+    Generate queries by adding noise to random corpus vectors.
+
+    The queries land in populated regions of the space, as real queries do,
+    without being exact copies of a corpus vector.
+
+    Args:
+        corpus: Array of shape (num_points, vector_size)
+        num_queries: Number of queries
+        rng: NumPy random generator
+        noise: Standard deviation of the noise added to each unit vector
+
+    Returns:
+        Float32 array of shape (num_queries, vector_size) with unit-length rows
+    """
+    rows = rng.integers(0, len(corpus), size=num_queries)
+    queries = normalize(corpus[rows]) + rng.normal(0, noise, size=(num_queries, corpus.shape[1]))
+    return normalize(queries)
+
+
+def build_index(client, collection_name, corpus, m, ef_construct):
+    """(Re)create a collection with the given HNSW parameters and wait for the index."""
+    if client.collection_exists(collection_name=collection_name):
+        client.delete_collection(collection_name=collection_name)
+    client.create_collection(
+        collection_name=collection_name,
+        vectors_config=models.VectorParams(
+            size=corpus.shape[1],
+            distance=models.Distance.COSINE
+        ),
+        hnsw_config=models.HnswConfigDiff(
+            m=m,
+            ef_construct=ef_construct,
+            # Small corpora would otherwise be served by a full scan
+            full_scan_threshold=10
+        ),
+        # Build the HNSW index even for tiny collections
+        optimizers_config=models.OptimizersConfigDiff(indexing_threshold=1)
+    )
+    upload_points(
+        client,
+        collection_name,
+        (models.PointStruct(id=i, vector=vector.tolist()) for i, vector in enumerate(corpus)),
+        progress=None
+    )
+    wait_until_indexed(client, collection_name, start_timeout=INDEX_START_TIMEOUT)
+
+
+def evaluate(client, collection_name, queries, exact, search_params=None):
+    """
+    Run every query and measure recall against the exact neighbors and latency.
+
+    Args:
+        client: QdrantClient connected to the server
+        collection_name: Name of the collection whose point IDs are corpus rows
+        queries: Array of shape (num_queries, vector_size)
+        exact: Array of exact neighbors from exact_top_k; its width is k
+        search_params: Optional models.SearchParams sent with every query
+
+    Returns:
+        The latency summary (see benchmark_suite.latency_summary) with a "recall" key
+    """
+    k = exact.shape[1]
+    found = []
+    latencies = []
+    start = time.perf_counter()
+    for query in queries:
+        request_start = time.perf_counter()
+        results = client.search(
+            collection_name=collection_name,
+            query_vector=query.tolist(),
+            search_params=search_params,
+            limit=k
+        )
+        latencies.append((time.perf_counter() - request_start) * 1000)
+        found.append([result.id for result in results])
+    summary = latency_summary(latencies, time.perf_counter() - start)
+    summary["recall"] = recall_at_k(found, exact)
+    return summary
+
+
+def sweep(client, corpus, queries, k, m_values, ef_construct_values, hnsw_ef_values,
+          collection_name="recall_evaluation"):
+    """
+    Evaluate every combination of build-time and search-time parameters.
+
+    Returns:
+        List of result dictionaries, one per (m, ef_construct, hnsw_ef)
+    """
+    exact = exact_top_k(corpus, queries, k)
+    results = []
+
+    for m, ef_construct in itertools.product(m_values, ef_construct_values):
+        build_start = time.perf_counter()
+        build_index(client, collection_name, corpus, m, ef_construct)
+        build_seconds = time.perf_counter() - build_start
+
+        for hnsw_ef in hnsw_ef_values:
+            summary = evaluate(client, collection_name, queries, exact, models.SearchParams(hnsw_ef=hnsw_ef))
+            results.append({
+                "m": m,
+                "ef_construct": ef_construct,
+                "hnsw_ef": hnsw_ef,
+                "k": exact.shape[1],
+                "recall": summary["recall"],
+                "p50_ms": summary["p50_ms"],
+                "p99_ms": summary["p99_ms"],
+                "qps": summary["qps"],
+                "build_seconds": build_seconds,
+                "estimated_memory_bytes": estimate_index_memory(len(corpus), corpus.shape[1], m)
+            })
+
+    client.delete_collection(collection_name=collection_name)
+    return results
+
+
+def add_benchmark_arguments(parser, queries=100):
+    """
+    Add the corpus, query and output arguments shared by the recall benchmarks.
+
+    Args:
+        parser: argparse.ArgumentParser of the benchmark
+        queries: Default number of queries
+    """
+    parser.add_argument("--collection", default="documents", help="Collection whose vectors are used")
+    parser.add_argument("--synthetic-points", type=int, help="Use a synthetic corpus of this size instead")
+    parser.add_argument("--vector-size", type=int, default=384, help="Vector size of the synthetic corpus")
+    parser.add_argument("--queries", type=int, default=queries, help="Number of queries")
+    parser.add_argument("--k", type=int, default=10, help="Number of neighbors per query")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+
+
+def load_corpus(args, rng, client=None, synthetic=random_vectors):
+    """
+    Load the corpus selected by the arguments of add_benchmark_arguments.
+
+    Args:
+        args: Parsed arguments
+        rng: NumPy random generator used for a synthetic corpus
+        client: QdrantClient to read --collection with (None to create one)
+        synthetic: Function (count, vector_size, rng) generating a synthetic corpus
+
+    Returns:
+        Float32 array of shape (num_points, vector_size)
+    """
+    if args.synthetic_points:
+        corpus = synthetic(args.synthetic_points, args.vector_size, rng)
+        print(f"Corpus: {len(corpus)} synthetic {args.vector_size}-d vectors")
+    else:
+        corpus = load_collection_vectors(client or create_client(), args.collection)
+        print(f"Corpus: {len(corpus)} vectors from collection '{args.collection}'")
+    return corpus
+
+
+def write_results(results, output):
+    """Write benchmark results as JSON to a file, if one was given."""
+    if output:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure HNSW recall against exact NumPy search")
+    add_benchmark_arguments(parser)
+    parser.add_argument("--m", type=int, nargs="+", default=[8, 16, 32], help="HNSW m values")
+    parser.add_argument("--ef-construct", type=int, nargs="+", default=[64, 128, 256], help="HNSW ef_construct values")
+    parser.add_argument("--hnsw-ef", type=int, nargs="+", default=[16, 32, 64, 128, 256], help="Search-time hnsw_ef values")
+    args = parser.parse_args()
+
+    print("Qdrant HNSW Recall Evaluation")
+    print("=============================\n")
+
+    client = create_client()
+    rng = np.random.default_rng(args.seed)
+    corpus = load_corpus(args, rng, client=client)
+    queries = perturbed_queries(corpus, args.queries, rng)
+    print(f"Queries: {len(queries)}, k = {min(args.k, len(corpus))}\n")
+
+    results = sweep(client, corpus, queries, args.k, args.m, args.ef_construct, args.hnsw_ef)
+
+    print(f"{'m':>4} {'ef_construct':>12} {'hnsw_ef':>8} {'recall':>8} {'p50 ms':>8} {'p99 ms':>8} {'memory MB':>10}")
+    for result in results:
+        print(f"{result['m']:>4} {result['ef_construct']:>12} {result['hnsw_ef']:>8} "
+              f"{result['recall']:>8.4f} {result['p50_ms']:>8.2f} {result['p99_ms']:>8.2f} "
+              f"{result['estimated_memory_bytes'] / 1024 ** 2:>10.2f}")
+
+    write_results(results, args.output)
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Qdrant Tutorial Cross-Encoder Re-ranking
+
+This module re-orders search results with a cross-encoder, which reads the
+query and each document together and ranks far better than the bi-encoder
+vectors used for retrieval, at a higher cost per document:
+1. Searches over-fetch N candidates, which are re-scored and cut to the final top-k
+2. All uncached (query, document) pairs of a request go through one batched model call
+3. Scores are memoized in an LRU keyed by normalized query and point ID
+4. A latency budget skips re-ranking (keeping the retrieval order) when the
+   estimated model time would exceed it; every Nth skipped request is
+   re-ranked anyway to re-measure the model, so one slow call cannot turn
+   re-ranking off for good
+
+Settings, read from environment variables by reranker_from_env:
+
+    QDRANT_RERANK             Set to 1 to re-rank search results
+    QDRANT_RERANK_SCORER      "cross-encoder" (default) or "token-overlap", a
+                              dependency-free scorer for running offline
+    QDRANT_RERANK_MODEL       Cross-encoder model (default: cross-encoder/ms-marco-MiniLM-L-6-v2)
+    QDRANT_RERANK_CANDIDATES  Candidates fetched per query (default: 20)
+    QDRANT_RERANK_BUDGET_MS   Latency budget for the model call in ms (default: none)
+"""
+
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from embeddings import TOKEN_PATTERN
+from query_cache import normalize_query
+
+DEFAULT_RERANK_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+DEFAULT_CANDIDATES = 20
+RERANK_SCORERS = ("cross-encoder", "token-overlap")
+
+
+class TokenOverlapScorer:
+    """
+    Deterministic, dependency-free stand-in for a CrossEncoder model.
+
+    Scores each pair by the cosine overlap of its query and document word sets.
+    """
+
+    def predict(self, sentence_pairs, batch_size=32, show_progress_bar=False):
+        scores = []
+        for query, document in sentence_pairs:
+            query_tokens = set(TOKEN_PATTERN.findall(query.lower()))
+            document_tokens = set(TOKEN_PATTERN.findall(document.lower()))
+            overlap = len(query_tokens & document_tokens)
+            scores.append(overlap / math.sqrt(len(query_tokens) * len(document_tokens)) if overlap else 0.0)
+        return scores
+
+
+def load_cross_encoder(model_name=DEFAULT_RERANK_MODEL, scorer="cross-encoder"):
+    """
+    Load the scorer used for re-ranking.
+
+    Args:
+        model_name: Cross-encoder model name
+        scorer: "cross-encoder", or "token-overlap" for a TokenOverlapScorer
+
+    Raises:
+        ValueError: If the scorer is unknown
+    """
+    if scorer not in RERANK_SCORERS:
+        raise ValueError(f"Re-rank scorer must be one of {', '.join(RERANK_SCORERS)}, got '{scorer}'")
+    if scorer == "token-overlap":
+        return TokenOverlapScorer()
+
+    from sentence_transformers import CrossEncoder
+
+    return CrossEncoder(model_name)
+
+
+class Reranker:
+    """
+    Re-ranks over-fetched search results with a cross-encoder.
+
+    The model time per pair is tracked as an exponential moving average of
+    past calls, which is what the latency budget is checked against. The
+    first call (model load, CUDA or ONNX warm-up) is not counted.
+    """
+
+    def __init__(self, model, candidates=DEFAULT_CANDIDATES, latency_budget_ms=None, cache_size=10000,
+                 batch_size=32, probe_every=20):
+        """
+        Create a re-ranker.
+
+        Args:
+            model: A CrossEncoder (or anything with its `predict` method)
+            candidates: Number of candidates callers should fetch per query
+            latency_budget_ms: Skip re-ranking when the model call is expected
+                to take longer than this (None for no budget)
+            cache_size: Maximum number of (query, point ID) scores kept
+            batch_size: Pairs per cross-encoder forward pass
+            probe_every: Re-rank one request after this many consecutive
+                budget skips to re-measure the model (0 to never probe)
+        """
+        self.model = model
+        self.candidates = candidates
+        self.latency_budget_ms = latency_budget_ms
+        self.cache_size = cache_size
+        self.batch_size = batch_size
+        self.probe_every = probe_every
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+        self.probes = 0
+        self.ms_per_pair = None
+
+        self._warmed_up = False
+        self._skips_since_probe = 0
+
+        self._scores = OrderedDict()
+        self._lock = threading.Lock()
+
+    def estimated_ms(self, num_pairs):
+        """Expected model time for a number of uncached pairs (0 until a call has been timed)."""
+        return num_pairs * self.ms_per_pair if self.ms_per_pair is not None else 0.0
+
+    def _score(self, pairs, probe=False):
+        """
+        Score (query, text) pairs in one model call and update the per-pair time estimate.
+
+        A probe replaces the estimate instead of being averaged into it.
+        """
+        start = time.perf_counter()
+        scores = [float(score) for score in self.model.predict(pairs, batch_size=self.batch_size,
+                                                                show_progress_bar=False)]
+        ms_per_pair = (time.perf_counter() - start) * 1000 / len(pairs)
+        with self._lock:
+            if not self._warmed_up:
+                self._warmed_up = True
+            elif self.ms_per_pair is None or probe:
+                self.ms_per_pair = ms_per_pair
+            else:
+                self.ms_per_pair = 0.8 * self.ms_per_pair + 0.2 * ms_per_pair
+        return scores
+
+    def rerank_many(self, queries, candidate_lists, text_fn, top_k, budget_ms=None):
+        """
+        Re-rank the candidates of several queries with one model call.
+
+        Args:
+            queries: List of query texts
+            candidate_lists: One list of scored points per query, best first
+            text_fn: Function returning the document text of a scored point
+            top_k: Number of results kept per query
+            budget_ms: Latency budget for this call (None for the re-ranker's default)
+
+        Returns:
+            One list of at most top_k scored points per query, best first.
+            Re-ranked points carry the scorer's scores (e.g. cross-encoder
+            logits). When the latency budget skips re-ranking, the retrieval
+            order and scores (e.g. RRF or cosine) are kept, on a different
+            scale; the "skipped" counter of stats() tells the two apart.
+        """
+        budget_ms = self.latency_budget_ms if budget_ms is None else budget_ms
+        keys = [
+            [(normalize_query(query), point.id) for point in candidates]
+            for query, candidates in zip(queries, candidate_lists)
+        ]
+
+        with self._lock:
+            cached = {key: self._scores[key] for query_keys in keys for key in query_keys if key in self._scores}
+            for key in cached:
+                self._scores.move_to_end(key)
+
+        pending = {}
+        for query, candidates, query_keys in zip(queries, candidate_lists, keys):
+            for point, key in zip(candidates, query_keys):
+                if key not in cached and key not in pending:
+                    pending[key] = (query, text_fn(point))
+
+        probe = False
+        if pending and budget_ms is not None and self.estimated_ms(len(pending)) > budget_ms:
+            with self._lock:
+                self._skips_since_probe += 1
+                probe = bool(self.probe_every) and self._skips_since_probe >= self.probe_every
+                if probe:
+                    self._skips_since_probe = 0
+                    self.probes += 1
+                else:
+                    self.skipped += 1
+            if not probe:
+                return [list(candidates[:top_k]) for candidates in candidate_lists]
+
+        scores = dict(cached)
+        if pending:
+            scores.update(zip(pending, self._score(list(pending.values()), probe=probe)))
+
+        with self._lock:
+            self.hits += len(cached)
+            self.misses += len(pending)
+            for key in pending:
+                self._scores[key] = scores[key]
+                self._scores.move_to_end(key)
+            while len(self._scores) > self.cache_size:
+                self._scores.popitem(last=False)
+
+        return [
+            sorted(
+                (point.model_copy(update={"score": scores[key]}) for point, key in zip(candidates, query_keys)),
+                key=lambda point: point.score,
+                reverse=True
+            )[:top_k]
+            for candidates, query_keys in zip(candidate_lists, keys)
+        ]
+
+    def rerank(self, query, candidates, text_fn, top_k, budget_ms=None):
+        """Re-rank the candidates of one query (see rerank_many)."""
+        return self.rerank_many([query], [candidates], text_fn, top_k, budget_ms)[0]
+
+    def stats(self):
+        """Return score cache counters, skipped and probe calls, and the per-pair time estimate."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "skipped": self.skipped,
+            "probes": self.probes,
+            "ms_per_pair": self.ms_per_pair,
+            "cache_entries": len(self._scores)
+        }
+
+
+def reranker_from_env():
+    """
+    Create the re-ranker configured by environment variables.
+
+    Returns:
+        A Reranker, or None when QDRANT_RERANK is not enabled
+    """
+    if os.environ.get("QDRANT_RERANK", "").strip().lower() not in {"1", "true", "yes", "on"}:
+        return None
+    budget = os.environ.get("QDRANT_RERANK_BUDGET_MS")
+    return Reranker(
+        load_cross_encoder(
+            os.environ.get("QDRANT_RERANK_MODEL", DEFAULT_RERANK_MODEL),
+            scorer=os.environ.get("QDRANT_RERANK_SCORER", "cross-encoder").lower()
+        ),
+        candidates=int(os.environ.get("QDRANT_RERANK_CANDIDATES", DEFAULT_CANDIDATES)),
+        latency_budget_ms=float(budget) if budget else None
+    )
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Qdrant Tutorial Collection Scrolling
+
+This module walks every point of a collection with the scroll API:
+1. Pages are chained with the `next_page_offset` returned by each scroll call
+2. Only the requested payload fields, and vectors only if asked for, are fetched
+3. The next page is fetched on a background thread while the caller
+   processes the current one, so exports and re-index jobs are not
+   stalled by a network round-trip per page
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from qdrant_connection import is_local_client
+
+DEFAULT_PAGE_SIZE = 256
+
+
+def scroll_pages(client, collection_name, page_size=DEFAULT_PAGE_SIZE, with_payload=True,
+                 with_vectors=False, scroll_filter=None, prefetch=True):
+    """
+    Yield a collection page by page until the end.
+
+    Args:
+        client: QdrantClient connected to the server
+        collection_name: Name of the collection to walk
+        page_size: Number of points per scroll request
+        with_payload: True, False, or a list of payload field names to fetch
+        with_vectors: Whether to fetch vectors (True, False, or a list of vector names)
+        scroll_filter: Optional models.Filter restricting the points
+        prefetch: Whether to fetch the next page in the background.
+            Ignored for local mode clients, which are not thread-safe.
+
+    Yields:
+        Lists of records, in point ID order
+    """
+    def fetch(offset):
+        return client.scroll(
+            collection_name=collection_name,
+            scroll_filter=scroll_filter,
+            limit=page_size,
+            offset=offset,
+            with_payload=with_payload,
+            with_vectors=with_vectors
+        )
+
+    if not prefetch or is_local_client(client):
+        offset = None
+        while True:
+            records, offset = fetch(offset)
+            if records:
+                yield records
+            if offset is None:
+                return
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(fetch, None)
+        while future is not None:
+            records, offset = future.result()
+            # Start the next request before handing this page to the caller
+            future = executor.submit(fetch, offset) if offset is not None else None
+            if records:
+                yield records
+
+
+def scroll_points(client, collection_name, **kwargs):
+    """
+    Yield every point of a collection, one record at a time.
+
+    Takes the same keyword arguments as scroll_pages.
+    """
+    for records in scroll_pages(client, collection_name, **kwargs):
+        yield from records
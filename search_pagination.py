@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Qdrant Tutorial Search Pagination
+
+This module pages through scored search results with a keyset cursor
+instead of a bare offset:
+1. The cursor holds the last score returned and the IDs tied at that score,
+   so it stays the same small size however deep the page
+2. Each page excludes only those tied IDs and drops anything ranked above
+   the last score, so results are never repeated when points are inserted
+   between pages
+3. The keyset and a query fingerprint travel in an opaque, URL-safe cursor
+   string that a UI can hand back for the next page
+"""
+
+import base64
+import hashlib
+import json
+import zlib
+
+import numpy as np
+from qdrant_client.http import models
+
+DEFAULT_PAGE_SIZE = 10
+
+
+def query_fingerprint(query_vector):
+    """Short hash of a query vector, so a cursor cannot be replayed against another query."""
+    # Rounded, so float32 and float64 copies of the same embedding match
+    data = np.round(np.asarray(query_vector, dtype=np.float64), 5).tobytes()
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def encode_cursor(state):
+    """Serialize cursor state into a compact URL-safe string."""
+    data = zlib.compress(json.dumps(state, separators=(",", ":")).encode("utf-8"))
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor):
+    """
+    Deserialize a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        return json.loads(zlib.decompress(data))
+    except (ValueError, zlib.error) as e:
+        raise ValueError(f"Invalid pagination cursor: {e}") from e
+
+
+def search_page(client, collection_name, query_vector, limit=DEFAULT_PAGE_SIZE, cursor=None,
+                query_filter=None, score_threshold=None, search_params=None, with_payload=True, using=None):
+    """
+    Fetch one page of search results.
+
+    The cursor is a keyset: the last score returned and the IDs of the last
+    page returned with exactly that score (at most one page of IDs), plus the
+    number of results returned so far. Qdrant's score_threshold is a lower
+    bound for similarity scores (only worse results are dropped), so it
+    cannot make the server start below the last score: each page is located
+    with an offset to the first tied result, and the server still ranks the
+    results before it. The tied IDs are excluded and anything ranking above
+    the last score is dropped, so no result is ever shown twice.
+
+    Points inserted between pages above the last score shorten later pages
+    instead of reappearing; points deleted between pages can make later
+    pages skip results.
+
+    Args:
+        client: QdrantClient connected to the server
+        collection_name: Name of the collection to search
+        query_vector: Query embedding (the same one for every page)
+        limit: Number of results per page
+        cursor: Cursor returned with the previous page (None for the first page)
+        query_filter: Optional models.Filter (the same one for every page)
+        score_threshold: Optional minimum score (the same one for every page)
+        search_params: Optional models.SearchParams
+        with_payload: Payload selector
+        using: Name of the vector to search in collections with named vectors
+
+    Returns:
+        Tuple of (scored points, next cursor or None when there are no more results)
+
+    Raises:
+        ValueError: If the cursor is malformed or belongs to another query
+    """
+    # A plain list, so the client never normalizes the caller's array in place
+    query_vector = np.asarray(query_vector, dtype=np.float32).tolist()
+    fingerprint = query_fingerprint(query_vector)
+    position, last_score, ties = 0, None, []
+
+    if cursor is not None:
+        state = decode_cursor(cursor)
+        if state.get("query") != fingerprint:
+            raise ValueError("Pagination cursor belongs to a different query")
+        position, last_score, ties = state["position"], state["score"], state["ties"]
+
+    page_filter = query_filter
+    if ties:
+        page_filter = models.Filter(
+            must=[query_filter] if query_filter is not None else None,
+            must_not=[models.HasIdCondition(has_id=ties)]
+        )
+
+    found = client.search(
+        collection_name=collection_name,
+        query_vector=(using, query_vector) if using else query_vector,
+        query_filter=page_filter,
+        score_threshold=score_threshold,
+        search_params=search_params,
+        with_payload=with_payload,
+        # Skip the results ranked above the last score; the tied ones are filtered out
+        offset=position - len(ties),
+        limit=limit
+    )
+    results = found if last_score is None else [result for result in found if result.score <= last_score]
+
+    if len(found) < limit:
+        return results, None
+
+    if results:
+        # Only this page's ties: earlier results with the same score rank
+        # before them, so the offset already skips those
+        page_last_score = results[-1].score
+        page_ties = [result.id for result in results if result.score == page_last_score]
+    else:
+        page_last_score, page_ties = last_score, ties
+
+    next_cursor = encode_cursor({
+        "query": fingerprint,
+        # Dropped results count too: they were inserted above the keyset and
+        # shifted every later result down by one
+        "position": position + len(found),
+        "score": page_last_score,
+        "ties": page_ties
+    })
+    return results, next_cursor
@@ -3,7 +3,7 @@
 Test script to verify API key authentication with Qdrant
 """
 
-from qdrant_client import QdrantClient
+from client_pool import get_client
 from qdrant_client.http import models
 from qdrant_client.http.exceptions import UnexpectedResponse
 import sys
@@ -11,13 +11,8 @@ import sys
 def test_connection(api_key, key_name):
     print(f"\nTesting connection with {key_name}...")
     try:
-        # Create client with the API key
-        client = QdrantClient(
-            host="localhost",
-            port=6333,
-            api_key=api_key,
-            https=False  # Explicitly use HTTP instead of HTTPS
-        )
+        # Reuse the pooled client for this key instead of opening new connections
+        client = get_client(api_key=api_key)
         
         # Try to list collections (a read operation)
         try:
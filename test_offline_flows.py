@@ -0,0 +1,623 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the Qdrant tutorial
+
+These tests run the tutorial flows against qdrant-client's in-process local
+mode with the deterministic hashing embedder, so they need neither a Qdrant
+server nor a downloaded model. Each test also checks a latency budget.
+
+Run with:
+    python -m pytest -q test_offline_flows.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import grpc
+import numpy as np
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.http import models
+
+from batch_search import batch_search
+from bulk_delete import delete_by_filter
+from dimension_reduction import Projection, apply_projection, embedding_key, fit_pca, projection_path
+from embeddings import EMBEDDING_BACKENDS, HashingEmbedder, load_model, register_backend
+from hybrid_search import BM25Vectorizer, hybrid_batch_search, hybrid_search, hybrid_vectors, sparse_vectors_config
+from incremental_sync import ensure_collection, sync_collection
+from manage_api_keys import bulk_create_api_keys, create_session
+from ingest_pipeline import ingest, read_records, save_checkpoint
+from named_vectors import encode_named, named_vectors_config, weighted_search
+from parallel_upload import is_transient_error, upload_points
+from payload_indexes import infer_index_schema
+from payload_projection import payload_selector, summarize
+from query_cache import QueryEmbeddingCache
+from recall_evaluation import load_collection_vectors
+from reranking import Reranker, TokenOverlapScorer
+from scroll_points import scroll_points
+from search_pagination import decode_cursor, search_page
+from write_pipeline import WritePipeline, write_pipeline_from_env
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+OFFLINE_ENV = {
+    "QDRANT_LOCATION": ":memory:",
+    "QDRANT_EMBEDDER": "hashing",
+}
+
+# Wall-clock budget for one tutorial script, in seconds
+SCRIPT_BUDGET_SECONDS = 30
+
+# Budget for the p99 latency of one batch search against a local
+# collection of 1000 points, in milliseconds (local filtering is pure Python)
+SEARCH_P99_BUDGET_MS = 250
+
+
+def run_script(script, **extra_env):
+    """Run a tutorial script offline and return its output and duration."""
+    env = {**os.environ, **OFFLINE_ENV, **extra_env}
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, script],
+        cwd=REPO_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=SCRIPT_BUDGET_SECONDS * 4
+    )
+    elapsed = time.perf_counter() - start
+    assert completed.returncode == 0, completed.stderr
+    return completed.stdout, elapsed
+
+
+@pytest.fixture
+def client():
+    return QdrantClient(":memory:")
+
+
+@pytest.fixture
+def model():
+    return HashingEmbedder(vector_size=64)
+
+
+@pytest.mark.parametrize("script", [
+    "01_basic_operations.py",
+    "02_semantic_search.py",
+    "03_advanced_features.py",
+    "async_operations.py",
+])
+def test_tutorial_script_runs_offline(script):
+    stdout, elapsed = run_script(script)
+    assert "completed successfully" in stdout
+    assert elapsed < SCRIPT_BUDGET_SECONDS
+
+
+def test_incremental_mode_runs_offline():
+    stdout, _ = run_script("02_semantic_search.py", QDRANT_SYNC_MODE="incremental")
+    assert "Synced documents: 8 upserted" in stdout
+
+
+@pytest.mark.parametrize("mode", ["scalar", "binary"])
+def test_quantized_collections_run_offline(mode):
+    stdout, _ = run_script("02_semantic_search.py", QDRANT_QUANTIZATION=mode)
+    assert "completed successfully" in stdout
+
+
+def test_hashing_embedder_is_deterministic(model):
+    first = model.encode(["vector database", "machine learning"])
+    second = model.encode(["vector database", "machine learning"])
+    assert first.shape == (2, 64)
+    assert np.array_equal(first, second)
+    assert np.allclose(np.linalg.norm(first, axis=1), 1.0)
+    # Texts sharing words are closer than unrelated texts
+    query = model.encode("vector search")
+    assert query @ first[0] > query @ first[1]
+
+
+def test_embedding_backends_are_pluggable(monkeypatch):
+    monkeypatch.setitem(EMBEDDING_BACKENDS, "tiny", lambda model_name: HashingEmbedder(8))
+    monkeypatch.setenv("QDRANT_EMBEDDER", "tiny")
+    assert load_model().get_sentence_embedding_dimension() == 8
+
+    register_backend("Tiny", lambda model_name: HashingEmbedder(16))
+    assert load_model(backend="tiny").get_sentence_embedding_dimension() == 16
+    EMBEDDING_BACKENDS.pop("tiny")
+
+    with pytest.raises(ValueError):
+        load_model(backend="missing")
+
+
+def test_query_cache_counts_hits_and_misses(model):
+    cache = QueryEmbeddingCache(model, model_name="hashing", max_size=2)
+    cache.encode("What is Qdrant?")
+    cache.encode("  what is   QDRANT? ")
+    cache.encode_many(["a", "b", "a"])
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 4
+    assert cache.stats()["memory_entries"] == 2
+
+
+def test_query_cache_persists_to_disk(model, tmp_path):
+    cache_path = str(tmp_path / "queries.dat")
+    cache = QueryEmbeddingCache(model, model_name="hashing", cache_path=cache_path)
+    expected = cache.encode("persisted query")
+    cache.flush()
+
+    # A cache of differently sized vectors at the same path keeps its own file
+    QueryEmbeddingCache(HashingEmbedder(vector_size=128), model_name="small", cache_path=cache_path).flush()
+
+    warm = QueryEmbeddingCache(model, model_name="hashing", cache_path=cache_path)
+    assert np.allclose(warm.encode("persisted query"), expected)
+    assert warm.stats()["hits"] == 1
+
+
+def test_embedding_key_tells_backends_and_projections_apart(model):
+    keys = {
+        embedding_key("all-MiniLM-L6-v2", model, backend="hashing"),
+        embedding_key("all-MiniLM-L6-v2", model, backend="onnx"),
+        embedding_key("all-MiniLM-L6-v2", apply_projection(model, "docs", mode="truncate", dimension=64),
+                      backend="hashing"),
+    }
+    assert keys == {"hashing:all-MiniLM-L6-v2", "onnx:all-MiniLM-L6-v2", "hashing:all-MiniLM-L6-v2:truncate64"}
+
+
+def test_bulk_create_reports_failures_without_duplicate_creates():
+    requests_by_name = {}
+
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            name = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["name"]
+            requests_by_name[name] = requests_by_name.get(name, 0) + 1
+            status = {"busy": 503, "gateway": 504}.get(name, 200)
+            body = json.dumps({"id": name, "name": name, "key": "secret"}).encode()
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        results = bulk_create_api_keys(
+            [{"name": name} for name in ["ok", "busy", "gateway"]],
+            host=f"http://127.0.0.1:{server.server_port}",
+            workers=3,
+            session=create_session(pool_size=3, retries=1)
+        )
+    finally:
+        server.shutdown()
+
+    # Keys created before a failure are still returned
+    assert results[0]["id"] == "ok"
+    assert [("error" in result) for result in results] == [False, True, True]
+    # A 503 was not applied and is retried; a 504 may have been, so it is not
+    assert requests_by_name == {"ok": 1, "busy": 2, "gateway": 1}
+
+
+def test_incremental_sync_only_touches_changes(client, model):
+    ensure_collection(client, "docs", model.get_sentence_embedding_dimension())
+    records = [{"id": i, "text": f"document number {i}"} for i in range(20)]
+    text_fn = lambda record: record["text"]
+    payload_fn = lambda record: {"text": record["text"]}
+
+    stats = sync_collection(client, "docs", model, records, text_fn, payload_fn, batch_size=8)
+    assert stats == {"unchanged": 0, "upserted": 20, "deleted": 0}
+
+    records = records[:15]
+    records[0] = {"id": 0, "text": "changed document"}
+    stats = sync_collection(client, "docs", model, records, text_fn, payload_fn, delete_batch_size=2)
+    assert stats == {"unchanged": 14, "upserted": 1, "deleted": 5}
+    assert client.count("docs").count == 15
+
+
+def test_incremental_sync_normalizes_ids_and_tracks_the_embedding(client, model):
+    ensure_collection(client, "docs", model.get_sentence_embedding_dimension())
+    # String IDs, as read from CSV or JSON, match the integer IDs stored in the collection
+    records = [{"id": str(i), "text": f"document number {i}"} for i in range(1, 6)]
+    text_fn = lambda record: record["text"]
+    payload_fn = lambda record: {"text": record["text"]}
+
+    sync_collection(client, "docs", model, records, text_fn, payload_fn, embedding_key="hashing:a")
+    stats = sync_collection(client, "docs", model, records, text_fn, payload_fn, embedding_key="hashing:a")
+    assert stats == {"unchanged": 5, "upserted": 0, "deleted": 0}
+
+    # Another model, backend or projection re-embeds every record
+    stats = sync_collection(client, "docs", model, records, text_fn, payload_fn, embedding_key="hashing:b")
+    assert stats == {"unchanged": 0, "upserted": 5, "deleted": 0}
+
+    # Upper-case, unhyphenated UUIDs match the canonical form Qdrant returns
+    records = [{"id": "6F9619FF8B86D011B42D00C04FC964FF", "text": "a document with a UUID"}]
+    sync_collection(client, "docs", model, records, text_fn, payload_fn, embedding_key="hashing:b")
+    assert client.retrieve("docs", ["6f9619ff-8b86-d011-b42d-00c04fc964ff"])
+    stats = sync_collection(client, "docs", model, records, text_fn, payload_fn, embedding_key="hashing:b")
+    assert stats == {"unchanged": 1, "upserted": 0, "deleted": 0}
+
+
+def test_index_schema_is_inferred_from_filters():
+    article_filter = models.Filter(
+        must=[
+            models.FieldCondition(key="read_time", range=models.Range(lt=10)),
+            models.FieldCondition(key="popularity", range=models.Range(gt=0.8)),
+        ],
+        should=[
+            models.FieldCondition(key="author", match=models.MatchValue(value="Jane Smith")),
+            models.Filter(must=[models.FieldCondition(key="tags", match=models.MatchAny(any=["AI"]))]),
+        ]
+    )
+    # Integer range bounds may still filter float values, so ranges get float indexes
+    assert infer_index_schema(article_filter, None) == {
+        "read_time": models.PayloadSchemaType.FLOAT,
+        "popularity": models.PayloadSchemaType.FLOAT,
+        "author": models.PayloadSchemaType.KEYWORD,
+        "tags": models.PayloadSchemaType.KEYWORD,
+    }
+
+    # A field also matched with integers keeps an integer index, whichever filter comes first
+    exact_filter = models.Filter(must=[models.FieldCondition(key="read_time", match=models.MatchValue(value=5))])
+    assert infer_index_schema(article_filter, exact_filter)["read_time"] == models.PayloadSchemaType.INTEGER
+    assert infer_index_schema(exact_filter, article_filter)["read_time"] == models.PayloadSchemaType.INTEGER
+
+
+def test_transient_errors_include_grpc_status_codes():
+    class FailedCall(grpc.RpcError):
+        def __init__(self, code):
+            self._code = code
+
+        def code(self):
+            return self._code
+
+    assert is_transient_error(FailedCall(grpc.StatusCode.UNAVAILABLE))
+    assert is_transient_error(FailedCall(grpc.StatusCode.DEADLINE_EXCEEDED))
+    assert not is_transient_error(FailedCall(grpc.StatusCode.INVALID_ARGUMENT))
+
+
+def test_parallel_upload_and_batch_search_latency(client, model):
+    texts = [f"synthetic document {i} about topic {i % 7}" for i in range(1000)]
+    vectors = model.encode(texts)
+    client.create_collection(
+        collection_name="docs",
+        vectors_config=models.VectorParams(size=vectors.shape[1], distance=models.Distance.COSINE)
+    )
+    stats = upload_points(
+        client,
+        "docs",
+        (
+            models.PointStruct(id=i, vector=vector.tolist(), payload={"topic": i % 7})
+            for i, vector in enumerate(vectors)
+        ),
+        batch_size=128,
+        progress=None
+    )
+    assert stats["points"] == 1000
+    assert client.count("docs").count == 1000
+
+    topic_filter = models.Filter(
+        must=[models.FieldCondition(key="topic", match=models.MatchValue(value=3))]
+    )
+    queries = [
+        {"text": "document about topic 3"},
+        {"text": "document about topic 3", "filter": topic_filter, "limit": 5},
+    ]
+
+    latencies = []
+    for _ in range(20):
+        start = time.perf_counter()
+        results = batch_search(client, "docs", model, queries)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    assert [len(result) for result in results] == [3, 5]
+    assert all(point.payload["topic"] == 3 for point in results[1])
+    assert np.percentile(latencies, 99) < SEARCH_P99_BUDGET_MS
+
+
+def cursor_after(client, query_vector, pages):
+    """Cursor positioned after a number of 7-result pages."""
+    cursor = None
+    for _ in range(pages):
+        _, cursor = search_page(client, "docs", query_vector, limit=7, cursor=cursor)
+    return cursor
+
+
+def test_cursor_pagination_matches_one_deep_search(client, model):
+    vectors = model.encode([f"paged document {i}" for i in range(50)])
+    client.create_collection(
+        collection_name="docs",
+        vectors_config=models.VectorParams(size=vectors.shape[1], distance=models.Distance.COSINE)
+    )
+    client.upsert("docs", [models.PointStruct(id=i, vector=vector.tolist()) for i, vector in enumerate(vectors)])
+    query_vector = model.encode("paged document")
+
+    paged_ids = []
+    cursor = None
+    while True:
+        page, cursor = search_page(client, "docs", query_vector, limit=7, cursor=cursor)
+        paged_ids.extend(result.id for result in page)
+        if cursor is None:
+            break
+
+    expected = client.search("docs", query_vector=query_vector.tolist(), limit=50)
+    assert paged_ids == [result.id for result in expected]
+
+    # The cursor stays small however deep the page
+    _, first_cursor = search_page(client, "docs", query_vector, limit=7)
+    _, deep_cursor = search_page(client, "docs", query_vector, limit=7, cursor=cursor_after(client, query_vector, 6))
+    assert len(deep_cursor) <= len(first_cursor) + 8
+
+    # Points inserted above the keyset between pages are not shown twice or in the middle
+    page, cursor = search_page(client, "docs", query_vector, limit=7)
+    client.upsert("docs", [models.PointStruct(id=100 + i, vector=query_vector.tolist()) for i in range(3)])
+    rest = []
+    while cursor is not None:
+        page, cursor = search_page(client, "docs", query_vector, limit=7, cursor=cursor)
+        rest.extend(result.id for result in page)
+    assert rest == paged_ids[7:]
+
+    with pytest.raises(ValueError):
+        search_page(client, "docs", model.encode("another query"), cursor=search_page(client, "docs", query_vector)[1])
+
+
+def test_cursor_stays_one_page_of_ties_when_every_score_is_equal(client):
+    client.create_collection(
+        collection_name="docs",
+        vectors_config=models.VectorParams(size=4, distance=models.Distance.COSINE)
+    )
+    client.upsert("docs", [models.PointStruct(id=i, vector=[1.0, 0.0, 0.0, 0.0]) for i in range(40)])
+
+    paged_ids = []
+    cursor_sizes = []
+    cursor = None
+    while True:
+        page, cursor = search_page(client, "docs", [1.0, 0.0, 0.0, 0.0], limit=5, cursor=cursor)
+        paged_ids.extend(result.id for result in page)
+        if cursor is None:
+            break
+        cursor_sizes.append(len(decode_cursor(cursor)["ties"]))
+
+    assert sorted(paged_ids) == list(range(40))
+    assert max(cursor_sizes) == 5
+
+
+def test_scroll_points_walks_the_whole_collection(client):
+    client.create_collection(
+        collection_name="docs",
+        vectors_config=models.VectorParams(size=4, distance=models.Distance.COSINE)
+    )
+    client.upsert("docs", [
+        models.PointStruct(id=i, vector=[1.0, 0.0, 0.0, float(i)], payload={"title": f"doc {i}", "body": "x" * 100})
+        for i in range(300)
+    ])
+
+    records = list(scroll_points(client, "docs", page_size=64, with_payload=["title"]))
+    assert [record.id for record in records] == list(range(300))
+    assert records[0].payload == {"title": "doc 0"}
+    assert records[0].vector is None
+
+
+def test_payload_selector_returns_only_requested_fields(client):
+    client.create_collection(
+        collection_name="docs",
+        vectors_config=models.VectorParams(size=4, distance=models.Distance.COSINE)
+    )
+    content = "word " * 200
+    client.upsert("docs", [models.PointStruct(
+        id=1,
+        vector=[1.0, 0.0, 0.0, 0.0],
+        payload={"title": "Doc", "content": content, "summary": summarize(content)}
+    )])
+
+    [hot] = client.search("docs", [1.0, 0.0, 0.0, 0.0], with_payload=payload_selector(include=["title", "summary"]))
+    assert set(hot.payload) == {"title", "summary"}
+    assert len(hot.payload["summary"]) <= 103 and hot.payload["summary"].endswith("...")
+
+    [lean] = client.search("docs", [1.0, 0.0, 0.0, 0.0], with_payload=payload_selector(exclude=["content"]))
+    assert set(lean.payload) == {"title", "summary"}
+
+    with pytest.raises(ValueError):
+        payload_selector(include=["title"], exclude=["content"])
+
+
+def test_bulk_delete_removes_only_matching_points_in_batches(client):
+    client.create_collection("docs", vectors_config=models.VectorParams(size=4, distance=models.Distance.COSINE))
+    client.upsert("docs", [
+        models.PointStruct(id=i, vector=[1.0, float(i), 0.0, 0.0], payload={"author": "a" if i % 3 else "b"})
+        for i in range(300)
+    ])
+    reports = []
+
+    stats = delete_by_filter(
+        client,
+        "docs",
+        models.Filter(must=[models.FieldCondition(key="author", match=models.MatchValue(value="a"))]),
+        batch_size=64,
+        max_points_per_second=10000,
+        optimize=True,
+        report_every=0,
+        progress=reports.append
+    )
+
+    assert stats["total"] == stats["deleted"] == 200 and stats["batches"] == 4
+    assert reports[-1]["deleted"] == 200
+    # The rate limit holds over the whole job
+    assert stats["points_per_second"] <= 10000 * 1.05
+    assert client.count("docs").count == 100
+    assert {record.payload["author"] for record in scroll_points(client, "docs")} == {"b"}
+
+
+def test_write_pipeline_tracks_operations_until_flushed(client, monkeypatch):
+    client.create_collection("docs", vectors_config=models.VectorParams(size=4, distance=models.Distance.COSINE))
+    with WritePipeline(client, "docs", wait=False, ordering="strong") as writes:
+        writes.upsert([models.PointStruct(id=i, vector=[1.0, float(i), 0.0, 0.0]) for i in range(3)])
+        writes.update_vectors([models.PointVectors(id=0, vector=[0.0, 0.0, 1.0, 0.0])])
+        writes.set_payload({"seen": True}, [1])
+        writes.delete(models.PointIdsList(points=[2]))
+        assert [kind for kind, _ in writes.pending()] == ["upsert", "update_vectors", "set_payload", "delete"]
+
+        flushed = writes.flush()
+        assert len(flushed) == 4 and writes.pending() == []
+        assert writes.flush() == []
+
+    assert writes.stats()["writes"] == 4 and writes.stats()["flushes"] == 1
+    assert client.count("docs").count == 2
+    assert client.retrieve("docs", [1])[0].payload == {"seen": True}
+
+    monkeypatch.setenv("QDRANT_WRITE_MODE", "async")
+    monkeypatch.setenv("QDRANT_WRITE_ORDERING", "medium")
+    assert write_pipeline_from_env(client, "docs").ordering == models.WriteOrdering.MEDIUM
+    monkeypatch.setenv("QDRANT_WRITE_ORDERING", "eventual")
+    with pytest.raises(ValueError):
+        write_pipeline_from_env(client, "docs")
+
+
+def test_ingest_pipeline_resumes_from_checkpoint(client, model, tmp_path):
+    corpus = tmp_path / "corpus.jsonl"
+    corpus.write_text("".join(json.dumps({"id": i, "text": f"streamed document {i}"}) + "\n" for i in range(100)))
+    checkpoint = tmp_path / "corpus.checkpoint"
+    save_checkpoint(str(checkpoint), 40)
+    ensure_collection(client, "docs", model.get_sentence_embedding_dimension())
+
+    stats = ingest(
+        client,
+        "docs",
+        read_records(str(corpus)),
+        model,
+        text_fn=lambda record: record["text"],
+        payload_fn=lambda record: {"text": record["text"]},
+        batch_size=16,
+        checkpoint_path=str(checkpoint),
+        progress=None
+    )
+    assert stats["resumed_from"] == 40
+    assert stats["points"] == 60 and stats["rows"] == 100
+    assert client.count("docs").count == 60
+    assert client.retrieve("docs", [39]) == []
+    assert not checkpoint.exists()
+
+    # Only acknowledged writes may advance a checkpoint
+    with pytest.raises(ValueError):
+        ingest(client, "docs", [], model, text_fn=str, payload_fn=dict, checkpoint_path=str(checkpoint), wait=False)
+
+
+def test_ingest_pipeline_reads_csv(client, model, tmp_path):
+    corpus = tmp_path / "corpus.csv"
+    corpus.write_text("id,text\n" + "".join(f"{i},csv row {i}\n" for i in range(1, 31)))
+    ensure_collection(client, "docs", model.get_sentence_embedding_dimension())
+
+    ingest(client, "docs", read_records(str(corpus)), model, text_fn=lambda record: record["text"],
+           payload_fn=lambda record: {"text": record["text"]}, batch_size=8, progress=None)
+    assert client.count("docs").count == 30
+    assert client.retrieve("docs", [30])[0].payload == {"text": "csv row 30"}
+
+
+def test_pca_projection_is_saved_and_applied_to_queries(model, tmp_path, monkeypatch):
+    monkeypatch.setenv("QDRANT_PROJECTION_DIR", str(tmp_path))
+    with pytest.raises(FileNotFoundError):
+        apply_projection(model, "docs", mode="pca")
+
+    sample = model.encode([f"sample document {i} about topic {i % 5}" for i in range(200)])
+    fit_pca(sample, 16).save(projection_path("docs"))
+
+    projected = apply_projection(model, "docs", mode="pca")
+    assert projected.get_sentence_embedding_dimension() == 16
+    vector = projected.encode("a query about topic 3")
+    assert vector.shape == (16,) and np.isclose(np.linalg.norm(vector), 1.0)
+    assert np.allclose(vector, Projection.load(projection_path("docs")).apply(model.encode("a query about topic 3")))
+
+    truncated = apply_projection(model, "docs", mode="truncate", dimension=8)
+    assert truncated.encode(["one", "two"]).shape == (2, 8)
+
+    # A re-fitted PCA keys caches and content hashes differently, even at the same dimension
+    refitted = fit_pca(sample[::2], 16)
+    assert refitted.tag.startswith("pca16-") and refitted.tag != projected.projection.tag
+
+    fit_pca(sample[:, :32], 16).save(projection_path("docs"))
+    with pytest.raises(ValueError):
+        apply_projection(model, "docs", mode="pca")
+
+
+def test_hybrid_search_ranks_exact_keywords(client, model):
+    vectorizer = BM25Vectorizer()
+    texts = [f"generic document {i} about search engines" for i in range(30)] + ["Qdrant stores vectors"]
+    client.create_collection(
+        collection_name="docs",
+        vectors_config=models.VectorParams(size=model.get_sentence_embedding_dimension(), distance=models.Distance.COSINE),
+        sparse_vectors_config=sparse_vectors_config()
+    )
+    client.upsert("docs", [
+        models.PointStruct(id=i, vector=hybrid_vectors(vector, vectorizer.encode_document(text)), payload={"text": text})
+        for i, (text, vector) in enumerate(zip(texts, model.encode(texts)))
+    ])
+
+    query = "what is qdrant"
+    [top, *_] = hybrid_search(client, "docs", model.encode(query), vectorizer.encode_query(query), limit=3)
+    assert top.payload["text"] == "Qdrant stores vectors"
+
+    [[batch_top, *_], other] = hybrid_batch_search(client, "docs", model, vectorizer, [query, {"text": "document 7", "limit": 2}])
+    assert batch_top.id == top.id and len(other) == 2
+
+    # Plain dense reads keep working next to the named sparse vector
+    assert load_collection_vectors(client, "docs").shape == (31, model.get_sentence_embedding_dimension())
+
+
+def test_weighted_search_over_named_vectors(client, model):
+    articles = [
+        {"id": 1, "title": "Qdrant", "content": "A story about gardening and tomatoes"},
+        {"id": 2, "title": "Gardening notes", "content": "Qdrant is a vector search engine"},
+    ]
+    texts = [{"title": article["title"], "content": article["content"]} for article in articles]
+    ensure_collection(client, "articles", model.get_sentence_embedding_dimension(),
+                      vectors_config=named_vectors_config(["title", "content"], model.get_sentence_embedding_dimension()))
+    client.upsert("articles", [
+        models.PointStruct(id=article["id"], vector=vectors)
+        for article, vectors in zip(articles, encode_named(model, texts))
+    ])
+
+    # The ranking follows the weights, with no re-indexing in between
+    query_vector = model.encode("qdrant")
+    [title_top, _] = weighted_search(client, "articles", query_vector, {"title": 0.9, "content": 0.1})
+    [content_top, _] = weighted_search(client, "articles", query_vector, {"title": 0.1, "content": 0.9})
+    assert (title_top.id, content_top.id) == (1, 2)
+
+    # Incremental sync embeds dictionaries of texts into the same named vectors
+    stats = sync_collection(client, "articles", model, articles, text_fn=lambda article: texts[article["id"] - 1],
+                            payload_fn=lambda article: {"title": article["title"]})
+    assert stats["upserted"] == 2
+    with pytest.raises(ValueError):
+        weighted_search(client, "articles", query_vector, {"title": 0})
+
+
+def test_reranker_caches_scores_and_respects_latency_budget():
+    candidates = [
+        models.ScoredPoint(id=i, version=0, score=1.0 - i / 10, payload={"text": text})
+        for i, text in enumerate(["unrelated text", "vector search with qdrant", "qdrant"])
+    ]
+    reranker = Reranker(TokenOverlapScorer(), candidates=3)
+    text_fn = lambda point: point.payload["text"]
+
+    reranked = reranker.rerank("What is Qdrant?", candidates, text_fn, top_k=2)
+    assert [point.id for point in reranked] == [2, 1]
+    assert reranker.stats()["misses"] == 3
+    # The first (warm-up) call is not part of the time estimate
+    assert reranker.ms_per_pair is None
+
+    reranker.rerank("what is  qdrant?", candidates, text_fn, top_k=2)
+    assert reranker.stats()["hits"] == 3 and reranker.stats()["misses"] == 3
+
+    # New pairs that would exceed the budget keep the retrieval order
+    reranker.ms_per_pair = 50.0
+    skipped = reranker.rerank("another query", candidates, text_fn, top_k=2, budget_ms=10)
+    assert [point.id for point in skipped] == [0, 1]
+    assert reranker.stats()["skipped"] == 1
+
+    # Every probe_every-th skipped request is re-ranked to re-measure the model
+    reranker.probe_every = 2
+    probed = reranker.rerank("tell me about qdrant", candidates, text_fn, top_k=2, budget_ms=10)
+    assert [point.id for point in probed] == [2, 1]
+    assert reranker.stats()["probes"] == 1 and reranker.ms_per_pair < 50.0
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Qdrant Tutorial Write Pipeline
+
+This module sends point writes without waiting for each one to be applied,
+so high-rate writers only pay for synchronization where they need it:
+1. upsert, update_vectors, set_payload and delete are sent with wait=False
+   and the operation ID the server returns for each is recorded
+2. flush() is an explicit barrier: it returns once every write sent so far
+   has been applied, e.g. before reading the written points back
+3. The write ordering (weak, medium or strong) is applied to every write
+
+Settings, read from environment variables by write_pipeline_from_env:
+
+    QDRANT_WRITE_MODE      "sync" (default, every write waits) or "async"
+    QDRANT_WRITE_ORDERING  "weak" (default), "medium" or "strong"
+"""
+
+import os
+import threading
+import time
+
+from qdrant_client.http import models
+
+WRITE_MODES = ("sync", "async")
+WRITE_ORDERINGS = tuple(ordering.value for ordering in models.WriteOrdering)
+
+
+def write_mode():
+    """Return the write mode selected by QDRANT_WRITE_MODE."""
+    mode = os.environ.get("QDRANT_WRITE_MODE", "sync").lower()
+    if mode not in WRITE_MODES:
+        raise ValueError(f"QDRANT_WRITE_MODE must be one of {', '.join(WRITE_MODES)}, got '{mode}'")
+    return mode
+
+
+def write_ordering():
+    """Return the write ordering selected by QDRANT_WRITE_ORDERING."""
+    ordering = os.environ.get("QDRANT_WRITE_ORDERING", "weak").lower()
+    if ordering not in WRITE_ORDERINGS:
+        raise ValueError(f"QDRANT_WRITE_ORDERING must be one of {', '.join(WRITE_ORDERINGS)}, got '{ordering}'")
+    return ordering
+
+
+def write_barrier(client, collection_name, ordering=None):
+    """
+    Wait until every write sent to a collection so far has been applied.
+
+    Updates are applied in order per shard, so one write that reaches every
+    shard and waits for them makes a barrier. Deletes by ID are routed only
+    to the shards owning those IDs; a delete by filter is broadcast to all
+    shards (and their replicas), so a filter matching no point is used.
+
+    Args:
+        client: QdrantClient connected to the server
+        collection_name: Name of the collection
+        ordering: Optional models.WriteOrdering, the same as the writes it waits for
+    """
+    client.delete(
+        collection_name=collection_name,
+        points_selector=models.FilterSelector(
+            # An empty ID set matches nothing and is resolved without reading payloads
+            filter=models.Filter(must=[models.HasIdCondition(has_id=[])])
+        ),
+        wait=True,
+        ordering=ordering
+    )
+
+
+class WritePipeline:
+    """
+    Fire-and-forget writes to one collection with an explicit barrier.
+
+    flush() sends a write barrier (see write_barrier) that reaches every
+    shard; once it returns, every earlier write has been applied too. Can be
+    used as a context manager that flushes on exit.
+    """
+
+    def __init__(self, client, collection_name, wait=False, ordering="weak"):
+        """
+        Create a write pipeline.
+
+        Args:
+            client: QdrantClient connected to the server
+            collection_name: Name of the collection written to
+            wait: Whether every write waits to be applied (flush() is then a no-op)
+            ordering: Write ordering, "weak", "medium" or "strong"
+        """
+        self.client = client
+        self.collection_name = collection_name
+        self.wait = wait
+        self.ordering = models.WriteOrdering(ordering)
+        self.writes = 0
+        self.flushes = 0
+        self.flush_seconds = 0.0
+        self.last_operation_id = None
+
+        # (write kind, operation ID) of the writes sent since the last flush
+        self._pending = []
+        self._lock = threading.Lock()
+
+    def _record(self, kind, result):
+        with self._lock:
+            self.writes += 1
+            self.last_operation_id = result.operation_id
+            if not self.wait:
+                self._pending.append((kind, result.operation_id))
+        return result
+
+    def upsert(self, points):
+        """Insert or replace points."""
+        return self._record("upsert", self.client.upsert(
+            collection_name=self.collection_name, points=points, wait=self.wait, ordering=self.ordering
+        ))
+
+    def update_vectors(self, points):
+        """Replace vectors of existing points (models.PointVectors)."""
+        return self._record("update_vectors", self.client.update_vectors(
+            collection_name=self.collection_name, points=points, wait=self.wait, ordering=self.ordering
+        ))
+
+    def set_payload(self, payload, points):
+        """Set payload fields of the selected points, keeping their other fields."""
+        return self._record("set_payload", self.client.set_payload(
+            collection_name=self.collection_name, payload=payload, points=points, wait=self.wait,
+            ordering=self.ordering
+        ))
+
+    def delete(self, points_selector):
+        """Delete the selected points."""
+        return self._record("delete", self.client.delete(
+            collection_name=self.collection_name, points_selector=points_selector, wait=self.wait,
+            ordering=self.ordering
+        ))
+
+    def pending(self):
+        """Return the (write kind, operation ID) of every write not yet flushed."""
+        with self._lock:
+            return list(self._pending)
+
+    def flush(self):
+        """
+        Wait until every write sent so far has been applied.
+
+        Returns:
+            List of (write kind, operation ID) of the writes this flush covered
+        """
+        with self._lock:
+            flushed, self._pending = self._pending, []
+        if not flushed:
+            return flushed
+
+        start = time.perf_counter()
+        write_barrier(self.client, self.collection_name, ordering=self.ordering)
+        with self._lock:
+            self.flushes += 1
+            self.flush_seconds += time.perf_counter() - start
+        return flushed
+
+    def stats(self):
+        """Return write and flush counters and the last operation ID."""
+        with self._lock:
+            return {
+                "writes": self.writes,
+                "pending": len(self._pending),
+                "flushes": self.flushes,
+                "flush_seconds": self.flush_seconds,
+                "last_operation_id": self.last_operation_id
+            }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.flush()
+
+
+def write_pipeline_from_env(client, collection_name):
+    """Create a write pipeline configured by QDRANT_WRITE_MODE and QDRANT_WRITE_ORDERING."""
+    return WritePipeline(client, collection_name, wait=write_mode() == "sync", ordering=write_ordering())